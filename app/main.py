@@ -9,6 +9,8 @@ Features:
 - Set / Update preferences
 - Pause / Resume subscription
 - Unsubscribe
+- Search the archive of summarized articles
+- Preview a digest from stored summaries
 - Clean, simple, production-friendly UI
 
 This file replaces all multi-page Streamlit files.
@@ -24,13 +26,19 @@ ROOT_DIR = Path(__file__).resolve().parents[1]
 sys.path.append(str(ROOT_DIR))
 
 import streamlit as st
-from datetime import datetime
+import streamlit.components.v1 as components
+from datetime import datetime, time, timedelta
 from typing import List
 
+import pytz
+
 from backend.db.connection import get_session
 from backend.db import crud
 from backend.email.validators import is_valid_email
 
+TOPICS = ["Technology", "Business", "World", "Politics", "Sports"]
+SEARCH_PAGE_SIZE = 20
+
 # --------------------------------------------------
 # Page config
 # --------------------------------------------------
@@ -72,6 +80,8 @@ with st.sidebar:
             "Preferences",
             "Manage Subscription",
             "Unsubscribe",
+            "Search Archive",
+            "Preview Digest",
         ],
     )
 
@@ -108,13 +118,7 @@ elif menu == "Preferences":
 
     topics = st.multiselect(
         "Topics you are interested in",
-        [
-            "Technology",
-            "Business",
-            "World",
-            "Politics",
-            "Sports"
-        ],
+        TOPICS,
     )
 
     preferred_time = st.time_input(
@@ -201,6 +205,77 @@ elif menu == "Unsubscribe":
     )
 
 
+# --------------------------------------------------
+# SEARCH ARCHIVE
+# --------------------------------------------------
+elif menu == "Search Archive":
+    section("Search Archive", "Find past stories by title, summary or bullet points")
+
+    query = st.text_input("Search", placeholder="e.g. rbi repo rate")
+    topic = st.selectbox("Topic", ["All topics"] + TOPICS)
+
+    # Start from the first page whenever the search changes.
+    search_key = (query, topic)
+    if st.session_state.get("search_key") != search_key:
+        st.session_state.search_key = search_key
+        st.session_state.search_page = 0
+    page = st.session_state.search_page
+
+    if query.strip():
+        with get_session() as db:
+            rows = crud.search_articles(
+                db,
+                query,
+                limit=SEARCH_PAGE_SIZE + 1,
+                offset=page * SEARCH_PAGE_SIZE,
+                topic=None if topic == "All topics" else topic,
+            )
+        has_more = len(rows) > SEARCH_PAGE_SIZE
+
+        if not rows:
+            st.info("No matching articles.")
+        for row in rows[:SEARCH_PAGE_SIZE]:
+            published = row.published_at.strftime("%d %b %Y") if row.published_at else ""
+            st.markdown(f"#### [{row.title}]({row.url})")
+            st.caption(f"{row.source} · {row.topic} · {published}")
+            st.markdown(row.snippet or "")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            if page > 0 and st.button("← Previous", use_container_width=True):
+                st.session_state.search_page -= 1
+                st.rerun()
+        with col2:
+            if has_more and st.button("Next →", use_container_width=True):
+                st.session_state.search_page += 1
+                st.rerun()
+        st.caption(f"Page {page + 1}")
+
+
+# --------------------------------------------------
+# PREVIEW DIGEST
+# --------------------------------------------------
+elif menu == "Preview Digest":
+    section("Preview Digest", "See a digest built from already summarized articles")
+
+    from backend.digest.formatter import render_digest_html
+    from backend.news.store import preview_digest
+
+    topics = st.multiselect("Topics", TOPICS, default=TOPICS[:2])
+    day = st.date_input("Digest date", value=datetime.now(pytz.utc).date())
+
+    if st.button("Preview", use_container_width=True):
+        if not topics:
+            error("Choose at least one topic.")
+        else:
+            until = pytz.utc.localize(datetime.combine(day + timedelta(days=1), time.min))
+            digest = preview_digest(topics, until=min(until, datetime.now(pytz.utc)))
+            if not any(digest["sections"].values()):
+                st.info("No summarized articles stored for these topics on that day.")
+            else:
+                components.html(render_digest_html(digest), height=900, scrolling=True)
+
+
 # --------------------------------------------------
 # Footer
 # --------------------------------------------------
@@ -0,0 +1,197 @@
+"""
+backend/ai/budget.py
+--------------------
+
+Token-aware sizing of LLM input.
+
+- estimate_tokens(): cheap token estimate (LLM_CHARS_PER_TOKEN), no API call.
+- fit_to_budget(): shrink an article to LLM_INPUT_TOKENS_PER_ARTICLE by
+  keeping the lead paragraphs first, then the most informative remaining
+  sentences, in their original order.
+- RunTokenBudget: per-run input-token allowance (LLM_RUN_INPUT_TOKEN_BUDGET);
+  once spent, the pipeline stops making LLM calls and summarizes extractively.
+  Calls are reserved up front; follow-up calls (JSON re-asks) are charged
+  afterwards from their recorded usage.
+"""
+
+
+#----------------------------------------------------------------------
+# Imports
+#----------------------------------------------------------------------
+from __future__ import annotations
+
+import math
+import re
+import threading
+from collections import Counter
+from typing import Iterator, List, Optional, Tuple
+
+from backend.config import (
+    LLM_CHARS_PER_TOKEN,
+    LLM_INPUT_TOKENS_PER_ARTICLE,
+    LLM_RUN_INPUT_TOKEN_BUDGET,
+)
+from backend.ai.extractive import SENTENCE_SPLIT_REGEX, STOPWORDS
+from backend.utils.metrics import counter, gauge
+
+TOKENS_TRIMMED = counter("llm_input_tokens_trimmed_total", "Estimated article tokens dropped before LLM calls.")
+BUDGET_REFUSALS = counter("llm_budget_refusals_total", "LLM calls skipped because the run's token budget was spent.")
+BUDGET_REMAINING = gauge("llm_run_budget_remaining_tokens", "Input tokens left in the current run's budget.")
+
+LEAD_PARAGRAPHS = 2
+
+WORD_REGEX = re.compile(r"[A-Za-z][A-Za-z'-]+|\d[\d,.%]*")
+
+
+#----------------------------------------------------------------------
+# Estimation
+#----------------------------------------------------------------------
+def estimate_tokens(text: str) -> int:
+    """
+    Approximate token count of `text` for the configured model family.
+    """
+    return math.ceil(len(text or "") / LLM_CHARS_PER_TOKEN)
+
+
+#----------------------------------------------------------------------
+# Lead-first truncation
+#----------------------------------------------------------------------
+def _units(text: str) -> List[Tuple[int, int, str]]:
+    """
+    (paragraph index, sentence index, sentence) for every sentence.
+    """
+    units = []
+    paragraphs = [p.strip() for p in text.split("\n") if p.strip()]
+    for p, paragraph in enumerate(paragraphs):
+        for s, sentence in enumerate(SENTENCE_SPLIT_REGEX.split(paragraph)):
+            if sentence.strip():
+                units.append((p, s, sentence.strip()))
+    return units
+
+
+def _content_words(sentence: str) -> List[str]:
+    return [w for w in (m.lower() for m in WORD_REGEX.findall(sentence)) if w not in STOPWORDS]
+
+
+def _rank_by_information(sentences: List[str]) -> Iterator[int]:
+    """
+    Yield sentence indexes by information gain (lazily): each pick favours content
+    words that are central to the article (document frequency) and not yet
+    covered by earlier picks, plus numbers and names. Duplicates sink.
+    """
+    words = [set(_content_words(s)) for s in sentences]
+    doc_freq = Counter(w for ws in words for w in ws)
+    facts = [
+        sum(1 for w in ws if w[0].isdigit()) + sum(1 for w in s.split()[1:] if w[:1].isupper())
+        for s, ws in zip(sentences, words)
+    ]
+
+    covered: set = set()
+    remaining = set(range(len(sentences)))
+    while remaining:
+        def _gain(i: int) -> float:
+            new = words[i] - covered
+            if not new:
+                return 0.0
+            return sum(doc_freq[w] for w in new) / math.sqrt(len(words[i])) + 0.5 * facts[i]
+
+        best = max(remaining, key=lambda i: (_gain(i), -i))
+        yield best
+        covered |= words[best]
+        remaining.discard(best)
+
+
+def fit_to_budget(text: str, max_tokens: int = LLM_INPUT_TOKENS_PER_ARTICLE) -> str:
+    """
+    Return `text` reduced to about `max_tokens` tokens: lead paragraphs
+    first, then the highest-information sentences, in original order.
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    max_chars = int(max_tokens * LLM_CHARS_PER_TOKEN)
+    units = _units(text)
+    chosen, used = set(), 0
+
+    def _take(i: int) -> bool:
+        nonlocal used
+        cost = len(units[i][2]) + 1
+        if used + cost > max_chars:
+            return False
+        chosen.add(i)
+        used += cost
+        return True
+
+    lead = [i for i, unit in enumerate(units) if unit[0] < LEAD_PARAGRAPHS]
+    for i in lead:
+        if not _take(i):
+            break
+
+    rest = [i for i in range(len(units)) if units[i][0] >= LEAD_PARAGRAPHS]
+    for r in _rank_by_information([units[i][2] for i in rest]):
+        if used >= max_chars:
+            break
+        _take(rest[r])
+
+    paragraphs: List[List[str]] = []
+    last_paragraph = None
+    for i in sorted(chosen):
+        paragraph, _, sentence = units[i]
+        if paragraph != last_paragraph:
+            paragraphs.append([])
+            last_paragraph = paragraph
+        paragraphs[-1].append(sentence)
+
+    fitted = "\n".join(" ".join(sentences) for sentences in paragraphs)
+    TOKENS_TRIMMED.inc(estimate_tokens(text) - estimate_tokens(fitted))
+    return fitted
+
+
+def estimate_input_tokens(text: str, prompt: str = "") -> int:
+    """
+    Estimated input tokens of one summarization call for `text`.
+    """
+    return min(estimate_tokens(text), LLM_INPUT_TOKENS_PER_ARTICLE) + estimate_tokens(prompt)
+
+
+#----------------------------------------------------------------------
+# Per-run budget
+#----------------------------------------------------------------------
+class RunTokenBudget:
+    """
+    Thread-safe input-token allowance for one pipeline run.
+    limit <= 0 means unlimited.
+    """
+
+    def __init__(self, limit: Optional[int] = None):
+        self.limit = LLM_RUN_INPUT_TOKEN_BUDGET if limit is None else limit
+        self.spent = 0
+        self._lock = threading.Lock()
+        if self.limit > 0:
+            BUDGET_REMAINING.set(self.limit)
+
+    @property
+    def remaining(self) -> Optional[int]:
+        return None if self.limit <= 0 else max(0, self.limit - self.spent)
+
+    def reserve(self, tokens: int) -> bool:
+        """
+        Claim `tokens` for one LLM call; False when the budget cannot cover it.
+        """
+        with self._lock:
+            if self.limit > 0 and self.spent + tokens > self.limit:
+                BUDGET_REFUSALS.inc()
+                return False
+            self.spent += tokens
+            if self.limit > 0:
+                BUDGET_REMAINING.set(self.limit - self.spent)
+            return True
+
+    def charge(self, tokens: int) -> None:
+        """
+        Count tokens of a call that was already made (no reservation).
+        """
+        with self._lock:
+            self.spent += tokens
+            if self.limit > 0:
+                BUDGET_REMAINING.set(max(0, self.limit - self.spent))
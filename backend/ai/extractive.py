@@ -0,0 +1,188 @@
+"""
+backend/ai/extractive.py
+------------------------
+
+Local extractive summarization (no LLM): TF-IDF sentence vectors scored
+with TextRank (or centroid similarity) using NumPy matrix operations.
+
+Used for:
+- condense(): shrink an article to its top-k sentences before the LLM call
+  (LLM_PRESUMMARY_SENTENCES), cutting paid input tokens.
+- extractive_summary(): a full summary in the summarize_article() dict
+  shape, used when the LLM is unavailable, the run's token budget is spent
+  or the pipeline is behind schedule (see backend/utils/governor.py).
+
+NumPy is imported on first use. A typical article (30-80 sentences) is
+scored in well under a millisecond of matrix work.
+"""
+
+
+#----------------------------------------------------------------------
+# Imports
+#----------------------------------------------------------------------
+import re
+from typing import Dict, List
+
+from backend.config import LLM_PRESUMMARY_SENTENCES, SUMMARY_BULLETS_COUNT
+
+SENTENCE_SPLIT_REGEX = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'])|\s*\n\s*")
+WORD_REGEX = re.compile(r"[a-z0-9][a-z0-9'-]+")
+STOPWORDS = frozenset(
+    "a an and are as at be been but by for from has have he her his i in into is it its of on or "
+    "our said says she that the their them they this to was were which who will with would you".split()
+)
+MIN_SENTENCE_CHARS = 25
+MAX_BULLET_WORDS = 30
+
+TEXTRANK_DAMPING = 0.85
+TEXTRANK_MAX_ITERATIONS = 50
+TEXTRANK_TOLERANCE = 1e-6
+
+
+#----------------------------------------------------------------------
+# Sentences
+#----------------------------------------------------------------------
+def split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences, dropping fragments too short to stand alone.
+    """
+    sentences = (s.strip() for s in SENTENCE_SPLIT_REGEX.split(text or ""))
+    return [s for s in sentences if len(s) >= MIN_SENTENCE_CHARS]
+
+
+def _shorten(sentence: str, max_words: int = MAX_BULLET_WORDS) -> str:
+    words = sentence.split()
+    if len(words) <= max_words:
+        return sentence
+    return " ".join(words[:max_words]) + "…"
+
+
+#----------------------------------------------------------------------
+# Scoring (TF-IDF + TextRank / centroid)
+#----------------------------------------------------------------------
+def _tfidf(sentences: List[str]):
+    """
+    L2-normalized TF-IDF matrix (sentences x vocabulary), sublinear tf.
+    """
+    import numpy as np
+
+    vocabulary: Dict[str, int] = {}
+    rows, cols = [], []
+    for i, sentence in enumerate(sentences):
+        for word in WORD_REGEX.findall(sentence.lower()):
+            if word not in STOPWORDS:
+                rows.append(i)
+                cols.append(vocabulary.setdefault(word, len(vocabulary)))
+
+    counts = np.zeros((len(sentences), max(1, len(vocabulary))))
+    np.add.at(counts, (np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp)), 1.0)
+
+    tf = np.log1p(counts)
+    df = np.count_nonzero(counts, axis=0)
+    idf = np.log((1 + len(sentences)) / (1 + df)) + 1.0
+    matrix = tf * idf
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1.0, norms)
+
+
+def score_sentences(sentences: List[str], method: str = "textrank"):
+    """
+    Importance score per sentence (NumPy array).
+    - textrank: PageRank over the cosine-similarity graph of sentences
+    - centroid: cosine similarity to the article's mean TF-IDF vector
+    """
+    import numpy as np
+
+    n = len(sentences)
+    if n == 0:
+        return np.zeros(0)
+
+    vectors = _tfidf(sentences)
+
+    if method == "centroid":
+        centroid = vectors.mean(axis=0)
+        return vectors @ centroid / (np.linalg.norm(centroid) or 1.0)
+
+    similarity = vectors @ vectors.T
+    np.fill_diagonal(similarity, 0.0)
+    out_weight = similarity.sum(axis=1, keepdims=True)
+    # Rows without edges jump uniformly (dangling nodes).
+    transition = np.where(out_weight > 0, similarity / np.where(out_weight == 0, 1.0, out_weight), 1.0 / n)
+
+    scores = np.full(n, 1.0 / n)
+    for _ in range(TEXTRANK_MAX_ITERATIONS):
+        updated = (1 - TEXTRANK_DAMPING) / n + TEXTRANK_DAMPING * (transition.T @ scores)
+        converged = np.abs(updated - scores).sum() < TEXTRANK_TOLERANCE
+        scores = updated
+        if converged:
+            break
+    return scores
+
+
+def _top_indexes(sentences: List[str], k: int, method: str = "textrank") -> List[int]:
+    """
+    Indexes of the k most important sentences, ascending; the lead is always kept.
+    """
+    if len(sentences) <= k:
+        return list(range(len(sentences)))
+
+    scores = score_sentences(sentences, method)
+    ranked = [int(i) for i in scores.argsort()[::-1] if i != 0]
+    return sorted([0] + ranked[: max(0, k - 1)])
+
+
+def top_sentences(text: str, k: int, method: str = "textrank") -> List[str]:
+    """
+    The k most important sentences in document order. The lead sentence is
+    always kept (news leads carry the key facts).
+    """
+    sentences = split_sentences(text)
+    return [sentences[i] for i in _top_indexes(sentences, k, method)]
+
+
+#----------------------------------------------------------------------
+# Condense (pre-summarizer)
+#----------------------------------------------------------------------
+def condense(text: str, k: int = LLM_PRESUMMARY_SENTENCES) -> str:
+    """
+    Reduce an article to its top-k sentences before it is sent to the LLM.
+    Kept sentences stay in their paragraphs (one paragraph per line), so
+    fit_to_budget() can still favour the lead paragraphs.
+    k <= 0 (or a short article) returns the text unchanged.
+    """
+    if k <= 0:
+        return text
+
+    units = [
+        (p, sentence)
+        for p, paragraph in enumerate(line for line in (text or "").split("\n") if line.strip())
+        for sentence in split_sentences(paragraph)
+    ]
+    if len(units) <= k:
+        return text
+
+    paragraphs: Dict[int, List[str]] = {}
+    for i in _top_indexes([sentence for _, sentence in units], k):
+        paragraph, sentence = units[i]
+        paragraphs.setdefault(paragraph, []).append(sentence)
+    return "\n".join(" ".join(sentences) for sentences in paragraphs.values())
+
+
+#----------------------------------------------------------------------
+# Extractive summary
+#----------------------------------------------------------------------
+def extractive_summary(text: str, category: str = "General", bullet_count: int = SUMMARY_BULLETS_COUNT) -> Dict:
+    """
+    Summarize without an LLM: the lead sentence becomes the summary and the
+    highest-ranked other sentences (TextRank) the bullets, in document order.
+    Returns the summarize_article() dict shape.
+    """
+    chosen = top_sentences(text, bullet_count + 1) or [(text or "").strip()]
+
+    return {
+        "bullets": [_shorten(s) for s in chosen[1:1 + bullet_count]],
+        "summary": _shorten(chosen[0]),
+        "category": category,
+        "importance_score": 3,
+    }
@@ -0,0 +1,257 @@
+"""
+backend/ai/json_repair.py
+-------------------------
+
+Tolerant parsing of the LLM's JSON summary.
+
+- parse_llm_json(): locate the first JSON object in a response (prose and
+  ```json fences around it are ignored) and load it. If strict parsing fails
+  the object is repaired in one pass over the characters: missing and
+  trailing commas, single / curly quotes, unquoted keys and values, raw
+  newlines and stray quotes inside strings, Python literals, comments and
+  unclosed strings / brackets.
+- validate_summary(): check the object against SUMMARY_SCHEMA and coerce it
+  to the summarize_article() dict shape (importance_score -> int in 1-10).
+
+Both raise LlmOutputError; the summarizer then re-asks the model (up to
+LLM_JSON_REASKS times) with only the broken output (see REPAIR_PROMPT).
+"""
+
+
+#----------------------------------------------------------------------
+# Imports
+#----------------------------------------------------------------------
+import json
+import re
+from typing import Any, Dict, List, Tuple
+
+from backend.config import SUMMARY_BULLETS_COUNT
+
+SUMMARY_SCHEMA: Dict[str, type] = {
+    "bullets": list,
+    "summary": str,
+    "category": str,
+    "importance_score": int,
+}
+DEFAULT_IMPORTANCE = 3
+
+_QUOTES = {'"': '"', "'": "'", "“": "”", "”": "”"}
+# After a closing quote: a delimiter, the end, the next key, or a new line
+# starting another string.
+_VALUE_END = re.compile(r"\s*(?:[,:}\]]|$)|\s*[\"“][^\"\n”]*[\"”]\s*:|[^\S\n]*\n\s*[\"'“]")
+# Inside an array, the next string may follow after only whitespace.
+_ITEM_END = re.compile(_VALUE_END.pattern + r"|\s+[\"“]")
+# An unquoted value ends at a delimiter, a new line or the next quoted key.
+_BARE_VALUE = re.compile(r"(?:(?!\s*[\"“][^\"\n”]*[\"”]\s*:)[^,}\]\n])+")
+_BARE_KEY = re.compile(r"[^:{}\[\],\n\"]+(?=\s*:)")
+_LITERALS = {"true": "true", "false": "false", "null": "null", "none": "null"}
+_ESCAPES = set('"\\/bfnrtu')
+_INT = re.compile(r"-?\d+")
+
+
+class LlmOutputError(ValueError):
+    """
+    Raised when the LLM response cannot be parsed or does not fit the schema.
+    """
+
+
+#----------------------------------------------------------------------
+# Repair
+#----------------------------------------------------------------------
+def _read_string(text: str, i: int, in_array: bool = False) -> Tuple[str, int]:
+    """
+    Read a quoted string starting at text[i]; returns (JSON string, next index).
+    A quote only closes the string when a JSON delimiter follows it, so
+    unescaped quotes inside the text are kept.
+    """
+    close = _QUOTES[text[i]]
+    value_end = _ITEM_END if in_array else _VALUE_END
+    chars: List[str] = []
+    i += 1
+    while i < len(text):
+        c = text[i]
+        if c == "\\" and i + 1 < len(text):
+            nxt = text[i + 1]
+            chars.append(c + nxt if nxt in _ESCAPES else "\\\\" + nxt.replace('"', '\\"'))
+            i += 2
+            continue
+        if (c == close or (close == "”" and c == '"')) and value_end.match(text, i + 1):
+            return '"' + "".join(chars) + '"', i + 1
+        if c == '"':
+            chars.append('\\"')
+        elif c == "\n":
+            chars.append("\\n")
+        elif c == "\t":
+            chars.append("\\t")
+        elif c < " ":
+            chars.append(" ")
+        else:
+            chars.append(c)
+        i += 1
+    return '"' + "".join(chars) + '"', i
+
+
+def _bare_value(token: str) -> str:
+    token = token.strip()
+    literal = _LITERALS.get(token.lower())
+    if literal:
+        return literal
+    try:
+        number = float(token)
+        if number == number and abs(number) != float("inf"):
+            json.loads(token)
+            return token
+    except ValueError:
+        pass
+    return json.dumps(token)
+
+
+def repair_json(text: str, start: int = 0) -> str:
+    """
+    Single-pass repair of the JSON value that begins at text[start].
+    Reading stops when the top-level value closes; the rest is ignored.
+    """
+    out: List[str] = []
+    stack: List[str] = []
+    i, n = start, len(text)
+
+    def _separate() -> None:
+        # A new value right after a finished one: the comma is missing.
+        if out and out[-1] not in "{[,:":
+            out.append(",")
+
+    while i < n:
+        c = text[i]
+
+        if c in _QUOTES:
+            _separate()
+            token, i = _read_string(text, i, in_array=bool(stack) and stack[-1] == "[")
+            out.append(token)
+            continue
+
+        if c in "{[":
+            _separate()
+            stack.append(c)
+            out.append(c)
+        elif c in "}]":
+            if out and out[-1] == ",":
+                out.pop()
+            if out and out[-1] == ":":
+                out.append("null")
+            if stack:
+                out.append("}" if stack.pop() == "{" else "]")
+            if not stack:
+                break
+        elif c == ",":
+            if out and out[-1] not in "{[,:":
+                out.append(",")
+        elif c == ":":
+            out.append(":")
+        elif c == "/" and text.startswith("//", i):
+            newline = text.find("\n", i)
+            i = n if newline < 0 else newline
+            continue
+        elif c == "/" and text.startswith("/*", i):
+            end = text.find("*/", i + 2)
+            i = n if end < 0 else end + 2
+            continue
+        elif not c.isspace():
+            _separate()
+            expects_key = stack and stack[-1] == "{" and (out[-1] in "{," if out else True)
+            match = (_BARE_KEY if expects_key else _BARE_VALUE).match(text, i)
+            if not match:
+                i += 1
+                continue
+            out.append(json.dumps(match.group().strip()) if expects_key else _bare_value(match.group()))
+            i = match.end()
+            continue
+
+        i += 1
+
+    if out and out[-1] == ",":
+        out.pop()
+    if out and out[-1] == ":":
+        out.append("null")
+    while stack:
+        out.append("}" if stack.pop() == "{" else "]")
+
+    return "".join(out)
+
+
+#----------------------------------------------------------------------
+# Parse
+#----------------------------------------------------------------------
+def parse_llm_json(text: str) -> Tuple[Dict[str, Any], bool]:
+    """
+    Load the first JSON object in an LLM response.
+    Returns (object, repaired); raises LlmOutputError when nothing usable is found.
+    """
+    start = (text or "").find("{")
+    if start < 0:
+        raise LlmOutputError("No JSON object in response")
+
+    try:
+        data, _ = json.JSONDecoder().raw_decode(text, start)
+        if isinstance(data, dict):
+            return data, False
+    except ValueError:
+        pass
+
+    try:
+        data = json.loads(repair_json(text, start))
+    except ValueError as e:
+        raise LlmOutputError(f"Unrepairable JSON: {e}") from e
+    if not isinstance(data, dict):
+        raise LlmOutputError("Response JSON is not an object")
+    return data, True
+
+
+#----------------------------------------------------------------------
+# Schema
+#----------------------------------------------------------------------
+def _importance(value: Any) -> int:
+    if isinstance(value, bool):
+        return DEFAULT_IMPORTANCE
+    if isinstance(value, (int, float)):
+        score = round(value)
+    else:
+        match = _INT.search(str(value))
+        if not match:
+            return DEFAULT_IMPORTANCE
+        score = int(match.group())
+    return min(10, max(1, score))
+
+
+def _bullets(value: Any) -> List[str]:
+    if isinstance(value, str):
+        value = value.splitlines()
+    if not isinstance(value, list):
+        return []
+    bullets = (str(b).strip().lstrip("-•* ").strip() for b in value if b is not None)
+    return [b for b in bullets if b]
+
+
+def validate_summary(
+    data: Dict[str, Any],
+    category: str = "General",
+    bullet_count: int = SUMMARY_BULLETS_COUNT,
+) -> Dict[str, Any]:
+    """
+    Coerce a parsed response to SUMMARY_SCHEMA.
+    Raises LlmOutputError when it has neither a summary nor bullets.
+    """
+    bullets = _bullets(data.get("bullets"))[:bullet_count]
+    summary = data.get("summary")
+    summary = summary.strip() if isinstance(summary, str) else ""
+    if not summary and not bullets:
+        raise LlmOutputError(f"Response has no summary or bullets (keys: {sorted(data)})")
+
+    label = data.get("category")
+    label = label.strip() if isinstance(label, str) and label.strip() else category
+
+    return {
+        "bullets": bullets,
+        "summary": summary or bullets[0],
+        "category": label,
+        "importance_score": _importance(data.get("importance_score")),
+    }
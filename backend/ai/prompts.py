@@ -27,21 +27,21 @@ Task Output Structure
 ------------------------------------------
 Return strictly in a JSON format with the following structure:
 
-{
+{{
     "bullets": [
         "Fact-based key development",
         "Important supporting detail",
         "Why this event matters or what changes"
     ],
     "summary": "A one-line executive summary takaway from the article. (max 20 words)",
-    "category": "One word topic label like Politics, Technology, Sports, Business, World."
+    "category": "One word topic label like Politics, Technology, Sports, Business, World.",
     "importance_score": "1 - 10, where 1 is least important and 10 is most important."
-}
+}}
 
 ------------------------------------------
 Bullet Points Rule
 ------------------------------------------
-Each bullet point must:
+Write exactly {bullet_count} bullet points. Each bullet point must:
 - Be under 20 words.
 - Contain new information (no repetition).
 - Highlight impact, change or decision.
@@ -72,4 +72,32 @@ Article:
 \"\"\"
 {article}
 \"\"\"
+
+------------------------------------------
+Other Reports
+------------------------------------------
+Leads from other publishers covering the same story (may be empty).
+Use them only to add facts the article lacks; never contradict the article.
+
+{other_reports}
+"""
+
+
+#-------------------------------------------------------------------------
+# JSON Repair Prompt (re-ask when the summary JSON cannot be parsed)
+#-------------------------------------------------------------------------
+
+REPAIR_PROMPT = """
+The text below was meant to be a single JSON object with exactly these keys:
+"bullets" (list of {bullet_count} strings), "summary" (string),
+"category" (one word string) and "importance_score" (integer 1 - 10).
+
+Problem: {error}
+
+Return ONLY the corrected JSON object. No code fences, no explanation.
+Keep the original wording of the content.
+
+\"\"\"
+{output}
+\"\"\"
 """
\ No newline at end of file
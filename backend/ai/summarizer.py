@@ -5,53 +5,187 @@ backend/ai/summarizer.py
 Summarizes news articles using Gemini via Langchain.
 
 Responsibilities:
-- Take cleaned article text.
+- Take cleaned article text, condense it to its key sentences
+  (backend/ai/extractive.py) and size it to the token budget (backend/ai/budget.py);
+  prepare_article() does this step alone so callers can budget the real input.
 - Send structured prompt to Gemini.
-- Parse JSON output.
+- Parse JSON output tolerantly (backend/ai/json_repair.py); re-ask with
+  only the broken output when local repair fails (LLM_JSON_REASKS).
 - Return structured summary object.
+- Report per-call usage (tokens, cached tokens, latency) to an optional
+  on_usage callback, e.g. LlmUsageWriter.record (backend/db/writers.py).
+- Fall back to a local extractive summary when no API key is configured
+  or the call fails.
+
+LangChain and the Gemini client are imported and built lazily on the first
+call (get_llm()), so importing this module stays cheap.
 """
 
 
 #----------------------------------------------------------------------
 # Imports
 #----------------------------------------------------------------------
-import json
-from typing import Dict
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.prompts import PromptTemplate
+import time
+from functools import lru_cache
+from typing import Callable, Dict, Optional
 
 from backend.config import (
     GEMINI_MODEL,
     GEMINI_API_KEY,
+    LLM_JSON_REASKS,
+    LLM_MAX_OUTPUT_TOKENS,
     LLM_TEMPERATURE,
     SUMMARY_BULLETS_COUNT
 )
-from backend.ai.prompts import SUMMARY_PROMPT
+from backend.ai.budget import fit_to_budget
+from backend.ai.extractive import condense, extractive_summary
+from backend.ai.json_repair import LlmOutputError, parse_llm_json, validate_summary
+from backend.ai.prompts import REPAIR_PROMPT, SUMMARY_PROMPT
 from backend.utils.logger import get_logger
+from backend.utils.metrics import counter, histogram
 
 logger = get_logger(__name__)
 
-# Initialize LLM
-llm = ChatGoogleGenerativeAI(
-    model = GEMINI_MODEL,
-    api_key = GEMINI_API_KEY,
-    temperature = LLM_TEMPERATURE
+LLM_SECONDS = histogram("llm_request_seconds", "Latency of one LLM summarization call.", ["model"])
+LLM_INPUT_TOKENS = counter("llm_input_tokens_total", "Prompt tokens reported by the LLM.", ["model"])
+LLM_OUTPUT_TOKENS = counter("llm_output_tokens_total", "Completion tokens reported by the LLM.", ["model"])
+LLM_FAILURES = counter("llm_failures_total", "Summarizations that fell back to the extractive summary.", ["model"])
+LLM_CACHED_TOKENS = counter("llm_cached_input_tokens_total", "Prompt tokens served from the provider's cache.", ["model"])
+LLM_JSON_RESULTS = counter(
+    "llm_json_parse_total",
+    "LLM summary responses by parse result (clean, repaired, reasked, failed).",
+    ["model", "result"],
 )
 
-# Create Langchain PromptTemplate
-summary_prompt = PromptTemplate(
-    input_variables = ["text", "bullet_count"],
-    template = SUMMARY_PROMPT
-)
+
+#-----------------------------------------------------------------
+# Lazy LLM client / prompt
+#-----------------------------------------------------------------
+@lru_cache(maxsize=1)
+def get_llm():
+    """
+    Build the Gemini chat client on first use.
+    """
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    return ChatGoogleGenerativeAI(
+        model = GEMINI_MODEL,
+        api_key = GEMINI_API_KEY,
+        temperature = LLM_TEMPERATURE,
+        max_output_tokens = LLM_MAX_OUTPUT_TOKENS
+    )
+
+
+@lru_cache(maxsize=1)
+def get_summary_prompt():
+    """
+    Build the LangChain PromptTemplate on first use.
+    """
+    from langchain_core.prompts import PromptTemplate
+
+    return PromptTemplate(
+        input_variables = ["article", "bullet_count", "other_reports"],
+        template = SUMMARY_PROMPT
+    )
+
+
+#-----------------------------------------------------------------
+# LLM call / response parsing
+#-----------------------------------------------------------------
+UsageCallback = Callable[..., None]
+
+
+def _invoke(prompt: str, stage: str, on_usage: Optional[UsageCallback] = None, input_chars: int = 0) -> str:
+    """
+    One LLM call; records latency and token usage, returns the text content.
+    """
+    start = time.perf_counter()
+    response = get_llm().invoke(prompt)
+    latency = time.perf_counter() - start
+    LLM_SECONDS.observe(latency, model=GEMINI_MODEL)
+
+    usage = getattr(response, "usage_metadata", None) or {}
+    input_tokens = usage.get("input_tokens", 0)
+    output_tokens = usage.get("output_tokens", 0)
+    cached_tokens = (usage.get("input_token_details") or {}).get("cache_read", 0)
+    LLM_INPUT_TOKENS.inc(input_tokens, model=GEMINI_MODEL)
+    LLM_OUTPUT_TOKENS.inc(output_tokens, model=GEMINI_MODEL)
+    LLM_CACHED_TOKENS.inc(cached_tokens, model=GEMINI_MODEL)
+
+    if on_usage is not None:
+        try:
+            on_usage(
+                stage = stage,
+                model = GEMINI_MODEL,
+                input_tokens = input_tokens,
+                output_tokens = output_tokens,
+                cached_tokens = cached_tokens,
+                latency_seconds = latency,
+                input_chars = input_chars
+            )
+        except Exception as e:
+            logger.error(f"Failed to record LLM usage: {e}")
+
+    return response.content if isinstance(response.content, str) else str(response.content)
+
+
+def _parse(content: str, on_usage: Optional[UsageCallback] = None, topic: str = "General") -> Dict:
+    """
+    Parse and validate a summary response, re-asking the model to fix its
+    own output (without resending the article) when repair fails.
+    A response without a category gets the article's topic.
+    """
+    try:
+        data, repaired = parse_llm_json(content)
+        result = validate_summary(data, category=topic)
+        LLM_JSON_RESULTS.inc(model=GEMINI_MODEL, result="repaired" if repaired else "clean")
+        return result
+    except LlmOutputError as e:
+        error = e
+
+    for _ in range(LLM_JSON_REASKS):
+        logger.warning(f"Re-asking for valid summary JSON: {error}")
+        prompt = REPAIR_PROMPT.format(
+            bullet_count = SUMMARY_BULLETS_COUNT,
+            error = error,
+            output = content
+        )
+        content = _invoke(prompt, "reask", on_usage, len(prompt))
+        try:
+            data, _ = parse_llm_json(content)
+            result = validate_summary(data, category=topic)
+            LLM_JSON_RESULTS.inc(model=GEMINI_MODEL, result="reasked")
+            return result
+        except LlmOutputError as e:
+            error = e
+
+    LLM_JSON_RESULTS.inc(model=GEMINI_MODEL, result="failed")
+    raise error
 
 
 #-----------------------------------------------------------------
 # Summarize Article
 #-----------------------------------------------------------------
-def summarize_article(article: str) -> Dict:
+def prepare_article(article: str) -> str:
+    """
+    The article text the LLM receives: condensed to its key sentences, then
+    fitted to LLM_INPUT_TOKENS_PER_ARTICLE. Preparing twice is a no-op.
+    """
+    return fit_to_budget(condense(article))
+
+
+def summarize_article(
+    article: str,
+    on_usage: Optional[UsageCallback] = None,
+    other_reports: str = "",
+    topic: str = "General",
+) -> Dict:
     """
     Summarize an Article using Gemini AI.
-    Args: article (str): Cleaned article text to summarize.
+    Args: article (str): Cleaned article text to summarize (or prepare_article() output).
+          on_usage: called with the keyword usage fields of every LLM call.
+          other_reports: leads of other sources on the same story (story clusters).
+          topic: the article's feed topic, the category when the model gives none.
     Returns: Dict: Structured summary object.
         Structured summary: 
         {
@@ -61,29 +195,20 @@ def summarize_article(article: str) -> Dict:
             "importance_score": int
         }
     """
+    if not GEMINI_API_KEY:
+        return extractive_summary(article, category=topic)
 
     try:
-        text = text[:MAX_ARTICLES_TEXT_CHARS]
-        prompt = summary_prompt.format(
-            text = text,
-            bullet_count = SUMMARY_BULLETS_COUNT
+        text = prepare_article(article)
+        prompt = get_summary_prompt().format(
+            article = text,
+            bullet_count = SUMMARY_BULLETS_COUNT,
+            other_reports = other_reports or "(none)"
         )
-        response = llm.invoke(prompt)
-        content = response.content.strip()
-
-        if content.startswith("```"):
-            content = content.split("```")[1]
-        
-        parsed = json.loads(content)
-
-        return parsed
+        return _parse(_invoke(prompt, "summarize", on_usage, len(text)), on_usage, topic)
 
     except Exception as e:
+        LLM_FAILURES.inc(model=GEMINI_MODEL)
         logger.error(f"Failed to summarize article: {e}")
-        return {
-            "bullets": [],
-            "summary": "Summary unavailable.",
-            "category": "General",
-            "importance_score": 3
-        }
+        return extractive_summary(article, category=topic)
 
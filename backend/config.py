@@ -9,10 +9,19 @@ This module is the single source of truth for:
 - Database connection URL
 - Newsletter topics and default sources
 - News fetch limits
+- HTTP client settings (connection pool, body size cap)
+- Source health settings (adaptive timeouts, circuit breaker)
 - Gemini API settings (LLM layer)
 - Email settings (simple SMTP: email + password)
 - Security settings (token signing)
+- Pipeline and degradation settings
+- Retention settings (email log rollup/archive)
 - Logging settings
+- Metrics settings
+- Profiling settings
+
+Importing this module has no filesystem side effects; directories are
+created on first use (see ensure_log_dir() and backend/db/connection.py).
 
 """
 
@@ -55,13 +64,22 @@ DEFAULT_PREFFERED_TIME = os.getenv("DEFAULT_PREFFERED_TIME", "08:00")
 # DATABASE_URL: str = os.getenv("DATABASE_URL", f"sqlite:///{PROJECT_ROOT / 'data' / 'app.db'}")
 
 DB_PATH = PROJECT_ROOT / "data" / "app.db"
-DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
 DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{DB_PATH.as_posix()}")
 
-if DATABASE_URL.startswith("sqllite"):
-    (PROJECT_ROOT / 'data').mkdir(parents=True, exist_ok=True)
+# Connection pool (PostgreSQL). With PgBouncer in transaction mode the
+# bouncer does the pooling, so the app opens one client connection per
+# checkout (NullPool). DB_PGBOUNCER: auto | true | false
+# (auto = Supabase pooler port 6543 or a *.pooler.supabase.com host).
+DB_PGBOUNCER: str = os.getenv("DB_PGBOUNCER", "auto").lower()
+DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "5"))
+DB_POOL_RECYCLE_SECONDS: int = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+DB_POOL_TIMEOUT_SECONDS: int = int(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "false").lower() == "true"
 
+# SQLite: WAL lets the Streamlit app write while the pipeline reads.
+DB_SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("DB_SQLITE_BUSY_TIMEOUT_MS", "5000"))
 
 
 #------------------------------------------------------------------------
@@ -74,6 +92,27 @@ GEMINI_MODEL: str = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
 LLM_TEMPERATURE: float = float(os.getenv("LLM_TEMPERATURE", "0.3"))
 LLM_MAX_OUTPUT_TOKENS: int = int(os.getenv("LLM_MAX_OUTPUT_TOKENS", "512"))
 
+# cost accounting (llm_usage table, jobs/llm_usage.py): USD per million tokens
+LLM_INPUT_COST_PER_MTOK: float = float(os.getenv("LLM_INPUT_COST_PER_MTOK", "0.30"))
+LLM_OUTPUT_COST_PER_MTOK: float = float(os.getenv("LLM_OUTPUT_COST_PER_MTOK", "2.50"))
+LLM_CACHED_INPUT_COST_PER_MTOK: float = float(os.getenv("LLM_CACHED_INPUT_COST_PER_MTOK", "0.075"))
+
+# input token budgeting (backend/ai/budget.py)
+# - LLM_INPUT_TOKENS_PER_ARTICLE: article tokens sent per summary (lead + most informative sentences)
+# - LLM_RUN_INPUT_TOKEN_BUDGET: input tokens per pipeline run, then extractive summaries (0 = unlimited)
+# - LLM_CHARS_PER_TOKEN: token estimate for English news text
+LLM_INPUT_TOKENS_PER_ARTICLE: int = int(os.getenv("LLM_INPUT_TOKENS_PER_ARTICLE", "1200"))
+LLM_RUN_INPUT_TOKEN_BUDGET: int = int(os.getenv("LLM_RUN_INPUT_TOKEN_BUDGET", "0"))
+LLM_CHARS_PER_TOKEN: float = float(os.getenv("LLM_CHARS_PER_TOKEN", "4.0"))
+
+# local pre-summarizer (backend/ai/extractive.py): top-k TextRank sentences
+# sent to the LLM instead of the whole article (0 = disabled)
+LLM_PRESUMMARY_SENTENCES: int = int(os.getenv("LLM_PRESUMMARY_SENTENCES", "12"))
+
+# targeted re-asks (output only, not the article) when the summary JSON
+# cannot be repaired locally (backend/ai/json_repair.py)
+LLM_JSON_REASKS: int = int(os.getenv("LLM_JSON_REASKS", "1"))
+
 # digest and summary preferences
 SUMMARY_BULLETS_COUNT: int = int(os.getenv("SUMMARY_BULLETS_COUNT", "3"))
 DIGEST_MAX_ARTCLES_PER_TOPIC: int = int(os.getenv("DIGEST_MAX_ARTCLES_PER_TOPIC", "5"))
@@ -128,16 +167,185 @@ DEFAULT_SOURCES: List[str] = [
 #------------------------------------------------------------------------
 
 MAX_ARTICLES_PER_SOURCE: int = int(os.getenv("MAX_ARTICLES_PER_SOURCE", "5"))
+# Safety cap on extracted text held in memory / checkpoints; LLM input is
+# sized separately by LLM_INPUT_TOKENS_PER_ARTICLE.
 MAX_ARTICLES_TEXT_CHARS: int = int(os.getenv("MAX_ARTICLES_TEXT_CHARS", "12000"))
 
 
+#------------------------------------------------------------------------
+# Article Store Settings (backend/news/store.py, jobs/ingester.py)
+# - ARTICLE_STORE: build digests from the ingested article store when fresh
+#   (opt-in; turn on once jobs/ingester.py is running)
+# - ARTICLE_STORE_WINDOW_HOURS: articles published within this window go into digests
+# - ARTICLE_STORE_MAX_STALENESS_MINUTES: a topic falls back to live fetching
+#   when the ingester has not polled it for this long
+# - INGEST_INTERVAL_SECONDS: pause between ingester polls
+# - INGEST_BATCH_SIZE: new articles extracted + summarized per poll
+#------------------------------------------------------------------------
+
+ARTICLE_STORE: bool = os.getenv("ARTICLE_STORE", "false").lower() == "true"
+ARTICLE_STORE_WINDOW_HOURS: int = int(os.getenv("ARTICLE_STORE_WINDOW_HOURS", "24"))
+ARTICLE_STORE_MAX_STALENESS_MINUTES: int = int(os.getenv("ARTICLE_STORE_MAX_STALENESS_MINUTES", "120"))
+INGEST_INTERVAL_SECONDS: int = int(os.getenv("INGEST_INTERVAL_SECONDS", "600"))
+INGEST_BATCH_SIZE: int = int(os.getenv("INGEST_BATCH_SIZE", "50"))
+
+
+#------------------------------------------------------------------------
+# Feed Poll Scheduler Settings (backend/news/scheduler.py, jobs/ingester.py)
+# - FEED_ADAPTIVE_POLLING: poll each feed on its own learned interval
+#   (opt-in; default: every feed every INGEST_INTERVAL_SECONDS)
+# - FEED_POLL_MIN_SECONDS / FEED_POLL_MAX_SECONDS: bounds of a feed's interval
+# - FEED_POLL_ITEMS_PER_POLL: new entries a poll should find on average
+#   (interval = publish gap x this)
+# - FEED_POLL_JITTER: +/- fraction of random jitter added to each interval
+# - FEED_POLL_BACKOFF: interval multiplier after a poll with nothing new
+#   or a failed fetch
+# - FEED_CADENCE_SMOOTHING: weight of the latest publish-gap observation
+#   in the moving average (0-1)
+#------------------------------------------------------------------------
+
+FEED_ADAPTIVE_POLLING: bool = os.getenv("FEED_ADAPTIVE_POLLING", "false").lower() == "true"
+FEED_POLL_MIN_SECONDS: int = int(os.getenv("FEED_POLL_MIN_SECONDS", "180"))
+FEED_POLL_MAX_SECONDS: int = int(os.getenv("FEED_POLL_MAX_SECONDS", "3600"))
+FEED_POLL_ITEMS_PER_POLL: float = float(os.getenv("FEED_POLL_ITEMS_PER_POLL", "2"))
+FEED_POLL_JITTER: float = float(os.getenv("FEED_POLL_JITTER", "0.15"))
+FEED_POLL_BACKOFF: float = float(os.getenv("FEED_POLL_BACKOFF", "1.5"))
+FEED_CADENCE_SMOOTHING: float = float(os.getenv("FEED_CADENCE_SMOOTHING", "0.3"))
+
+
+#------------------------------------------------------------------------
+# HTTP Client Settings (backend/utils/http.py, shared by fetcher and extractor)
+# - HTTP_MAX_CONNECTIONS / HTTP_MAX_KEEPALIVE_CONNECTIONS: pool limits
+# - HTTP_KEEPALIVE_SECONDS: idle time before a kept-alive connection is closed
+# - HTTP_MAX_BODY_BYTES: larger responses are abandoned
+#------------------------------------------------------------------------
+
+HTTP_MAX_CONNECTIONS: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "10"))
+HTTP_KEEPALIVE_SECONDS: float = float(os.getenv("HTTP_KEEPALIVE_SECONDS", "30"))
+HTTP_MAX_BODY_BYTES: int = int(os.getenv("HTTP_MAX_BODY_BYTES", str(5 * 1024 * 1024)))
+
+
+#------------------------------------------------------------------------
+# Source Health Settings (backend/news/health.py)
+# - Request timeouts adapt to each host's p95 latency x multiplier, within
+#   [HTTP_TIMEOUT_MIN_SECONDS, HTTP_TIMEOUT_MAX_SECONDS]; HTTP_TIMEOUT_SECONDS
+#   is used until a host has SOURCE_HEALTH_MIN_SAMPLES successful requests.
+# - The circuit breaker skips a host for SOURCE_BREAKER_COOLDOWN_SECONDS after
+#   SOURCE_BREAKER_FAILURES consecutive failures, or when its failure rate
+#   over the window exceeds SOURCE_BREAKER_FAILURE_RATE.
+#------------------------------------------------------------------------
+
+HTTP_TIMEOUT_SECONDS: float = float(os.getenv("HTTP_TIMEOUT_SECONDS", "10"))
+HTTP_TIMEOUT_MIN_SECONDS: float = float(os.getenv("HTTP_TIMEOUT_MIN_SECONDS", "2"))
+HTTP_TIMEOUT_MAX_SECONDS: float = float(os.getenv("HTTP_TIMEOUT_MAX_SECONDS", "20"))
+SOURCE_TIMEOUT_P95_MULTIPLIER: float = float(os.getenv("SOURCE_TIMEOUT_P95_MULTIPLIER", "2.0"))
+SOURCE_HEALTH_WINDOW: int = int(os.getenv("SOURCE_HEALTH_WINDOW", "50"))
+SOURCE_HEALTH_MIN_SAMPLES: int = int(os.getenv("SOURCE_HEALTH_MIN_SAMPLES", "5"))
+SOURCE_BREAKER_FAILURES: int = int(os.getenv("SOURCE_BREAKER_FAILURES", "3"))
+SOURCE_BREAKER_FAILURE_RATE: float = float(os.getenv("SOURCE_BREAKER_FAILURE_RATE", "0.5"))
+SOURCE_BREAKER_COOLDOWN_SECONDS: int = int(os.getenv("SOURCE_BREAKER_COOLDOWN_SECONDS", "900"))
+
+
+#------------------------------------------------------------------------
+# Pipeline Settings
+# - PIPELINE_QUEUE_SIZE: articles extracted ahead of summarization (0 = no read-ahead)
+# - SUBSCRIBER_BATCH_SIZE: subscribers fetched per database round trip
+# - EMAIL_LOG_BATCH_SIZE: email log rows written (and committed) per batch
+# - LLM_USAGE_BATCH_SIZE: LLM usage rows written (and committed) per batch
+# - ARCHIVE_SUMMARIES: keep every summary in the searchable article archive (opt-in)
+# - ARCHIVE_BATCH_SIZE: archived summaries written (and committed) per batch
+# - PIPELINE_CHECKPOINTS: persist stage outputs so interrupted runs resume (opt-in)
+# - PIPELINE_RUNS_DIR: checkpoint directory (one sub-directory per run id)
+#------------------------------------------------------------------------
+
+PIPELINE_QUEUE_SIZE: int = int(os.getenv("PIPELINE_QUEUE_SIZE", "4"))
+SUBSCRIBER_BATCH_SIZE: int = int(os.getenv("SUBSCRIBER_BATCH_SIZE", "500"))
+EMAIL_LOG_BATCH_SIZE: int = int(os.getenv("EMAIL_LOG_BATCH_SIZE", "50"))
+LLM_USAGE_BATCH_SIZE: int = int(os.getenv("LLM_USAGE_BATCH_SIZE", "50"))
+ARCHIVE_SUMMARIES: bool = os.getenv("ARCHIVE_SUMMARIES", "false").lower() == "true"
+ARCHIVE_BATCH_SIZE: int = int(os.getenv("ARCHIVE_BATCH_SIZE", "50"))
+PIPELINE_CHECKPOINTS: bool = os.getenv("PIPELINE_CHECKPOINTS", "false").lower() == "true"
+PIPELINE_RUNS_DIR: str = os.getenv("PIPELINE_RUNS_DIR", str(PROJECT_ROOT / "data" / "runs"))
+
+
+#------------------------------------------------------------------------
+# Degradation Settings (backend/utils/governor.py)
+# Seconds a run may work past a cohort's send deadline before it steps
+# down to: no article.nlp() -> feed descriptions only -> no new LLM calls.
+# Opt-in with PIPELINE_DEGRADATION=true.
+#------------------------------------------------------------------------
+
+PIPELINE_DEGRADATION: bool = os.getenv("PIPELINE_DEGRADATION", "false").lower() == "true"
+DEGRADE_NO_NLP_AFTER_SECONDS: float = float(os.getenv("DEGRADE_NO_NLP_AFTER_SECONDS", "300"))
+DEGRADE_FEED_ONLY_AFTER_SECONDS: float = float(os.getenv("DEGRADE_FEED_ONLY_AFTER_SECONDS", "900"))
+DEGRADE_EXTRACTIVE_AFTER_SECONDS: float = float(os.getenv("DEGRADE_EXTRACTIVE_AFTER_SECONDS", "1800"))
+
+
+#------------------------------------------------------------------------
+# Story Clustering Settings (backend/news/clustering.py)
+# - STORY_CLUSTERING: summarize each event once, with all sources linked (opt-in)
+# - CLUSTER_SIMILARITY_THRESHOLD: cosine similarity (title + lead) to join a story
+# - CLUSTER_HASH_FEATURES: hashed TF-IDF dimensions
+# - CLUSTER_MAX_RELATED: other sources' leads given to the LLM per story
+#------------------------------------------------------------------------
+
+STORY_CLUSTERING: bool = os.getenv("STORY_CLUSTERING", "false").lower() == "true"
+CLUSTER_SIMILARITY_THRESHOLD: float = float(os.getenv("CLUSTER_SIMILARITY_THRESHOLD", "0.35"))
+CLUSTER_HASH_FEATURES: int = int(os.getenv("CLUSTER_HASH_FEATURES", "4096"))
+CLUSTER_MAX_RELATED: int = int(os.getenv("CLUSTER_MAX_RELATED", "4"))
+
+
+#------------------------------------------------------------------------
+# Retention Settings (jobs/retention.py)
+# - EMAIL_LOG_RETENTION_DAYS: email_logs detail rows kept (older rows are rolled up)
+# - EMAIL_LOG_ARCHIVE_DIR: gzipped JSONL archive of removed rows ("" disables)
+# - RETENTION_BATCH_SIZE: rows archived, rolled up and deleted per transaction
+#------------------------------------------------------------------------
+
+EMAIL_LOG_RETENTION_DAYS: int = int(os.getenv("EMAIL_LOG_RETENTION_DAYS", "90"))
+EMAIL_LOG_ARCHIVE_DIR: str = os.getenv("EMAIL_LOG_ARCHIVE_DIR", str(PROJECT_ROOT / "data" / "archive"))
+RETENTION_BATCH_SIZE: int = int(os.getenv("RETENTION_BATCH_SIZE", "5000"))
+
+
 #------------------------------------------------------------------------
 # Logging Settings
 #------------------------------------------------------------------------
 
 LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+LOG_FORMAT: str = os.getenv("LOG_FORMAT", "text").lower()   # text | json
 LOG_DIR: Path = os.getenv("LOG_DIR", (PROJECT_ROOT / "logs"))
-Path(LOG_DIR).mkdir(parents=True, exist_ok=True)
+
+
+def ensure_log_dir() -> Path:
+    """
+    Create LOG_DIR if needed (called when the log file handler is built).
+    """
+    path = Path(LOG_DIR)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+#------------------------------------------------------------------------
+# Metrics Settings
+# - METRICS_FILE: Prometheus text file written after each run ("" disables)
+# - METRICS_PORT: serve /metrics on localhost (0 disables)
+#------------------------------------------------------------------------
+
+METRICS_FILE: str = os.getenv("METRICS_FILE", str(Path(LOG_DIR) / "metrics.prom"))
+METRICS_PORT: int = int(os.getenv("METRICS_PORT", "0"))
+
+
+#------------------------------------------------------------------------
+# Profiling Settings (opt-in, reports are written to LOG_DIR)
+# - PIPELINE_PROFILE: per-stage timing spans
+# - PIPELINE_PROFILE_CPU: cProfile per stage
+# - PIPELINE_PROFILE_MEMORY: tracemalloc growth per stage + top allocations
+#------------------------------------------------------------------------
+
+PIPELINE_PROFILE: bool = os.getenv("PIPELINE_PROFILE", "false").lower() == "true"
+PIPELINE_PROFILE_CPU: bool = os.getenv("PIPELINE_PROFILE_CPU", "false").lower() == "true"
+PIPELINE_PROFILE_MEMORY: bool = os.getenv("PIPELINE_PROFILE_MEMORY", "false").lower() == "true"
 
 
 #------------------------------------------------------------------------
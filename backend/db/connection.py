@@ -8,19 +8,98 @@ Designed to work correctly with:
 - Streamlit Cloud
 - Supabase (PostgreSQL + PgBouncer)
 - Local SQLite (development)
+
+Pool settings are chosen per backend (see _engine_options and the DB_*
+settings in backend/config.py).
+
+init_db() also creates the full-text index over summarized articles:
+an FTS5 table kept in sync by triggers on SQLite, a generated tsvector
+column with a GIN index on PostgreSQL (queried by crud.search_articles).
 """
 
 from __future__ import annotations
 
 from contextlib import contextmanager
-from typing import Generator
+from pathlib import Path
+from typing import Any, Dict, Generator
 
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine, URL, make_url
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import NullPool
 
-from backend.config import DATABASE_URL
+from backend.config import (
+    DATABASE_URL,
+    DB_PGBOUNCER,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_RECYCLE_SECONDS,
+    DB_POOL_TIMEOUT_SECONDS,
+    DB_POOL_PRE_PING,
+    DB_SQLITE_BUSY_TIMEOUT_MS,
+)
+
+
+# -------------------------------------------------------------------------
+# Engine profiles
+# -------------------------------------------------------------------------
+def _is_pgbouncer(url: URL) -> bool:
+    """
+    Whether connections go through PgBouncer (DB_PGBOUNCER=auto detects
+    the Supabase pooler by port 6543 or its pooler hostname).
+    """
+    if DB_PGBOUNCER in ("true", "false"):
+        return DB_PGBOUNCER == "true"
+    return url.port == 6543 or (url.host or "").endswith(".pooler.supabase.com")
+
+
+def _engine_options(url: URL) -> Dict[str, Any]:
+    """
+    Backend-aware engine keyword arguments.
+
+    - SQLite: allow multithreading, wait on locks instead of failing.
+    - PostgreSQL via PgBouncer (transaction mode): NullPool, the bouncer
+      pools server connections and a client-side pool would pin them.
+    - PostgreSQL direct: sized QueuePool with recycle; pre-ping is opt-in
+      since it costs a round trip on every checkout.
+    """
+    backend = url.get_backend_name()
+
+    if backend == "sqlite":
+        return {
+            "connect_args": {
+                "check_same_thread": False,
+                "timeout": DB_SQLITE_BUSY_TIMEOUT_MS / 1000,
+            },
+        }
+
+    if backend == "postgresql" and _is_pgbouncer(url):
+        return {"poolclass": NullPool}
+
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_recycle": DB_POOL_RECYCLE_SECONDS,
+        "pool_timeout": DB_POOL_TIMEOUT_SECONDS,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+        "pool_use_lifo": True,
+    }
+
+
+def _configure_sqlite(engine: Engine, in_memory: bool) -> None:
+    """
+    Switch SQLite connections to WAL with synchronous=NORMAL, so readers
+    (pipeline) and the writer (Streamlit app) no longer block each other.
+    """
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        if not in_memory:
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={DB_SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.close()
 
 
 # -------------------------------------------------------------------------
@@ -28,24 +107,26 @@ from backend.config import DATABASE_URL
 # -------------------------------------------------------------------------
 def _create_engine(database_url: str) -> Engine:
     """
-    Create SQLAlchemy engine with safe defaults.
-
-    IMPORTANT:
-    - SQLite: allow multithreading
-    - Supabase/Postgres on Streamlit Cloud: MUST use NullPool
+    Create SQLAlchemy engine with the profile for its backend.
     """
-    connect_args = {}
-    if database_url.startswith("sqlite"):
-        connect_args = {"check_same_thread": False}
+    url = make_url(database_url)
+    in_memory = not url.database or url.database == ":memory:"
 
-    return create_engine(
+    if url.get_backend_name() == "sqlite" and not in_memory:
+        Path(url.database).parent.mkdir(parents=True, exist_ok=True)
+
+    engine = create_engine(
         database_url,
         echo=False,
         future=True,
-        connect_args=connect_args,
-        pool_pre_ping=True,
+        **_engine_options(url),
     )
 
+    if url.get_backend_name() == "sqlite":
+        _configure_sqlite(engine, in_memory)
+
+    return engine
+
 
 engine: Engine = _create_engine(DATABASE_URL)
 
@@ -87,3 +168,60 @@ def init_db() -> None:
 
     print("Tables registered:", models.Base.metadata.tables.keys())
     models.Base.metadata.create_all(bind=engine)
+
+    # create_all() skips existing tables, so add indexes introduced later.
+    for table in models.Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+    _create_search_index()
+
+
+# -------------------------------------------------------------------------
+# Full-text search index (articles)
+# -------------------------------------------------------------------------
+_SQLITE_FTS_COLUMNS = """
+    new.title,
+    coalesce(json_extract(new.summary, '$.summary'), ''),
+    coalesce((SELECT group_concat(value, ' ') FROM json_each(new.summary, '$.bullets')), '')
+"""
+
+SQLITE_SEARCH_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5("
+    "title, summary, bullets, tokenize = 'porter unicode61')",
+    f"""CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles
+        WHEN new.summary IS NOT NULL BEGIN
+        INSERT INTO articles_fts(rowid, title, summary, bullets) VALUES (new.id, {_SQLITE_FTS_COLUMNS});
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE OF title, summary ON articles BEGIN
+        DELETE FROM articles_fts WHERE rowid = old.id;
+        INSERT INTO articles_fts(rowid, title, summary, bullets)
+        SELECT new.id, {_SQLITE_FTS_COLUMNS} WHERE new.summary IS NOT NULL;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+        DELETE FROM articles_fts WHERE rowid = old.id;
+    END""",
+    # Backfill rows summarized before the index existed.
+    f"""INSERT INTO articles_fts(rowid, title, summary, bullets)
+        SELECT new.id, {_SQLITE_FTS_COLUMNS} FROM articles AS new
+        WHERE new.summary IS NOT NULL AND new.id NOT IN (SELECT rowid FROM articles_fts)""",
+]
+
+POSTGRES_SEARCH_DDL = [
+    """ALTER TABLE articles ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(summary->>'summary', '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(summary->>'bullets', '')), 'C')
+    ) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_articles_search_vector ON articles USING GIN (search_vector)",
+]
+
+
+def _create_search_index() -> None:
+    """
+    Create (or backfill) the article full-text index for the current backend.
+    """
+    ddl = {"sqlite": SQLITE_SEARCH_DDL, "postgresql": POSTGRES_SEARCH_DDL}.get(engine.dialect.name, [])
+    with engine.begin() as conn:
+        for statement in ddl:
+            conn.execute(text(statement))
@@ -20,13 +20,14 @@ This module contains functions used by:
 #-------------------------------------------------------------------------
 from __future__ import annotations
 
-from datetime import date
-from typing import Optional, List, Any, Dict
+import re
+from datetime import date, datetime
+from typing import Optional, List, Any, Dict, Iterator, Sequence, Set, Tuple
 
-from sqlalchemy import select, update
+from sqlalchemy import Row, bindparam, case, delete, func, insert, select, text, true, update
 from sqlalchemy.orm import Session
 
-from backend.db.models import Subscriber, EmailLog
+from backend.db.models import Subscriber, EmailLog, EmailLogDaily, FeedSchedule, LlmUsage, SourceHealth, StoredArticle
 
 
 #------------------------------------------------------------------------
@@ -57,6 +58,74 @@ def create_subscriber(db: Session, email: str) -> Subscriber:
     return sub
 
 
+#-----------------------------------------------------------------------------
+# Dialect-specific INSERT (for ON CONFLICT upserts)
+#-----------------------------------------------------------------------------
+def _upsert_insert(db: Session, model):
+    """
+    Return an INSERT construct that supports on_conflict_do_nothing/update
+    for the session's backend (PostgreSQL or SQLite).
+    """
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        raise RuntimeError(f"Upserts are not supported for database dialect: {dialect}")
+
+    return dialect_insert(model)
+
+
+#-----------------------------------------------------------------------------
+# Bulk upsert subscribers
+#-----------------------------------------------------------------------------
+SUBSCRIBER_UPDATABLE_FIELDS = ("topics", "preffered_time", "time_zone", "is_active", "is_verified")
+
+
+def bulk_upsert_subscribers(
+    db: Session,
+    rows: List[Dict[str, Any]],
+    update_fields: Sequence[str] = (),
+) -> Tuple[int, int]:
+    """
+    Insert a batch of subscribers with a single multi-row INSERT ... ON CONFLICT.
+
+    - rows: dicts with email (normalized) and the Subscriber columns to set.
+      Every row must have the same keys; emails must be unique in the batch.
+    - update_fields: columns to overwrite for emails that already exist
+      (empty = keep existing subscribers untouched, ON CONFLICT DO NOTHING).
+
+    Returns (inserted, updated).
+    """
+    if not rows:
+        return 0, 0
+
+    emails = [row["email"] for row in rows]
+    existing = set(db.scalars(select(Subscriber.email).where(Subscriber.email.in_(emails))))
+
+    stmt = _upsert_insert(db, Subscriber).values(rows)
+
+    update_fields = [f for f in update_fields if f in SUBSCRIBER_UPDATABLE_FIELDS]
+    if update_fields:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Subscriber.email],
+            set_={
+                **{f: getattr(stmt.excluded, f) for f in update_fields},
+                "updated_at": func.now(),
+            },
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=[Subscriber.email])
+
+    db.execute(stmt)
+
+    inserted = len(rows) - len(existing)
+    updated = len(existing) if update_fields else 0
+    return inserted, updated
+
+
 #-----------------------------------------------------------------------------
 # Get subscriber by email
 #-----------------------------------------------------------------------------
@@ -199,6 +268,93 @@ def get_active_verified_subscribers(db: Session) -> List[Subscriber]:
     return list(db.scalars(stmt).all())
 
 
+#----------------------------------------------------------------------------
+# Keyset-paginated subscriber rows
+#----------------------------------------------------------------------------
+SUBSCRIBER_ROW_COLUMNS = (
+    Subscriber.id,
+    Subscriber.email,
+    Subscriber.topics,
+    Subscriber.preffered_time,
+    Subscriber.time_zone,
+)
+
+
+def get_subscriber_page(
+    db: Session,
+    after_id: int = 0,
+    page_size: int = 1000,
+    shard: Optional[Tuple[int, int]] = None,
+    preffered_times: Optional[Sequence[str]] = None,
+    time_zone: Optional[str] = None,
+) -> List[Row]:
+    """
+    One keyset page of eligible subscribers: id > after_id, by id, at most
+    page_size rows. Filters as in iter_subscriber_rows(); callers that
+    must not hold a session between pages pass the last id back in.
+    """
+    stmt = select(*SUBSCRIBER_ROW_COLUMNS).where(
+        Subscriber.is_active == true(),
+        Subscriber.is_verified == true(),
+        Subscriber.id > after_id,
+    )
+
+    if shard is not None:
+        index, count = shard
+        stmt = stmt.where(Subscriber.id % count == index)
+    if preffered_times is not None:
+        stmt = stmt.where(Subscriber.preffered_time.in_(list(preffered_times)))
+    if time_zone is not None:
+        stmt = stmt.where(Subscriber.time_zone == time_zone)
+
+    return db.execute(stmt.order_by(Subscriber.id).limit(page_size)).all()
+
+
+def iter_subscriber_rows(
+    db: Session,
+    page_size: int = 1000,
+    shard: Optional[Tuple[int, int]] = None,
+    preffered_times: Optional[Sequence[str]] = None,
+    time_zone: Optional[str] = None,
+) -> Iterator[Row]:
+    """
+    Stream eligible subscribers as lightweight rows (no ORM objects).
+
+    - Pages by primary key (WHERE id > last_id ORDER BY id LIMIT n), so each
+      page is a short indexed query regardless of table size.
+    - Rows expose: id, email, topics, preffered_time, time_zone.
+    - shard=(index, count) keeps rows where id % count == index.
+    - preffered_times / time_zone restrict to a send bucket.
+    """
+    last_id = 0
+    while True:
+        page = get_subscriber_page(db, last_id, page_size, shard, preffered_times, time_zone)
+
+        yield from page
+
+        if len(page) < page_size:
+            return
+        last_id = page[-1].id
+
+
+def get_send_cohorts(db: Session, shard: Optional[Tuple[int, int]] = None) -> List[Row]:
+    """
+    Distinct (time_zone, preffered_time) pairs among eligible subscribers.
+    Each pair shares one send deadline; stream its members with
+    iter_subscriber_rows(time_zone=..., preffered_times=[...]).
+    """
+    stmt = select(Subscriber.time_zone, Subscriber.preffered_time).where(
+        Subscriber.is_active == true(),
+        Subscriber.is_verified == true(),
+    )
+
+    if shard is not None:
+        index, count = shard
+        stmt = stmt.where(Subscriber.id % count == index)
+
+    return db.execute(stmt.distinct()).all()
+
+
 #----------------------------------------------------------------------------
 # EmailLog CRUD
 #----------------------------------------------------------------------------
@@ -230,6 +386,22 @@ def log_email_status(
     return log
 
 
+#----------------------------------------------------------------------------
+# Bulk EmailLog insert
+#----------------------------------------------------------------------------
+def bulk_log_email_statuses(db: Session, rows: List[Dict[str, Any]]) -> int:
+    """
+    Insert many EmailLog rows in one executemany round trip.
+    Each row uses the log_email_status() keyword names.
+    Returns the number of rows written.
+    """
+    if not rows:
+        return 0
+
+    db.execute(insert(EmailLog), rows)
+    return len(rows)
+
+
 #----------------------------------------------------------------------------
 # Check digest status
 #----------------------------------------------------------------------------
@@ -245,3 +417,422 @@ def has_digest_been_sent(db: Session, subscriber_id: int, digest_date: date) ->
     )
 
     return db.scalar(stmt) is not None
+
+
+def get_sent_subscriber_ids(db: Session, subscriber_ids: Sequence[int], digest_date: date) -> Set[int]:
+    """
+    has_digest_been_sent() for a page of subscribers in one query.
+    """
+    if not subscriber_ids:
+        return set()
+
+    stmt = select(EmailLog.subscriber_id).where(
+        EmailLog.subscriber_id.in_(list(subscriber_ids)),
+        EmailLog.digest_date == digest_date,
+        EmailLog.status == "sent",
+    )
+
+    return set(db.scalars(stmt))
+
+
+#----------------------------------------------------------------------------
+# EmailLog retention (see jobs/retention.py)
+#----------------------------------------------------------------------------
+def get_expired_email_logs(db: Session, before: date, limit: int = 5000) -> List[Row]:
+    """
+    Oldest EmailLog rows with digest_date < before, as plain rows
+    (all columns, no ORM objects), at most `limit` per call.
+    """
+    stmt = (
+        select(*EmailLog.__table__.columns)
+        .where(EmailLog.digest_date < before)
+        .order_by(EmailLog.digest_date, EmailLog.id)
+        .limit(limit)
+    )
+    return list(db.execute(stmt))
+
+
+def add_email_log_rollups(db: Session, counts: Dict[Tuple[date, str, str], int]) -> int:
+    """
+    Add counts to the daily rollup, keyed by (digest_date, status, provider).
+    Existing rollup rows are incremented, so re-running is additive.
+    Returns the number of rollup rows touched.
+    """
+    if not counts:
+        return 0
+
+    rows = [
+        {"digest_date": digest_date, "status": status, "provider": provider, "count": count}
+        for (digest_date, status, provider), count in counts.items()
+    ]
+
+    stmt = _upsert_insert(db, EmailLogDaily).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[EmailLogDaily.digest_date, EmailLogDaily.status, EmailLogDaily.provider],
+        set_={
+            "count": EmailLogDaily.count + stmt.excluded["count"],
+            "updated_at": func.now(),
+        },
+    )
+    db.execute(stmt)
+    return len(rows)
+
+
+def delete_email_logs(db: Session, ids: Sequence[int]) -> int:
+    """
+    Delete EmailLog rows by id. Returns the number of rows deleted.
+    """
+    if not ids:
+        return 0
+
+    result = db.execute(delete(EmailLog).where(EmailLog.id.in_(ids)))
+    return result.rowcount
+
+
+#----------------------------------------------------------------------------
+# Source health (see backend/news/health.py)
+#----------------------------------------------------------------------------
+def get_source_health(db: Session) -> List[SourceHealth]:
+    """
+    Health state of every known source host.
+    """
+    return list(db.scalars(select(SourceHealth)))
+
+
+def save_source_health(db: Session, rows: List[Dict[str, Any]]) -> int:
+    """
+    Upsert per-host health rows (keyed by host) in one statement.
+    Returns the number of rows written.
+    """
+    if not rows:
+        return 0
+
+    stmt = _upsert_insert(db, SourceHealth).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[SourceHealth.host],
+        set_={
+            **{f: stmt.excluded[f] for f in ("latencies", "outcomes", "consecutive_failures", "open_until")},
+            "updated_at": func.now(),
+        },
+    )
+    db.execute(stmt)
+    return len(rows)
+
+
+#----------------------------------------------------------------------------
+# Feed schedule
+#----------------------------------------------------------------------------
+FEED_SCHEDULE_FIELDS = (
+    "source", "topic", "publish_gap_seconds", "interval_seconds", "next_poll_at",
+    "last_polled_at", "last_new_at", "polls", "empty_polls", "failed_polls", "new_items",
+)
+
+
+def get_feed_schedules(db: Session) -> List[FeedSchedule]:
+    """
+    Every feed's poll schedule and statistics, soonest due first.
+    """
+    return list(db.scalars(select(FeedSchedule).order_by(FeedSchedule.next_poll_at)))
+
+
+def save_feed_schedules(db: Session, rows: List[Dict[str, Any]]) -> int:
+    """
+    Upsert per-feed schedule rows (keyed by feed_url) in one statement.
+    Returns the number of rows written.
+    """
+    if not rows:
+        return 0
+
+    stmt = _upsert_insert(db, FeedSchedule).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[FeedSchedule.feed_url],
+        set_={**{f: stmt.excluded[f] for f in FEED_SCHEDULE_FIELDS}, "updated_at": func.now()},
+    )
+    db.execute(stmt)
+    return len(rows)
+
+
+#----------------------------------------------------------------------------
+# LLM usage (see backend/db/writers.py, jobs/llm_usage.py)
+#----------------------------------------------------------------------------
+def bulk_add_llm_usage(db: Session, rows: List[Dict[str, Any]]) -> int:
+    """
+    Insert many LlmUsage rows in one executemany round trip.
+    Returns the number of rows written.
+    """
+    if not rows:
+        return 0
+
+    db.execute(insert(LlmUsage), rows)
+    return len(rows)
+
+
+def get_llm_usage(
+    db: Session,
+    run_id: Optional[str] = None,
+    since: Optional[datetime] = None,
+) -> List[Row]:
+    """
+    LLM usage rows (all columns, no ORM objects) for one run and/or since a time.
+    """
+    stmt = select(*LlmUsage.__table__.columns).order_by(LlmUsage.id)
+    if run_id is not None:
+        stmt = stmt.where(LlmUsage.run_id == run_id)
+    if since is not None:
+        stmt = stmt.where(LlmUsage.created_at >= since)
+    return list(db.execute(stmt))
+
+
+def get_llm_usage_runs(db: Session, limit: int = 20) -> List[Row]:
+    """
+    Per-run usage totals, most recent run first.
+    """
+    stmt = (
+        select(
+            LlmUsage.run_id,
+            func.count().label("calls"),
+            func.sum(LlmUsage.input_tokens).label("input_tokens"),
+            func.sum(LlmUsage.output_tokens).label("output_tokens"),
+            func.sum(LlmUsage.cost_usd).label("cost_usd"),
+            func.min(LlmUsage.created_at).label("started_at"),
+        )
+        .group_by(LlmUsage.run_id)
+        .order_by(func.min(LlmUsage.created_at).desc())
+        .limit(limit)
+    )
+    return list(db.execute(stmt))
+
+
+#----------------------------------------------------------------------------
+# Article store (see backend/news/store.py, jobs/ingester.py)
+#----------------------------------------------------------------------------
+def get_article_story_hashes(db: Session, url_hashes: Sequence[str]) -> Dict[str, str]:
+    """
+    url_hash -> story_hash for the given articles that are already stored.
+    """
+    if not url_hashes:
+        return {}
+
+    stmt = select(StoredArticle.url_hash, StoredArticle.story_hash).where(StoredArticle.url_hash.in_(url_hashes))
+    return {row.url_hash: row.story_hash for row in db.execute(stmt)}
+
+
+def insert_articles(db: Session, rows: List[Dict[str, Any]]) -> int:
+    """
+    Insert new StoredArticle rows; rows whose url_hash exists are skipped.
+    Returns the number of rows inserted.
+    """
+    if not rows:
+        return 0
+
+    stmt = _upsert_insert(db, StoredArticle).values(rows).on_conflict_do_nothing(
+        index_elements=[StoredArticle.url_hash]
+    )
+    return db.execute(stmt).rowcount
+
+
+def touch_articles(db: Session, url_hashes: Sequence[str], seen_at: datetime) -> int:
+    """
+    Record that stored articles are still present in their feeds.
+    Archived summaries seen by the ingester become regular summarized articles.
+    """
+    if not url_hashes:
+        return 0
+
+    stmt = update(StoredArticle).where(StoredArticle.url_hash.in_(url_hashes)).values(
+        last_seen_at=seen_at,
+        status=case((StoredArticle.status == "archived", "summarized"), else_=StoredArticle.status),
+    )
+    return db.execute(stmt).rowcount
+
+
+def get_articles_by_status(db: Session, status: str, limit: int = 100) -> List[Row]:
+    """
+    Oldest stored articles with the given status (plain rows).
+    """
+    stmt = (
+        select(*StoredArticle.__table__.columns)
+        .where(StoredArticle.status == status)
+        .order_by(StoredArticle.first_seen_at, StoredArticle.id)
+        .limit(limit)
+    )
+    return list(db.execute(stmt))
+
+
+def update_article(db: Session, url_hash: str, **fields: Any) -> None:
+    """
+    Update columns of one stored article.
+    """
+    db.execute(update(StoredArticle).where(StoredArticle.url_hash == url_hash).values(**fields))
+
+
+def get_articles_since(db: Session, since: datetime) -> List[Row]:
+    """
+    Articles first seen since `since`, oldest first (seeds story clustering).
+    """
+    stmt = (
+        select(*StoredArticle.__table__.columns)
+        .where(StoredArticle.first_seen_at >= since)
+        .order_by(StoredArticle.first_seen_at, StoredArticle.id)
+    )
+    return list(db.execute(stmt))
+
+
+def get_recent_summarized_articles(
+    db: Session,
+    topic: str,
+    since: datetime,
+    until: Optional[datetime] = None,
+    statuses: Sequence[str] = ("summarized",),
+) -> List[Row]:
+    """
+    Summarized articles of a topic published in [since, until), newest first.
+    Uses ix_articles_topic_published.
+    """
+    stmt = (
+        select(*StoredArticle.__table__.columns)
+        .where(
+            StoredArticle.topic == topic,
+            StoredArticle.published_at >= since,
+            StoredArticle.status.in_(statuses),
+        )
+        .order_by(StoredArticle.published_at.desc())
+    )
+    if until is not None:
+        stmt = stmt.where(StoredArticle.published_at < until)
+    return list(db.execute(stmt))
+
+
+def get_story_members(db: Session, story_hashes: Sequence[str]) -> List[Row]:
+    """
+    (story_hash, url_hash, source, url) of every article in the given stories.
+    """
+    if not story_hashes:
+        return []
+
+    stmt = (
+        select(StoredArticle.story_hash, StoredArticle.url_hash, StoredArticle.source, StoredArticle.url)
+        .where(StoredArticle.story_hash.in_(story_hashes))
+        .order_by(StoredArticle.first_seen_at, StoredArticle.id)
+    )
+    return list(db.execute(stmt))
+
+
+def get_topic_last_seen(db: Session, topic: str) -> Optional[datetime]:
+    """
+    Latest time the ingester saw any article of the topic in a feed.
+    """
+    return db.scalar(
+        select(func.max(StoredArticle.last_seen_at))
+        .where(StoredArticle.topic == topic, StoredArticle.status != "archived")
+    )
+
+
+def archive_articles(db: Session, rows: List[Dict[str, Any]]) -> int:
+    """
+    Store summaries made at send time (status 'archived'). Articles already
+    stored only get the summary when they have none yet and are still
+    'new'; 'clustered' and 'failed' rows are left alone, so a story is
+    never stored with two summaries.
+    Returns the number of rows written.
+    """
+    # Raw URLs differing only in tracking params / scheme share a url_hash;
+    # one upsert statement may touch each key only once (Postgres).
+    rows = list({row["url_hash"]: row for row in rows}.values())
+    if not rows:
+        return 0
+
+    stmt = _upsert_insert(db, StoredArticle).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[StoredArticle.url_hash],
+        set_={"summary": stmt.excluded["summary"], "status": "summarized"},
+        where=StoredArticle.summary.is_(None) & StoredArticle.status.in_(("new", "archived")),
+    )
+    db.execute(stmt)
+    return len(rows)
+
+
+#----------------------------------------------------------------------------
+# Article search (full-text index: see backend/db/connection.py)
+#----------------------------------------------------------------------------
+SEARCH_TOKEN_REGEX = re.compile(r"\w+", re.UNICODE)
+
+_SQLITE_SEARCH = """
+    SELECT a.id, a.title, a.url, a.source, a.topic, a.published_at, a.summary,
+           snippet(articles_fts, -1, '**', '**', '…', 16) AS snippet,
+           bm25(articles_fts, 4.0, 2.0, 1.0) AS rank
+    FROM articles_fts
+    JOIN articles AS a ON a.id = articles_fts.rowid
+    WHERE articles_fts MATCH :query {filters}
+    ORDER BY rank
+    LIMIT :limit OFFSET :offset
+"""
+
+_POSTGRES_SEARCH = """
+    SELECT a.id, a.title, a.url, a.source, a.topic, a.published_at, a.summary,
+           ts_headline('english', coalesce(a.summary->>'summary', ''), q.query,
+                       'StartSel=**, StopSel=**, MaxWords=30, MinWords=12') AS snippet,
+           hits.rank
+    FROM (
+        SELECT a.id, ts_rank_cd(a.search_vector, q.query) AS rank
+        FROM articles AS a, websearch_to_tsquery('english', :query) AS q(query)
+        WHERE a.search_vector @@ q.query {filters}
+        ORDER BY rank DESC
+        LIMIT :limit OFFSET :offset
+    ) AS hits
+    JOIN articles AS a ON a.id = hits.id, websearch_to_tsquery('english', :query) AS q(query)
+    ORDER BY hits.rank DESC
+"""
+
+
+def _fts5_query(query: str) -> str:
+    """
+    User input as a safe FTS5 query: every word quoted (AND), the last one
+    as a prefix so results appear while typing.
+    """
+    tokens = SEARCH_TOKEN_REGEX.findall(query)
+    if not tokens:
+        return ""
+    return " ".join(f'"{t}"' for t in tokens[:-1]) + f' "{tokens[-1]}"*'
+
+
+def search_articles(
+    db: Session,
+    query: str,
+    limit: int = 20,
+    offset: int = 0,
+    topic: Optional[str] = None,
+    since: Optional[datetime] = None,
+) -> List[Row]:
+    """
+    Ranked full-text search over summarized articles (title, summary, bullets).
+    Rows: id, title, url, source, topic, published_at, summary, snippet, rank.
+    """
+    dialect = db.get_bind().dialect.name
+    params: Dict[str, Any] = {"limit": limit, "offset": offset}
+    filters = ""
+    if topic:
+        filters += " AND a.topic = :topic"
+        params["topic"] = topic
+    if since is not None:
+        filters += " AND a.published_at >= :since"
+        params["since"] = since
+
+    if dialect == "sqlite":
+        params["query"] = _fts5_query(query)
+        sql = _SQLITE_SEARCH
+    elif dialect == "postgresql":
+        params["query"] = query
+        sql = _POSTGRES_SEARCH
+    else:
+        raise RuntimeError(f"Full-text search is not supported for database dialect: {dialect}")
+
+    if not params["query"].strip():
+        return []
+
+    columns = StoredArticle.__table__.c
+    stmt = text(sql.format(filters=filters))
+    if since is not None:
+        stmt = stmt.bindparams(bindparam("since", type_=columns.published_at.type))
+    stmt = stmt.columns(published_at=columns.published_at.type, summary=columns.summary.type)
+    return list(db.execute(stmt, params))
@@ -25,10 +25,13 @@ from sqlalchemy import (
     Boolean,
     Date,
     DateTime,
+    Float,
     ForeignKey,
+    Index,
     Integer, 
     String, 
     Text,
+    UniqueConstraint,
     func
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
@@ -61,6 +64,12 @@ class Subscriber(Base):
         - is_verified: email verification status (recommanded).
     """
     __tablename__ = "subscribers"
+    __table_args__ = (
+        # Keyset pagination over sendable subscribers (crud.iter_subscriber_rows).
+        Index("ix_subscribers_active_verified_id", "is_active", "is_verified", "id"),
+        # Send cohorts (crud.get_send_cohorts) and paging within one cohort.
+        Index("ix_subscribers_send_cohort", "is_active", "is_verified", "time_zone", "preffered_time", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     email: Mapped[str] = mapped_column(String(320), unique=True, index=True, nullable=False)
@@ -99,9 +108,18 @@ class EmailLog(Base):
     - status: 'sent', 'failed', 'bounced'.capitalize
     - provider: 'sendgrid', 'ses', etc.
     - provider_message_id: useful for debugging with email provider.
+
+    Rows older than EMAIL_LOG_RETENTION_DAYS are rolled up into
+    EmailLogDaily and removed by jobs/retention.py.
     
     """
     __tablename__ = "email_logs"
+    __table_args__ = (
+        # has_digest_been_sent() lookups.
+        Index("ix_email_logs_subscriber_date", "subscriber_id", "digest_date"),
+        # Retention scans (oldest rows first).
+        Index("ix_email_logs_digest_date", "digest_date"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
 
@@ -123,4 +141,201 @@ class EmailLog(Base):
 
     def __repr__(self) -> str:
         return f"<EmailLog id={self.id}, subscriber_id={self.subscriber_id}, date={self.digest_date}, status={self.status}>"
-        
+
+
+#------------------------------------------------------------------------
+# Email Log daily rollup model
+#------------------------------------------------------------------------
+class EmailLogDaily(Base):
+    """
+    Compact per-day aggregate of email_logs, kept after detail rows expire.
+
+    Fields:
+    - digest_date, status, provider: one row per combination
+      (provider is '' when the detail rows had none).
+    - count: number of send attempts rolled up into this row.
+    """
+    __tablename__ = "email_log_daily"
+    __table_args__ = (
+        UniqueConstraint("digest_date", "status", "provider", name="uq_email_log_daily_key"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    digest_date: Mapped[date] = mapped_column(Date, nullable=False)
+    status: Mapped[str] = mapped_column(String(32), nullable=False)
+    provider: Mapped[str] = mapped_column(String(32), nullable=False, default="")
+
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=func.now(), onupdate=func.now())
+
+
+    def __repr__(self) -> str:
+        return f"<EmailLogDaily date={self.digest_date}, status={self.status}, provider={self.provider}, count={self.count}>"
+
+
+#------------------------------------------------------------------------
+# Source health model
+#------------------------------------------------------------------------
+class SourceHealth(Base):
+    """
+    Per-host fetch health, kept across runs (see backend/news/health.py).
+
+    Fields:
+    - host: publisher hostname (e.g. 'indianexpress.com').
+    - latencies: recent successful request durations in seconds (rolling window).
+    - outcomes: recent request outcomes, 1 = success, 0 = failure (rolling window).
+    - consecutive_failures: failures since the last success.
+    - open_until: circuit breaker open (host skipped) until this time.
+    """
+    __tablename__ = "source_health"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    host: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+
+    latencies: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
+    outcomes: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
+    consecutive_failures: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    open_until: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=func.now(), onupdate=func.now())
+
+
+    def __repr__(self) -> str:
+        return f"<SourceHealth host={self.host}, consecutive_failures={self.consecutive_failures}, open_until={self.open_until}>"
+
+
+#------------------------------------------------------------------------
+# Feed schedule model
+#------------------------------------------------------------------------
+class FeedSchedule(Base):
+    """
+    Per-feed poll schedule and statistics, kept across ingester restarts
+    (see backend/news/scheduler.py).
+
+    Fields:
+    - feed_url: RSS feed URL (one row per publisher x topic feed).
+    - source / topic: publisher name and topic from NEWS_SOURCES.
+    - publish_gap_seconds: smoothed time between the feed's entries (None until learned).
+    - interval_seconds: current poll interval (before jitter).
+    - next_poll_at: when the feed is due next.
+    - last_polled_at / last_new_at: last poll, and last poll that found new entries.
+    - polls / empty_polls / failed_polls / new_items: running counts.
+    """
+    __tablename__ = "feed_schedule"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    feed_url: Mapped[str] = mapped_column(String(500), unique=True, nullable=False)
+    source: Mapped[str] = mapped_column(String(255), nullable=False)
+    topic: Mapped[str] = mapped_column(String(50), nullable=False)
+
+    publish_gap_seconds: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    interval_seconds: Mapped[float] = mapped_column(Float, nullable=False)
+    next_poll_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    last_polled_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_new_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    polls: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    empty_polls: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed_polls: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    new_items: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=func.now(), onupdate=func.now())
+
+
+    def __repr__(self) -> str:
+        return f"<FeedSchedule source={self.source}, topic={self.topic}, interval={self.interval_seconds}, next_poll_at={self.next_poll_at}>"
+
+
+#------------------------------------------------------------------------
+# LLM usage model
+#------------------------------------------------------------------------
+class LlmUsage(Base):
+    """
+    One row per LLM call, for cost accounting (see jobs/llm_usage.py).
+
+    Fields:
+    - run_id: pipeline run id (see backend/utils/checkpoints.py).
+    - article_hash: SHA-256 of the article URL.
+    - stage: 'summarize' or 'reask' (JSON repair re-ask).
+    - model: LLM model name.
+    - input_chars: characters of article text sent (after budget fitting).
+    - input_tokens, output_tokens: usage reported by the provider.
+    - cached_tokens: input tokens served from the provider's prompt cache.
+    - latency_seconds: wall time of the call.
+    - cost_usd: estimated from LLM_*_COST_PER_MTOK at the time of the call.
+    """
+    __tablename__ = "llm_usage"
+    __table_args__ = (
+        Index("ix_llm_usage_run_article", "run_id", "article_hash"),
+        Index("ix_llm_usage_created_at", "created_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    run_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    article_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    stage: Mapped[str] = mapped_column(String(32), nullable=False)
+    model: Mapped[str] = mapped_column(String(64), nullable=False)
+
+    input_chars: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    input_tokens: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    output_tokens: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    cached_tokens: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    latency_seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    cost_usd: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=func.now())
+
+
+    def __repr__(self) -> str:
+        return f"<LlmUsage run_id={self.run_id}, stage={self.stage}, input_tokens={self.input_tokens}, output_tokens={self.output_tokens}>"
+
+
+#------------------------------------------------------------------------
+# Stored article model
+#------------------------------------------------------------------------
+class StoredArticle(Base):
+    """
+    Feed article kept by the intraday ingester (see backend/news/store.py),
+    and the searchable archive of every summary sent (full-text index:
+    see backend/db/connection.py).
+
+    Fields:
+    - url_hash: SHA-256 of the canonical URL (tracking params and fragment removed).
+    - story_hash: url_hash of the story's representative article (story clusters);
+      only representatives are summarized.
+    - published_at: feed publish time (first_seen_at when the feed has none).
+    - first_seen_at / last_seen_at: first and latest poll that saw the entry.
+    - status: 'new', 'summarized', 'clustered' (covered by its representative),
+      'failed', or 'archived' (summarized at send time, not by the ingester).
+    - summary: SummarizedArticle fields (bullets, summary, category, importance_score).
+    """
+    __tablename__ = "articles"
+    __table_args__ = (
+        Index("ix_articles_topic_published", "topic", "published_at"),
+        Index("ix_articles_story_hash", "story_hash"),
+        Index("ix_articles_status", "status"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    url_hash: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    story_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+
+    url: Mapped[str] = mapped_column(Text, nullable=False)
+    title: Mapped[str] = mapped_column(Text, nullable=False)
+    source: Mapped[str] = mapped_column(String(64), nullable=False)
+    topic: Mapped[str] = mapped_column(String(32), nullable=False)
+    description: Mapped[str] = mapped_column(Text, nullable=False, default="")
+
+    published_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    first_seen_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=func.now())
+    last_seen_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=func.now())
+
+    status: Mapped[str] = mapped_column(String(16), nullable=False, default="new")
+    summary: Mapped[Optional[dict]] = mapped_column(JSON(none_as_null=True), nullable=True)
+
+
+    def __repr__(self) -> str:
+        return f"<StoredArticle id={self.id}, topic={self.topic}, status={self.status}, url={self.url}>"
@@ -0,0 +1,254 @@
+"""
+backend/db/writers.py
+---------------------
+
+Buffered, batched database writers for hot paths in the pipeline.
+
+Instead of a flush per row inside one long transaction, rows are collected
+in memory and written with a single executemany per batch, each batch in
+its own short transaction. A crash loses at most the rows of the batch
+that has not been flushed yet.
+
+Usage:
+    with EmailLogWriter() as writer:
+        writer.log(subscriber_id=1, digest_date=today, subject=subject, status="sent")
+
+    with LlmUsageWriter(run_id) as usage:
+        usage.record(article_hash, stage="summarize", model=model, input_tokens=900, ...)
+
+    with ArticleArchiveWriter() as archive:
+        archive.archive(raw_article, summarized_article)
+"""
+
+
+#-------------------------------------------------------------------------
+# Imports
+#-------------------------------------------------------------------------
+from __future__ import annotations
+
+import threading
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from backend.config import (
+    ARCHIVE_BATCH_SIZE,
+    EMAIL_LOG_BATCH_SIZE,
+    LLM_CACHED_INPUT_COST_PER_MTOK,
+    LLM_INPUT_COST_PER_MTOK,
+    LLM_OUTPUT_COST_PER_MTOK,
+    LLM_USAGE_BATCH_SIZE,
+)
+from backend.db import crud
+from backend.db.connection import get_session
+from backend.utils.logger import get_logger
+from backend.utils.metrics import counter, histogram
+
+logger = get_logger(__name__)
+
+BATCHES_WRITTEN = counter("db_writer_batches_total", "Batches flushed by buffered writers.", ["writer"])
+ROWS_WRITTEN = counter("db_writer_rows_total", "Rows written by buffered writers.", ["writer"])
+WRITE_FAILURES = counter("db_writer_failures_total", "Batches that failed to write.", ["writer"])
+FLUSH_SECONDS = histogram("db_writer_flush_seconds", "Time to write and commit one batch.", ["writer"])
+
+
+#------------------------------------------------------------------------
+# Buffered Writer
+#------------------------------------------------------------------------
+class BufferedWriter:
+    """
+    Collect rows and hand them to `write_batch(db, rows)` every
+    `batch_size` rows, committing once per batch.
+
+    A failed batch stays buffered and is retried on the next flush. With
+    best_effort (for optional data), a failed batch is logged and dropped
+    instead, and the error is not raised to the caller.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        write_batch: Callable[[Session, List[Dict[str, Any]]], Any],
+        batch_size: int,
+        best_effort: bool = False,
+    ):
+        self.name = name
+        self.batch_size = max(1, batch_size)
+        self.best_effort = best_effort
+        self._write_batch = write_batch
+        self._rows: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def add(self, row: Dict[str, Any]) -> None:
+        with self._lock:
+            self._rows.append(row)
+            full = len(self._rows) >= self.batch_size
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write everything buffered so far. Returns the number of rows written.
+        """
+        with self._lock:
+            rows, self._rows = self._rows, []
+
+        if not rows:
+            return 0
+
+        try:
+            with FLUSH_SECONDS.time(writer=self.name):
+                with get_session() as db:
+                    self._write_batch(db, rows)
+        except Exception:
+            WRITE_FAILURES.inc(writer=self.name)
+            if self.best_effort:
+                logger.exception(f"Dropped {len(rows)} buffered {self.name} rows after a failed write")
+                return 0
+            with self._lock:
+                self._rows[:0] = rows
+            logger.exception(f"Failed to write {len(rows)} buffered {self.name} rows")
+            raise
+
+        BATCHES_WRITTEN.inc(writer=self.name)
+        ROWS_WRITTEN.inc(len(rows), writer=self.name)
+        return len(rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __enter__(self) -> "BufferedWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self.flush()
+        except Exception:
+            if exc_type is None:
+                raise  # otherwise keep the original error (already logged)
+
+
+#------------------------------------------------------------------------
+# Email Log Writer
+#------------------------------------------------------------------------
+class EmailLogWriter(BufferedWriter):
+    """
+    Buffered replacement for crud.log_email_status() in the pipeline.
+    """
+
+    def __init__(self, batch_size: int = EMAIL_LOG_BATCH_SIZE):
+        super().__init__("email_log", crud.bulk_log_email_statuses, batch_size)
+
+    def log(
+        self,
+        subscriber_id: int,
+        digest_date: date,
+        subject: str,
+        status: str,
+        provider: Optional[str] = None,
+        provider_message_id: Optional[str] = None,
+        error_message: Optional[str] = None,
+    ) -> None:
+        self.add({
+            "subscriber_id": subscriber_id,
+            "digest_date": digest_date,
+            "subject": subject,
+            "status": status,
+            "provider": provider,
+            "provider_message_id": provider_message_id,
+            "error_message": error_message,
+        })
+
+
+#------------------------------------------------------------------------
+# LLM Usage Writer
+#------------------------------------------------------------------------
+def llm_cost_usd(input_tokens: int, output_tokens: int, cached_tokens: int = 0) -> float:
+    """
+    Estimated cost of one call from the LLM_*_COST_PER_MTOK prices.
+    """
+    uncached = max(0, input_tokens - cached_tokens)
+    return (
+        uncached * LLM_INPUT_COST_PER_MTOK
+        + cached_tokens * LLM_CACHED_INPUT_COST_PER_MTOK
+        + output_tokens * LLM_OUTPUT_COST_PER_MTOK
+    ) / 1_000_000
+
+
+class LlmUsageWriter(BufferedWriter):
+    """
+    Buffered per-call LLM usage rows for one pipeline run.
+    """
+
+    def __init__(self, run_id: str, batch_size: int = LLM_USAGE_BATCH_SIZE):
+        super().__init__("llm_usage", crud.bulk_add_llm_usage, batch_size)
+        self.run_id = run_id
+
+    def record(
+        self,
+        article_hash: str,
+        stage: str,
+        model: str,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        cached_tokens: int = 0,
+        latency_seconds: float = 0.0,
+        input_chars: int = 0,
+    ) -> None:
+        self.add({
+            "run_id": self.run_id,
+            "article_hash": article_hash,
+            "stage": stage,
+            "model": model,
+            "input_chars": input_chars,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "cached_tokens": cached_tokens,
+            "latency_seconds": round(latency_seconds, 3),
+            "cost_usd": llm_cost_usd(input_tokens, output_tokens, cached_tokens),
+        })
+
+
+#------------------------------------------------------------------------
+# Article Archive Writer
+#------------------------------------------------------------------------
+class ArticleArchiveWriter(BufferedWriter):
+    """
+    Buffered archive of summaries made by the pipeline (articles table,
+    status 'archived'), so they stay searchable after the email is sent.
+    The archive is optional: failed batches are dropped, never raised into
+    the send path.
+    """
+
+    def __init__(self, batch_size: int = ARCHIVE_BATCH_SIZE):
+        super().__init__("article_archive", crud.archive_articles, batch_size, best_effort=True)
+
+    def archive(self, article, summarized) -> None:
+        """
+        article: RawArticle (feed metadata), summarized: its SummarizedArticle.
+        """
+        from backend.news.store import article_hash, parse_published
+        from backend.utils.time_utils import utc_now
+
+        now = utc_now()
+        url_hash = article_hash(article.url)
+        self.add({
+            "url_hash": url_hash,
+            "story_hash": url_hash,
+            "url": article.url,
+            "title": article.title,
+            "source": article.source,
+            "topic": article.topic,
+            "description": article.description,
+            "published_at": parse_published(article.published, now),
+            "first_seen_at": now,
+            "last_seen_at": now,
+            "status": "archived",
+            "summary": {
+                "bullets": list(summarized.bullets),
+                "summary": summarized.summary,
+                "category": summarized.category,
+                "importance_score": summarized.importance_score,
+            },
+        })
@@ -15,12 +15,13 @@ from collections import defaultdict
 from typing import List, Dict
 
 from backend.config import DIGEST_TOTAL_MAX_ARTICLES
+from backend.news.records import SummarizedArticle
 
 
 #-----------------------------------------------------------------
 # Build Digest
 #-----------------------------------------------------------------
-def build_digest_for_user(user, summarized_articles: List[Dict]) -> Dict:
+def build_digest_for_user(user, summarized_articles: List[SummarizedArticle]) -> Dict:
     """
     Build a digest structure for a user.
 
@@ -28,7 +29,7 @@ def build_digest_for_user(user, summarized_articles: List[Dict]) -> Dict:
     ----------
     user : Subscriber object
            Contains user preferences like topics.
-    summarized_articles : List[Dict]
+    summarized_articles : List[SummarizedArticle]
         Articles already processed by AI summarizer.
     Returns: Dict
         Structured digest object.
@@ -38,8 +39,8 @@ def build_digest_for_user(user, summarized_articles: List[Dict]) -> Dict:
     user_topics = set(user.topics)
 
     for article in summarized_articles:
-        if article["topic"] in user_topics:
-            sections[article["topic"]].append(article)
+        if article.topic in user_topics:
+            sections[article.topic].append(article)
 
     total = sum(len(v) for v in sections.values())
     if total > DIGEST_TOTAL_MAX_ARTICLES:
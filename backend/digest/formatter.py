@@ -9,7 +9,7 @@ Converts structured digest into HTML email content.
 #-----------------------------------------------------------------
 # Imports
 #-----------------------------------------------------------------
-from jinja2 import Environment, FileSystemLoader
+from functools import lru_cache
 from pathlib import Path
 
 from backend.config import APP_BASE_URL
@@ -17,7 +17,15 @@ from backend.email.unsubscribe import generate_unsubscribe_token
 
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
-env = Environment(loader=FileSystemLoader(TEMPLATE_DIR))
+
+@lru_cache(maxsize=1)
+def get_env():
+    """
+    Build the Jinja environment on first render.
+    """
+    from jinja2 import Environment, FileSystemLoader
+
+    return Environment(loader=FileSystemLoader(TEMPLATE_DIR))
 
 
 #-----------------------------------------------------------------
@@ -28,7 +36,7 @@ def render_digest_html(digest: dict) -> str:
     Render digest into HTML using Jinja template.
     """
 
-    template = env.get_template("digest.html")
+    template = get_env().get_template("digest.html")
 
     unsubscribe_token = generate_unsubscribe_token(digest["user_email"])
     unsubscribe_url = f"{APP_BASE_URL}/unsubscribe?token={unsubscribe_token}"
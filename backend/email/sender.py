@@ -16,6 +16,7 @@ Supports:
 # Imports
 #----------------------------------------------------------------------------
 import smtplib
+import time
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
@@ -28,10 +29,15 @@ from backend.config import (
     FROM_EMAIL,
     REPLY_TO_EMAIL
 )
-from backend.utils.logger import get_logger
+from backend.utils.logger import get_logger, log_fields
+from backend.utils.metrics import counter, histogram
 
 logger = get_logger(__name__)
 
+EMAILS_SENT = counter("email_sent_total", "Emails accepted by the SMTP server.")
+EMAIL_FAILURES = counter("email_send_failures_total", "Emails that failed to send.")
+EMAIL_SEND_SECONDS = histogram("email_send_seconds", "Time to connect, authenticate and send one email.")
+
 
 #------------------------------------------------------------------------
 # Send Email
@@ -49,6 +55,7 @@ def send_email(to_email: str, subject: str, html_body: str) -> bool:
         True if email sent successfully, False otherwise.
     """
 
+    start = time.perf_counter()
     try:
         msg = MIMEMultipart("alternative")
         msg["From"] = FROM_EMAIL
@@ -66,11 +73,22 @@ def send_email(to_email: str, subject: str, html_body: str) -> bool:
         server.sendmail(FROM_EMAIL, to_email, msg.as_string())
         server.quit()
 
-        logger.info(f"Email sent sucessfully to {to_email}.")
+        EMAILS_SENT.inc()
+        logger.info(
+            "Email sent sucessfully.",
+            extra=log_fields(stage="send", email=to_email, duration=time.perf_counter() - start),
+        )
         return True
     
     except Exception as e:
-        logger.error(f"Failed to send email to {to_email}. Error: {e}.")
+        EMAIL_FAILURES.inc()
+        logger.error(
+            "Failed to send email. Error: %s.", e,
+            extra=log_fields(stage="send", email=to_email, duration=time.perf_counter() - start),
+        )
         return False
 
+    finally:
+        EMAIL_SEND_SECONDS.observe(time.perf_counter() - start)
+
     
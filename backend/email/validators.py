@@ -6,6 +6,7 @@ Utility function for validating email.
 """
 
 import re
+from typing import Iterable, List, Tuple
 
 
 EMAIL_REGEX = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
@@ -21,4 +22,21 @@ def is_valid_email(email: str) -> bool:
     """
     if not email:
         return False
-    return bool(EMAIL_REGEX.match(email.strip()))
\ No newline at end of file
+    return bool(EMAIL_REGEX.match(email.strip()))
+
+
+#------------------------------------------------------------------------
+# Batch Email Validation
+#------------------------------------------------------------------------
+def partition_valid_emails(emails: Iterable[str]) -> Tuple[List[str], List[str]]:
+    """
+    Validate a whole batch in one pass (used by bulk imports).
+    Returns (valid, rejected); valid emails are stripped and lower-cased.
+    """
+    match = EMAIL_REGEX.match
+    normalized = [(e or "").strip() for e in emails]
+    flags = [bool(e) and match(e) is not None for e in normalized]
+
+    valid = [e.lower() for e, ok in zip(normalized, flags) if ok]
+    rejected = [e for e, ok in zip(normalized, flags) if not ok]
+    return valid, rejected
@@ -0,0 +1,223 @@
+"""
+backend/news/clustering.py
+--------------------------
+
+Groups articles about the same event (story clusters) so each event is
+summarized once, with every publisher's link attached.
+
+Articles are vectorized from their title (weighted x2) and feed lead with
+hashed TF-IDF (CLUSTER_HASH_FEATURES buckets, no shared vocabulary), then
+assigned to the most similar existing cluster by cosine similarity, or
+start a new one below CLUSTER_SIMILARITY_THRESHOLD. Clustering is
+incremental: add() can be called again as more feeds arrive; cluster
+centroids and document frequencies are updated in place, and clusters keep
+their first article as the representative (unless promote() replaces a
+representative that could not be extracted), so earlier assignments (and
+the summaries keyed by them) stay valid.
+
+Usage:
+    clusterer = StoryClusterer()
+    clusterer.add(feed_articles)
+    lead = clusterer.representative(article)
+    others = clusterer.related(lead.url)
+"""
+
+
+#-------------------------------------------------------
+# Imports
+#-------------------------------------------------------
+from __future__ import annotations
+
+import re
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from backend.config import (
+    CLUSTER_HASH_FEATURES,
+    CLUSTER_MAX_RELATED,
+    CLUSTER_SIMILARITY_THRESHOLD,
+)
+from backend.ai.extractive import STOPWORDS
+from backend.news.records import RawArticle
+from backend.utils.metrics import counter, gauge
+
+ARTICLES_CLUSTERED = counter("story_cluster_articles_total", "Articles assigned to story clusters.", ["result"])
+CLUSTERS = gauge("story_clusters", "Distinct story clusters in the current run.")
+
+TOKEN_REGEX = re.compile(r"[a-z0-9][a-z0-9'-]+")
+LEAD_CHARS = 400
+TITLE_WEIGHT = 2
+
+
+#-------------------------------------------------------
+# Vectorizing
+#-------------------------------------------------------
+def _bucket(token: str, features: int) -> int:
+    # crc32 is stable across processes (unlike hash()).
+    return zlib.crc32(token.encode()) % features
+
+
+def _terms(article: RawArticle) -> List[str]:
+    title = [t for t in TOKEN_REGEX.findall(article.title.lower()) if t not in STOPWORDS]
+    lead = [t for t in TOKEN_REGEX.findall(article.description[:LEAD_CHARS].lower()) if t not in STOPWORDS]
+    return title * TITLE_WEIGHT + lead
+
+
+def _term_frequencies(articles: List[RawArticle], features: int):
+    """
+    Sublinear term-frequency matrix (articles x hashed features).
+    """
+    import numpy as np
+
+    rows, cols = [], []
+    for i, article in enumerate(articles):
+        for term in _terms(article):
+            rows.append(i)
+            cols.append(_bucket(term, features))
+
+    counts = np.zeros((len(articles), features), dtype=np.float32)
+    np.add.at(counts, (np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp)), 1.0)
+    return np.log1p(counts)
+
+
+def _normalize(matrix):
+    import numpy as np
+
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return matrix / np.where(norms == 0, 1.0, norms)
+
+
+#-------------------------------------------------------
+# Clusters
+#-------------------------------------------------------
+class StoryCluster:
+    """
+    Articles covering one event; the first article added is the representative.
+    """
+    __slots__ = ("index", "members")
+
+    def __init__(self, index: int, first: RawArticle):
+        self.index = index
+        self.members: List[RawArticle] = [first]
+
+    @property
+    def representative(self) -> RawArticle:
+        return self.members[0]
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+
+class StoryClusterer:
+    """
+    Incremental story clustering over hashed TF-IDF vectors (NumPy).
+    """
+
+    def __init__(
+        self,
+        threshold: float = CLUSTER_SIMILARITY_THRESHOLD,
+        features: int = CLUSTER_HASH_FEATURES,
+    ):
+        import numpy as np
+
+        self.threshold = threshold
+        self.features = features
+        self.clusters: List[StoryCluster] = []
+        self._by_url: Dict[str, StoryCluster] = {}
+        self._centroids = np.zeros((0, features), dtype=np.float32)  # summed tf vectors
+        self._df = np.zeros(features, dtype=np.float32)
+        self._docs = 0
+
+    def add(self, articles: Iterable[RawArticle]) -> None:
+        """
+        Assign new articles to clusters (articles already seen are ignored).
+        """
+        import numpy as np
+
+        batch, seen = [], set()
+        for article in articles:
+            if article.url not in self._by_url and article.url not in seen:
+                seen.add(article.url)
+                batch.append(article)
+        if not batch:
+            return
+
+        tf = _term_frequencies(batch, self.features)
+        self._df += (tf > 0).sum(axis=0)
+        self._docs += len(batch)
+        idf = np.log((1 + self._docs) / (1 + self._df)) + 1.0
+
+        vectors = _normalize(tf * idf)
+        k = len(self.clusters)
+        centroids = np.vstack([self._centroids[:k], np.zeros((len(batch), self.features), dtype=np.float32)])
+        weighted = np.zeros_like(centroids)
+        weighted[:k] = _normalize(centroids[:k] * idf)
+
+        for i, article in enumerate(batch):
+            best = -1
+            if k:
+                similarities = weighted[:k] @ vectors[i]
+                best = int(similarities.argmax())
+                if similarities[best] < self.threshold or not tf[i].any():
+                    best = -1
+
+            if best < 0:
+                best = k
+                self.clusters.append(StoryCluster(k, article))
+                k += 1
+                ARTICLES_CLUSTERED.inc(result="new")
+            else:
+                self.clusters[best].members.append(article)
+                ARTICLES_CLUSTERED.inc(result="joined")
+
+            centroids[best] += tf[i]
+            weighted[best] = _normalize(centroids[best] * idf)
+            self._by_url[article.url] = self.clusters[best]
+
+        self._centroids = centroids[:k]
+        CLUSTERS.set(k)
+
+    def cluster_for(self, url: str) -> Optional[StoryCluster]:
+        return self._by_url.get(url)
+
+    def representative(self, article: RawArticle) -> RawArticle:
+        """
+        The article that stands for this article's story (itself if unclustered).
+        """
+        cluster = self._by_url.get(article.url)
+        return cluster.representative if cluster else article
+
+    def promote(self, article: RawArticle) -> None:
+        """
+        Make the article its story's representative, e.g. when the current
+        representative's text could not be extracted.
+        """
+        cluster = self._by_url.get(article.url)
+        if cluster is not None and cluster.representative.url != article.url:
+            cluster.members.remove(next(a for a in cluster.members if a.url == article.url))
+            cluster.members.insert(0, article)
+
+    def related(self, url: str) -> Tuple[Tuple[str, str], ...]:
+        """
+        (source, url) of the other articles in the story, first seen first.
+        """
+        cluster = self._by_url.get(url)
+        if cluster is None:
+            return ()
+        return tuple((a.source, a.url) for a in cluster.members if a.url != url)
+
+    def other_reports(self, url: str, limit: int = CLUSTER_MAX_RELATED) -> str:
+        """
+        Feed leads of the other articles in the story, as extra LLM context.
+        """
+        cluster = self._by_url.get(url)
+        if cluster is None:
+            return ""
+        lines = [
+            f"- {a.source}: {a.title}. {a.description[:LEAD_CHARS]}".strip()
+            for a in cluster.members if a.url != url
+        ]
+        return "\n".join(lines[:limit])
+
+    def __len__(self) -> int:
+        return len(self.clusters)
@@ -6,23 +6,25 @@ Simple duplicate removal based on normalized text.
 
 """
 
-from typing import List, Dict
+from typing import Iterable, Iterator, TypeVar
+
+from backend.news.records import RawArticle, SummarizedArticle
+
+Article = TypeVar("Article", RawArticle, SummarizedArticle)
 
 #-------------------------------------------------------
 # DeDuplicate Articles
 #-------------------------------------------------------
-def deduplicate_articles(articles: List[Dict]) -> List[Dict]:
+def iter_unique_articles(articles: Iterable[Article]) -> Iterator[Article]:
     """
-    This function removes duplicate articles based on normalized text.
+    Lazily yield articles whose normalized title has not been seen yet.
+    Only the normalized titles are kept in memory.
     """
     seen = set()
-    unique_articles = []
 
     for article in articles:
-        key = article["title"].lower().strip()
+        key = article.title.lower().strip()
 
         if key not in seen:
-            unique_articles.append(article)
             seen.add(key)
-
-    return unique_articles
\ No newline at end of file
+            yield article
@@ -7,38 +7,56 @@ Extracts the full article content from a given news URL.
 This module:
 - Downloads article HTML
 - Extracts main textual content
-- Truncates text to a safe maximum length
+- Truncates text to a safe maximum length (memory cap; LLM input is sized
+  by backend/ai/budget.py)
 - Fails gracefully on errors
+- Skips hosts whose circuit breaker is open and uses per-host adaptive
+  timeouts (backend/news/health.py)
+- Downloads HTML through the shared HTTP client (backend/utils/http.py);
+  newspaper3k only parses it
+
+newspaper3k (and NLTK behind it) is imported on the first extraction.
 """
 
 # -------------------------------------------------------
 # Imports
 # -------------------------------------------------------
-from newspaper import Article
+import time
 
 from backend.config import MAX_ARTICLES_TEXT_CHARS
+from backend.news.health import SOURCE_HEALTH, host_of
+from backend.utils.http import ResponseTooLarge, get_text
 from backend.utils.logger import get_logger
+from backend.utils.metrics import counter, histogram
 
 logger = get_logger(__name__)
 
+BYTES_DOWNLOADED = counter("news_article_bytes_downloaded_total", "Article HTML bytes downloaded.")
+EXTRACT_FAILURES = counter("news_extract_failures_total", "Articles that could not be downloaded or parsed.")
+EXTRACT_EMPTY = counter("news_extract_empty_total", "Articles parsed without any extractable text.")
+EXTRACT_SECONDS = histogram("news_extract_seconds", "Time to download and parse one article.")
+EXTRACT_SKIPPED = counter("news_extract_skipped_total", "Articles skipped because their host's circuit is open.")
+
 
 # -------------------------------------------------------
 # Extract single article text
 # -------------------------------------------------------
-def extract_article_text(url: str) -> str:
+def extract_article_text(url: str, nlp: bool = True) -> str:
     """
     Extract full article text from a URL.
 
     Steps:
-    1. Download article using newspaper3k
+    1. Download article HTML with the shared HTTP client
     2. Parse main body text
-    3. Apply NLP processing (when available)
+    3. Apply NLP processing (when available and `nlp` is set)
     4. Truncate to MAX_ARTICLES_TEXT_CHARS
 
     Parameters
     ----------
     url : str
         News article URL
+    nlp : bool
+        Run article.nlp(); skipped by the pipeline when it is behind schedule
 
     Returns
     -------
@@ -46,25 +64,50 @@ def extract_article_text(url: str) -> str:
         Cleaned article text (possibly truncated),
         or empty string if extraction fails.
     """
+    host = host_of(url)
+    if not SOURCE_HEALTH.allow(host):
+        EXTRACT_SKIPPED.inc()
+        return ""
+
+    start = time.perf_counter()
     try:
-        article = Article(url, request_timeout=10)
-        article.download()
-        article.parse()
+        from newspaper import Article
 
-        # Improves content extraction for many sites
+        request_start = time.perf_counter()  # after the import: health counts only the request
         try:
-            article.nlp()
+            html = get_text(url, timeout=SOURCE_HEALTH.timeout_for(host))
+        except ResponseTooLarge:
+            raise  # the page, not the host, is the problem
         except Exception:
-            pass  # NLP is optional
+            SOURCE_HEALTH.record_failure(host)
+            raise
+        SOURCE_HEALTH.record_success(host, time.perf_counter() - request_start)
+        BYTES_DOWNLOADED.inc(len(html.encode("utf-8")))
+
+        article = Article(url)
+        article.download(input_html=html)
+        article.parse()
+
+        # Improves content extraction for many sites
+        if nlp:
+            try:
+                article.nlp()
+            except Exception:
+                pass  # NLP is optional
 
         text = article.text.strip()
 
         if not text:
+            EXTRACT_EMPTY.inc()
             logger.warning(f"No extractable text found for URL: {url}")
             return ""
 
         return text[:MAX_ARTICLES_TEXT_CHARS]
 
     except Exception as e:
+        EXTRACT_FAILURES.inc()
         logger.error(f"Failed to extract article from {url}: {e}")
         return ""
+
+    finally:
+        EXTRACT_SECONDS.observe(time.perf_counter() - start)
@@ -8,6 +8,12 @@ This module:
 - Fetches structured articles metadata.
 - Do not extracts full article content. This will be handled in backend/news/extractor.py
 - Do not summarize. This will be handled in 'ai/'.
+- Skips hosts whose circuit breaker is open and uses per-host adaptive
+  timeouts (backend/news/health.py).
+- Downloads feeds through the shared HTTP client (backend/utils/http.py);
+  feedparser only parses the bytes.
+- fetch_feed() fetches one publisher feed; the ingester's poll scheduler
+  (backend/news/scheduler.py) calls it per feed when the feed is due.
 
 Output of this module is the RAW article list used by the AI pipeline.
 """
@@ -16,35 +22,111 @@ Output of this module is the RAW article list used by the AI pipeline.
 #-------------------------------------------------------
 # Imports
 #-------------------------------------------------------
-import feedparser
-from typing import List, Dict
+import html
+import re
+import time
+from typing import List, Optional
+
+from backend.news.health import SOURCE_HEALTH, host_of
+from backend.news.records import RawArticle
 from backend.news.sources import NEWS_SOURCES
 from backend.config import MAX_ARTICLES_PER_SOURCE
+from backend.utils.http import ResponseTooLarge, get_bytes
 from backend.utils.logger import get_logger
+from backend.utils.metrics import counter, histogram
 
 logger = get_logger(__name__)
 
+FEEDS_FETCHED = counter("news_feeds_fetched_total", "RSS feeds fetched.", ["source"])
+FEED_ERRORS = counter("news_feed_errors_total", "RSS feeds that failed to fetch or parse.", ["source"])
+FEED_ENTRIES = counter("news_feed_entries_total", "Feed entries collected as raw articles.", ["source"])
+FEED_SECONDS = histogram("news_feed_fetch_seconds", "Time to fetch and parse one RSS feed.", ["source"])
+
+HTML_TAG_REGEX = re.compile(r"<[^>]+>")
+MAX_DESCRIPTION_CHARS = 1000
+
+
+def _entry_description(entry) -> str:
+    """
+    Plain-text teaser of a feed entry (summary/description without markup).
+    """
+    raw = entry.get("summary") or entry.get("description") or ""
+    text = html.unescape(HTML_TAG_REGEX.sub(" ", raw))
+    return " ".join(text.split())[:MAX_DESCRIPTION_CHARS]
+
+
+#-------------------------------------------------------
+# Fetch a single feed
+#-------------------------------------------------------
+def fetch_feed(
+    source_name: str,
+    topic: str,
+    feed_url: str,
+    max_per_source: Optional[int] = MAX_ARTICLES_PER_SOURCE,
+) -> Optional[List[RawArticle]]:
+    """
+    Fetches one publisher's RSS feed for a topic.
+
+    Returns the feed's entries as RawArticle records (at most max_per_source;
+    None keeps every entry), or None when the feed was skipped (circuit open)
+    or failed to fetch / parse. Failures are logged and counted here.
+    """
+    import feedparser
+
+    host = host_of(feed_url)
+    if not SOURCE_HEALTH.allow(host):
+        logger.warning(f"Skipping {source_name} feed for {topic}: circuit open for {host}")
+        return None
+
+    try:
+        with FEED_SECONDS.time(source=source_name):
+            start = time.perf_counter()
+            try:
+                data = get_bytes(feed_url, timeout=SOURCE_HEALTH.timeout_for(host))
+            except ResponseTooLarge:
+                raise
+            except Exception:
+                SOURCE_HEALTH.record_failure(host)
+                raise
+            SOURCE_HEALTH.record_success(host, time.perf_counter() - start)
+            feed = feedparser.parse(data)
+        FEEDS_FETCHED.inc(source=source_name)
+
+        entries = feed.entries[:max_per_source]
+        FEED_ENTRIES.inc(len(entries), source=source_name)
+
+        return [
+            RawArticle(
+                title=entry.get("title", "").strip(),
+                url=entry.get("link", "").strip(),
+                published=entry.get("published", ""),
+                source=source_name,
+                topic=topic,
+                description=_entry_description(entry),
+            )
+            for entry in entries
+        ]
+    except Exception as e:
+        FEED_ERRORS.inc(source=source_name)
+        logger.error(f"Failed to fetch {source_name} feed for {topic}: {e}")
+        return None
+
 
 #-------------------------------------------------------
 # Fetch Articles for sinlge topic
 #-------------------------------------------------------
-def fetch_articles_for_topic(topic: str) -> List[Dict]:
+def fetch_articles_for_topic(topic: str, max_per_source: Optional[int] = MAX_ARTICLES_PER_SOURCE) -> List[RawArticle]:
     """
     Fetches articles for a single topic from all trusted news sources.
 
     - Iterates through every trusted publisher. Checks if the publisher had the RSS feed for the particular topic.
-    - Extracts the limited number of articles from each sources. 
+    - Extracts the limited number of articles from each sources
+      (max_per_source; None keeps every entry, as the ingester does). 
     - Returns a list of articles metadata.
 
     Returns:
-        A list of article dictionaries. Each dictionary contains:
-        {
-            'title': str,
-            'url': str,
-            'published': str,
-            'source': str,
-            'topic': str,
-        }
+        A list of RawArticle records (see backend/news/records.py):
+            title, url, published, source, topic, description
     """
     articles = []
 
@@ -52,48 +134,6 @@ def fetch_articles_for_topic(topic: str) -> List[Dict]:
         feed_url = topics_map.get(topic)
         if not feed_url:
             continue
-
-        try:
-            feed = feedparser.parse(feed_url)
-
-            for entry in feed.entries[:MAX_ARTICLES_PER_SOURCE]:
-                articles.append({
-                    "title": entry.get("title", "").strip(),
-                    "url": entry.get("link", "").strip(),
-                    "published": entry.get("published", ""),
-                    "source": source_name,
-                    "topic": topic 
-                })
-        except Exception as e:
-            logger.error(f"Failed to fetch {source_name} feed for {topic}: {e}")
-
+        articles.extend(fetch_feed(source_name, topic, feed_url, max_per_source) or ())
 
     return articles
-
-
-#-------------------------------------------------------
-# Fetch articles for multiple topics
-#-------------------------------------------------------
-def fetch_articles_for_topics(topics: str) -> List[Dict]:
-    """
-    Fetches articles for multiple topics.
-
-    This function acts as a wrapper over 'fetch_articles_for_topic()' and 
-    is designed to support user personalization, where user can select multiple topics.
-
-    - Loops through each selected topics.
-    - Calls the single topic fetcher -> fetch_articles_for_topic()
-    - Combines all results into one unified list.
-
-    Example:
-    topics = ["Technology", "Business", "Politics"]
-    Returns a list containing articles from both categories.
-      
-    """
-
-    all_articles = []
-
-    for topic in topics:
-        all_articles.extend(fetch_articles_for_topic(topic))
-    
-    return all_articles
\ No newline at end of file
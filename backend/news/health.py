@@ -0,0 +1,235 @@
+"""
+backend/news/health.py
+----------------------
+
+Per-host health tracking for outbound fetches (feeds and articles).
+
+For every publisher host this keeps a rolling window of successful request
+latencies and of request outcomes, and derives:
+- an adaptive timeout: p95 latency x SOURCE_TIMEOUT_P95_MULTIPLIER, clamped
+  to [HTTP_TIMEOUT_MIN_SECONDS, HTTP_TIMEOUT_MAX_SECONDS];
+- a circuit breaker: after repeated failures the host is skipped until its
+  cool-down ends, then one trial request decides whether it stays open.
+
+State lives in memory during a run (SOURCE_HEALTH) and is loaded from /
+saved to the source_health table by load_source_health() / save_source_health().
+
+Usage:
+    host = host_of(url)
+    if SOURCE_HEALTH.allow(host):
+        timeout = SOURCE_HEALTH.timeout_for(host)
+        ... SOURCE_HEALTH.record_success(host, seconds) / record_failure(host)
+"""
+
+
+#-------------------------------------------------------
+# Imports
+#-------------------------------------------------------
+from __future__ import annotations
+
+import math
+import threading
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Deque, Dict, Optional
+from urllib.parse import urlsplit
+
+import pytz
+
+from backend.config import (
+    HTTP_TIMEOUT_MAX_SECONDS,
+    HTTP_TIMEOUT_MIN_SECONDS,
+    HTTP_TIMEOUT_SECONDS,
+    SOURCE_BREAKER_COOLDOWN_SECONDS,
+    SOURCE_BREAKER_FAILURE_RATE,
+    SOURCE_BREAKER_FAILURES,
+    SOURCE_HEALTH_MIN_SAMPLES,
+    SOURCE_HEALTH_WINDOW,
+    SOURCE_TIMEOUT_P95_MULTIPLIER,
+)
+from backend.utils.logger import get_logger
+from backend.utils.metrics import counter
+from backend.utils.time_utils import utc_now
+
+logger = get_logger(__name__)
+
+BREAKER_TRIPS = counter("source_circuit_trips_total", "Times a host's circuit breaker opened.", ["host"])
+REQUESTS_SKIPPED = counter("source_requests_skipped_total", "Requests skipped because the host's circuit is open.", ["host"])
+
+
+def host_of(url: str) -> str:
+    """
+    Hostname of a URL without a leading 'www.'.
+    """
+    host = (urlsplit(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+#-------------------------------------------------------
+# Host state
+#-------------------------------------------------------
+class _HostState:
+    __slots__ = ("latencies", "outcomes", "consecutive_failures", "open_until", "probe_until", "dirty")
+
+    def __init__(self, window: int):
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.outcomes: Deque[int] = deque(maxlen=window)
+        self.consecutive_failures = 0
+        self.open_until: Optional[datetime] = None
+        self.probe_until: Optional[datetime] = None  # half-open trial in flight
+        self.dirty = False
+
+    def p95(self) -> float:
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+
+    def failure_rate(self) -> float:
+        return 1 - sum(self.outcomes) / len(self.outcomes) if self.outcomes else 0.0
+
+
+#-------------------------------------------------------
+# Tracker
+#-------------------------------------------------------
+class SourceHealthTracker:
+    """
+    Thread-safe per-host latency/failure tracking with a circuit breaker.
+    """
+
+    def __init__(self, window: int = SOURCE_HEALTH_WINDOW):
+        self.window = window
+        self._hosts: Dict[str, _HostState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(self.window)
+        return state
+
+    # ---------------- decisions ----------------
+    def allow(self, host: str) -> bool:
+        """
+        False while the host's circuit is open (the request should be skipped).
+        """
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None or state.open_until is None:
+                return True
+            now = utc_now()
+            if now >= state.open_until and (state.probe_until is None or now >= state.probe_until):
+                # Half-open: admit one trial request; its outcome closes or
+                # re-opens the circuit. A trial that never reports back
+                # expires after a cool-down and another one is admitted.
+                state.probe_until = now + timedelta(seconds=SOURCE_BREAKER_COOLDOWN_SECONDS)
+                return True
+
+        REQUESTS_SKIPPED.inc(host=host)
+        return False
+
+    def timeout_for(self, host: str) -> float:
+        """
+        Request timeout for the host, from its observed p95 latency.
+        """
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None or len(state.latencies) < SOURCE_HEALTH_MIN_SAMPLES:
+                return HTTP_TIMEOUT_SECONDS
+            timeout = state.p95() * SOURCE_TIMEOUT_P95_MULTIPLIER
+
+        return min(HTTP_TIMEOUT_MAX_SECONDS, max(HTTP_TIMEOUT_MIN_SECONDS, timeout))
+
+    # ---------------- observations ----------------
+    def record_success(self, host: str, seconds: float) -> None:
+        with self._lock:
+            state = self._state(host)
+            state.latencies.append(seconds)
+            state.outcomes.append(1)
+            state.consecutive_failures = 0
+            state.open_until = None
+            state.probe_until = None
+            state.dirty = True
+
+    def record_failure(self, host: str) -> None:
+        with self._lock:
+            state = self._state(host)
+            state.outcomes.append(0)
+            state.consecutive_failures += 1
+            state.dirty = True
+
+            probe_failed = state.probe_until is not None
+            tripped = probe_failed or state.consecutive_failures >= SOURCE_BREAKER_FAILURES or (
+                len(state.outcomes) >= SOURCE_HEALTH_MIN_SAMPLES
+                and state.failure_rate() > SOURCE_BREAKER_FAILURE_RATE
+            )
+            if not tripped or (state.open_until is not None and not probe_failed):
+                return
+            state.open_until = utc_now() + timedelta(seconds=SOURCE_BREAKER_COOLDOWN_SECONDS)
+            state.probe_until = None
+
+        BREAKER_TRIPS.inc(host=host)
+        logger.warning(f"Circuit open for {host} for {SOURCE_BREAKER_COOLDOWN_SECONDS}s")
+
+    # ---------------- persistence ----------------
+    def load(self, rows) -> None:
+        """
+        Replace the in-memory state with SourceHealth rows.
+        """
+        with self._lock:
+            self._hosts.clear()
+            for row in rows:
+                state = self._state(row.host)
+                state.latencies.extend(row.latencies or [])
+                state.outcomes.extend(row.outcomes or [])
+                state.consecutive_failures = row.consecutive_failures or 0
+                open_until = row.open_until
+                if open_until is not None and open_until.tzinfo is None:
+                    open_until = pytz.utc.localize(open_until)  # SQLite drops tzinfo
+                state.open_until = open_until
+
+    def dirty_rows(self) -> list:
+        """
+        Changed hosts as source_health rows; clears the changed flags.
+        """
+        with self._lock:
+            rows = []
+            for host, state in self._hosts.items():
+                if not state.dirty:
+                    continue
+                rows.append({
+                    "host": host,
+                    "latencies": [round(s, 3) for s in state.latencies],
+                    "outcomes": list(state.outcomes),
+                    "consecutive_failures": state.consecutive_failures,
+                    "open_until": state.open_until,
+                })
+                state.dirty = False
+            return rows
+
+
+SOURCE_HEALTH = SourceHealthTracker()
+
+
+#-------------------------------------------------------
+# Database sync
+#-------------------------------------------------------
+def load_source_health() -> None:
+    """
+    Load persisted host health (call at the start of a run).
+    """
+    from backend.db import crud
+    from backend.db.connection import get_session
+
+    with get_session() as db:
+        SOURCE_HEALTH.load(crud.get_source_health(db))
+
+
+def save_source_health() -> int:
+    """
+    Persist hosts whose health changed during the run. Returns rows written.
+    """
+    from backend.db import crud
+    from backend.db.connection import get_session
+
+    rows = SOURCE_HEALTH.dirty_rows()
+    with get_session() as db:
+        return crud.save_source_health(db, rows)
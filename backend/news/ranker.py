@@ -4,15 +4,20 @@ backend/news/ranker.py
 
 Rank artilces by simple heuristics.
 """
-from typing import List, Dict
+import heapq
+from typing import Iterable, List
+
+from backend.news.records import SummarizedArticle
 
 #-------------------------------------------------------
 # Rank Articles
 #-------------------------------------------------------
-def rank_articles(articles: List[Dict], top_n: int = 15):
+def rank_articles(articles: Iterable[SummarizedArticle], top_n: int = 15) -> List[SummarizedArticle]:
     """
     Basic Ranking:
     - Longer Titles slightly prioritized.
     - Can later includes recency, source weight etc.
+
+    Accepts any iterable; only the current top_n articles are held in memory.
     """
-    return sorted(articles, key=lambda x: len(x["title"]), reverse=True)[: top_n]
\ No newline at end of file
+    return heapq.nlargest(top_n, articles, key=lambda x: len(x.title))
@@ -0,0 +1,127 @@
+"""
+backend/news/records.py
+-----------------------
+
+Compact record types for articles flowing through the pipeline.
+
+- RawArticle: feed metadata (and the feed's short description) produced
+  by backend/news/fetcher.py.
+- SummarizedArticle: RawArticle metadata + AI summary, consumed by the
+  ranker, the digest builder and the Jinja template. related holds the
+  (source, url) of other publishers' coverage of the same story.
+
+Both are frozen, slotted dataclasses (no per-instance __dict__), and the
+low-cardinality strings (source, topic, category) are interned so tens of
+thousands of articles share a handful of string objects.
+
+The template reads fields as attributes (article.title, article.bullets),
+so records can be passed to Jinja directly; to_dict() is the adapter for
+JSON/persistence and any dict-based consumer.
+"""
+
+
+#-------------------------------------------------------
+# Imports
+#-------------------------------------------------------
+from __future__ import annotations
+
+import sys
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Tuple
+
+
+#-------------------------------------------------------
+# Raw Article
+#-------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class RawArticle:
+    """
+    Article metadata from an RSS feed (no body text). description is the
+    feed's own teaser text, used when full extraction is skipped.
+    """
+    title: str
+    url: str
+    published: str
+    source: str
+    topic: str
+    description: str = ""
+
+    def __post_init__(self):
+        object.__setattr__(self, "source", sys.intern(self.source))
+        object.__setattr__(self, "topic", sys.intern(self.topic))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RawArticle":
+        return cls(
+            title=data.get("title", ""),
+            url=data.get("url", ""),
+            published=data.get("published", ""),
+            source=data.get("source", ""),
+            topic=data.get("topic", ""),
+            description=data.get("description", ""),
+        )
+
+
+#-------------------------------------------------------
+# Summarized Article
+#-------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class SummarizedArticle:
+    """
+    Article metadata plus the structured AI summary.
+    """
+    title: str
+    url: str
+    source: str
+    topic: str
+    bullets: Tuple[str, ...]
+    summary: str
+    category: str
+    importance_score: int
+    related: Tuple[Tuple[str, str], ...] = ()
+
+    def __post_init__(self):
+        object.__setattr__(self, "source", sys.intern(self.source))
+        object.__setattr__(self, "topic", sys.intern(self.topic))
+        object.__setattr__(self, "category", sys.intern(str(self.category)))
+        object.__setattr__(self, "bullets", tuple(self.bullets))
+        object.__setattr__(self, "related", tuple((sys.intern(s), u) for s, u in self.related))
+
+    @classmethod
+    def from_ai_result(cls, article: RawArticle, ai_result: Dict[str, Any]) -> "SummarizedArticle":
+        """
+        Combine feed metadata with the summarizer's output dict.
+        """
+        return cls(
+            title=article.title,
+            url=article.url,
+            source=article.source,
+            topic=article.topic,
+            bullets=ai_result.get("bullets", []),
+            summary=ai_result.get("summary", ""),
+            category=ai_result.get("category", article.topic),
+            importance_score=ai_result.get("importance_score", 3),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["bullets"] = list(self.bullets)
+        data["related"] = [list(r) for r in self.related]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SummarizedArticle":
+        return cls(
+            title=data.get("title", ""),
+            url=data.get("url", ""),
+            source=data.get("source", ""),
+            topic=data.get("topic", ""),
+            bullets=data.get("bullets", []),
+            summary=data.get("summary", ""),
+            category=data.get("category", data.get("topic", "")),
+            importance_score=data.get("importance_score", 3),
+            related=data.get("related", ()),
+        )
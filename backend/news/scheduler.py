@@ -0,0 +1,297 @@
+"""
+backend/news/scheduler.py
+-------------------------
+
+Adaptive per-feed poll scheduling for the ingester (jobs/ingester.py).
+
+Feeds publish at very different rates (a national feed every few minutes,
+a technology feed hourly), so each feed in NEWS_SOURCES gets its own poll
+interval instead of one fixed INGEST_INTERVAL_SECONDS:
+- the publish gap is learned from entry timestamps on every poll (mean gap
+  of the newest CADENCE_ENTRIES entries, smoothed by FEED_CADENCE_SMOOTHING);
+- the interval is publish gap x FEED_POLL_ITEMS_PER_POLL, grown by
+  FEED_POLL_BACKOFF after polls that found nothing new or failed, and
+  clamped to [FEED_POLL_MIN_SECONDS, FEED_POLL_MAX_SECONDS];
+- each next poll time gets +/- FEED_POLL_JITTER random jitter, and new
+  feeds are staggered over the first FEED_POLL_MIN_SECONDS, so polls (and
+  requests to the same host) do not arrive in bursts.
+
+State lives in memory (FEED_SCHEDULE) and is loaded from / saved to the
+feed_schedule table by load_feed_schedule() / save_feed_schedule(), with
+per-feed poll and new-item counts (python -m jobs.ingester --stats).
+
+Usage:
+    FEED_SCHEDULE.sync(iter_feeds(topics))
+    for feed in FEED_SCHEDULE.due():
+        ... FEED_SCHEDULE.record(feed, published_times, new_items)
+"""
+
+
+#-------------------------------------------------------
+# Imports
+#-------------------------------------------------------
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+import pytz
+
+from backend.config import (
+    FEED_CADENCE_SMOOTHING,
+    FEED_POLL_BACKOFF,
+    FEED_POLL_ITEMS_PER_POLL,
+    FEED_POLL_JITTER,
+    FEED_POLL_MAX_SECONDS,
+    FEED_POLL_MIN_SECONDS,
+)
+from backend.utils.logger import get_logger
+from backend.utils.metrics import counter, gauge
+from backend.utils.time_utils import utc_now
+
+logger = get_logger(__name__)
+
+FEED_POLLS = counter("feed_polls_total", "Scheduled feed polls, by outcome (new, empty, failed).", ["source", "topic", "result"])
+FEED_NEW_ITEMS = counter("feed_new_items_total", "New entries found by scheduled feed polls.", ["source", "topic"])
+FEED_POLL_INTERVAL = gauge("feed_poll_interval_seconds", "Current poll interval of each feed.", ["source", "topic"])
+
+CADENCE_ENTRIES = 20
+
+
+@dataclass(frozen=True)
+class Feed:
+    source: str
+    topic: str
+    url: str
+
+
+def iter_feeds(topics: Optional[Iterable[str]] = None) -> List[Feed]:
+    """
+    Every (publisher, topic) feed in NEWS_SOURCES, optionally for some topics only.
+    """
+    from backend.news.sources import NEWS_SOURCES
+
+    wanted = set(topics) if topics else None
+    return [
+        Feed(source, topic, url)
+        for source, feeds in NEWS_SOURCES.items()
+        for topic, url in feeds.items()
+        if wanted is None or topic in wanted
+    ]
+
+
+def _aware(value: Optional[datetime]) -> Optional[datetime]:
+    if value is not None and value.tzinfo is None:
+        return pytz.utc.localize(value)  # SQLite drops tzinfo
+    return value
+
+
+def publish_gap(published: Iterable[datetime], now: datetime) -> Optional[float]:
+    """
+    Mean seconds between the newest CADENCE_ENTRIES distinct entry times,
+    or None when fewer than two usable timestamps exist.
+    """
+    times = sorted({t for t in published if t <= now}, reverse=True)[:CADENCE_ENTRIES]
+    if len(times) < 2:
+        return None
+    return (times[0] - times[-1]).total_seconds() / (len(times) - 1)
+
+
+#-------------------------------------------------------
+# Feed state
+#-------------------------------------------------------
+class _FeedState:
+    __slots__ = (
+        "feed", "publish_gap", "interval", "next_poll_at", "last_polled_at", "last_new_at",
+        "polls", "empty_polls", "failed_polls", "new_items", "dirty",
+    )
+
+    def __init__(self, feed: Feed, next_poll_at: datetime):
+        self.feed = feed
+        self.publish_gap: Optional[float] = None
+        self.interval: float = FEED_POLL_MIN_SECONDS
+        self.next_poll_at = next_poll_at
+        self.last_polled_at: Optional[datetime] = None
+        self.last_new_at: Optional[datetime] = None
+        self.polls = 0
+        self.empty_polls = 0
+        self.failed_polls = 0
+        self.new_items = 0
+        self.dirty = True
+
+
+#-------------------------------------------------------
+# Scheduler
+#-------------------------------------------------------
+class FeedScheduler:
+    """
+    Per-feed poll intervals learned from publish cadence, with jitter and bounds.
+    """
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        self._feeds: Dict[str, _FeedState] = {}
+        self._active: List[str] = []
+        self._rng = rng or random.Random()
+
+    # ---------------- feeds ----------------
+    def sync(self, feeds: Iterable[Feed], now: Optional[datetime] = None) -> None:
+        """
+        Set the feeds to poll. Feeds without a schedule are spread evenly
+        over the next FEED_POLL_MIN_SECONDS.
+        """
+        now = now or utc_now()
+        feeds = list(feeds)
+        new = [feed for feed in feeds if feed.url not in self._feeds]
+        for i, feed in enumerate(new):
+            offset = FEED_POLL_MIN_SECONDS * i / len(new)
+            self._feeds[feed.url] = _FeedState(feed, now + timedelta(seconds=offset))
+        self._active = [feed.url for feed in feeds]
+
+    def due(self, now: Optional[datetime] = None) -> List[Feed]:
+        """
+        Active feeds whose next poll time has passed, most overdue first.
+        """
+        now = now or utc_now()
+        states = [self._feeds[url] for url in self._active]
+        return [s.feed for s in sorted(states, key=lambda s: s.next_poll_at) if s.next_poll_at <= now]
+
+    def seconds_until_next(self, now: Optional[datetime] = None) -> float:
+        """
+        Seconds until the next active feed is due (0 when one is due now).
+        """
+        now = now or utc_now()
+        if not self._active:
+            return float(FEED_POLL_MAX_SECONDS)
+        soonest = min(self._feeds[url].next_poll_at for url in self._active)
+        return max(0.0, (soonest - now).total_seconds())
+
+    # ---------------- observations ----------------
+    def record(
+        self,
+        feed: Feed,
+        published: Optional[List[datetime]],
+        new_items: int,
+        now: Optional[datetime] = None,
+    ) -> float:
+        """
+        Update a feed after a poll and schedule its next one.
+        published: entry timestamps of the poll (None when the fetch failed).
+        Returns the new interval in seconds (before jitter).
+        """
+        now = now or utc_now()
+        state = self._feeds.get(feed.url)
+        if state is None:
+            state = self._feeds[feed.url] = _FeedState(feed, now)
+
+        state.polls += 1
+        state.last_polled_at = now
+        interval = state.interval
+
+        if published is None:
+            state.failed_polls += 1
+            result = "failed"
+            interval *= FEED_POLL_BACKOFF
+        else:
+            gap = publish_gap(published, now)
+            if gap is not None:
+                state.publish_gap = gap if state.publish_gap is None else (
+                    FEED_CADENCE_SMOOTHING * gap + (1 - FEED_CADENCE_SMOOTHING) * state.publish_gap
+                )
+            if state.publish_gap is not None:
+                interval = state.publish_gap * FEED_POLL_ITEMS_PER_POLL
+
+            if new_items:
+                state.new_items += new_items
+                state.last_new_at = now
+                result = "new"
+            else:
+                state.empty_polls += 1
+                result = "empty"
+                interval = max(interval, state.interval * FEED_POLL_BACKOFF)
+
+        state.interval = min(FEED_POLL_MAX_SECONDS, max(FEED_POLL_MIN_SECONDS, interval))
+        jitter = 1 + self._rng.uniform(-FEED_POLL_JITTER, FEED_POLL_JITTER)
+        state.next_poll_at = now + timedelta(seconds=state.interval * jitter)
+        state.dirty = True
+
+        FEED_POLLS.inc(source=feed.source, topic=feed.topic, result=result)
+        if new_items:
+            FEED_NEW_ITEMS.inc(new_items, source=feed.source, topic=feed.topic)
+        FEED_POLL_INTERVAL.set(state.interval, source=feed.source, topic=feed.topic)
+        return state.interval
+
+    # ---------------- persistence ----------------
+    def load(self, rows) -> None:
+        """
+        Replace the in-memory state with FeedSchedule rows.
+        """
+        self._feeds.clear()
+        for row in rows:
+            state = _FeedState(Feed(row.source, row.topic, row.feed_url), _aware(row.next_poll_at))
+            state.publish_gap = row.publish_gap_seconds
+            state.interval = row.interval_seconds
+            state.last_polled_at = _aware(row.last_polled_at)
+            state.last_new_at = _aware(row.last_new_at)
+            state.polls = row.polls or 0
+            state.empty_polls = row.empty_polls or 0
+            state.failed_polls = row.failed_polls or 0
+            state.new_items = row.new_items or 0
+            state.dirty = False
+            self._feeds[row.feed_url] = state
+        self._active = [url for url in self._active if url in self._feeds]
+
+    def dirty_rows(self) -> list:
+        """
+        Changed feeds as feed_schedule rows; clears the changed flags.
+        """
+        rows = []
+        for url, state in self._feeds.items():
+            if not state.dirty:
+                continue
+            rows.append({
+                "feed_url": url,
+                "source": state.feed.source,
+                "topic": state.feed.topic,
+                "publish_gap_seconds": state.publish_gap,
+                "interval_seconds": state.interval,
+                "next_poll_at": state.next_poll_at,
+                "last_polled_at": state.last_polled_at,
+                "last_new_at": state.last_new_at,
+                "polls": state.polls,
+                "empty_polls": state.empty_polls,
+                "failed_polls": state.failed_polls,
+                "new_items": state.new_items,
+            })
+            state.dirty = False
+        return rows
+
+
+FEED_SCHEDULE = FeedScheduler()
+
+
+#-------------------------------------------------------
+# Database sync
+#-------------------------------------------------------
+def load_feed_schedule() -> None:
+    """
+    Load persisted feed schedules (call when the ingester starts).
+    """
+    from backend.db import crud
+    from backend.db.connection import get_session
+
+    with get_session() as db:
+        FEED_SCHEDULE.load(crud.get_feed_schedules(db))
+
+
+def save_feed_schedule() -> int:
+    """
+    Persist feeds whose schedule changed. Returns rows written.
+    """
+    from backend.db import crud
+    from backend.db.connection import get_session
+
+    rows = FEED_SCHEDULE.dirty_rows()
+    with get_session() as db:
+        return crud.save_feed_schedules(db, rows)
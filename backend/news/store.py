@@ -0,0 +1,324 @@
+"""
+backend/news/store.py
+---------------------
+
+Persistent article store, filled between sends by the ingester (jobs/ingester.py).
+
+- ArticleIngester.poll(): fetch every entry of every feed in NEWS_SOURCES and
+  insert the unseen ones (keyed by canonical URL hash), clustering them into
+  stories as they arrive (backend/news/clustering.py).
+- ArticleIngester.poll_due(): the same for only the feeds that are due on
+  their adaptive schedule (backend/news/scheduler.py).
+- ArticleIngester.process(): extract, clean and summarize new story
+  representatives, a batch at a time; other members of a story are marked
+  'clustered' and linked from the representative's summary.
+- load_stored_articles(): a topic's summarized articles of the last
+  ARTICLE_STORE_WINDOW_HOURS for digest building (one indexed query), or
+  None when the ingester has not polled the topic recently, in which case
+  the pipeline fetches live.
+- preview_digest(): a digest built from stored and archived summaries for
+  any topics and day, without running the pipeline.
+"""
+
+
+#-------------------------------------------------------
+# Imports
+#-------------------------------------------------------
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from functools import partial
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import pytz
+
+from backend.config import (
+    ARTICLE_STORE_MAX_STALENESS_MINUTES,
+    ARTICLE_STORE_WINDOW_HOURS,
+    INGEST_BATCH_SIZE,
+)
+from backend.db import crud
+from backend.db.connection import get_session
+from backend.news.clustering import StoryClusterer
+from backend.news.records import RawArticle, SummarizedArticle
+from backend.utils.logger import get_logger
+from backend.utils.metrics import counter
+from backend.utils.security import hash_url
+from backend.utils.time_utils import utc_now
+
+logger = get_logger(__name__)
+
+ARTICLES_INGESTED = counter("ingest_articles_total", "New feed entries stored by the ingester.", ["topic"])
+ARTICLES_PROCESSED = counter("ingest_articles_processed_total", "Stored articles processed, by outcome.", ["status"])
+
+TRACKING_PREFIXES = ("utm_",)
+TRACKING_PARAMS = frozenset({"fbclid", "gclid", "dclid", "msclkid", "ref", "ref_src", "cmp", "cmpid", "ito", "mc_cid", "mc_eid"})
+
+
+#-------------------------------------------------------
+# Keys and dates
+#-------------------------------------------------------
+def canonical_url(url: str) -> str:
+    """
+    URL without fragment, tracking parameters, 'www.' or a trailing slash.
+    """
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    host = host[4:] if host.startswith("www.") else host
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES)
+    ]
+    return urlunsplit(("https" if parts.scheme in ("http", "https") else parts.scheme, host, parts.path.rstrip("/"), urlencode(query), ""))
+
+
+def article_hash(url: str) -> str:
+    return hash_url(canonical_url(url))
+
+
+def parse_published(value: str, default: Optional[datetime]) -> Optional[datetime]:
+    """
+    Feed publish date (RFC 822 or ISO 8601) as an aware UTC datetime.
+    """
+    if value:
+        for parse in (parsedate_to_datetime, datetime.fromisoformat):
+            try:
+                parsed = parse(value)
+            except (TypeError, ValueError, IndexError):
+                continue
+            if parsed.tzinfo is None:
+                parsed = pytz.utc.localize(parsed)
+            return parsed.astimezone(pytz.utc)
+    return default
+
+
+def _raw(row) -> RawArticle:
+    return RawArticle(
+        title=row.title,
+        url=row.url,
+        published=row.published_at.isoformat() if row.published_at else "",
+        source=row.source,
+        topic=row.topic,
+        description=row.description or "",
+    )
+
+
+#-------------------------------------------------------
+# Ingester
+#-------------------------------------------------------
+@dataclass
+class IngestReport:
+    new: int = 0
+    summarized: int = 0
+    clustered: int = 0
+    failed: int = 0
+
+
+class ArticleIngester:
+    """
+    Incremental feed ingestion with per-topic story clustering.
+    Story assignments are rebuilt from the store on start (seed()).
+    """
+
+    def __init__(self, topics: Optional[Iterable[str]] = None):
+        from backend.news.sources import NEWS_SOURCES
+
+        self.topics = list(topics) if topics else sorted({t for feeds in NEWS_SOURCES.values() for t in feeds})
+        self.stories: Dict[str, StoryClusterer] = {}
+        self._story_of: Dict[str, str] = {}  # url -> story_hash
+
+    def seed(self) -> int:
+        """
+        Re-cluster the stored articles of the current window (oldest first).
+        """
+        since = utc_now() - timedelta(hours=ARTICLE_STORE_WINDOW_HOURS)
+        with get_session() as db:
+            rows = crud.get_articles_since(db, since)
+
+        by_topic: Dict[str, List[RawArticle]] = {}
+        for row in rows:
+            by_topic.setdefault(row.topic, []).append(_raw(row))
+            self._story_of[row.url] = row.story_hash
+        for topic, articles in by_topic.items():
+            self.stories.setdefault(topic, StoryClusterer()).add(articles)
+        return len(rows)
+
+    def _story_hash(self, article: RawArticle, url_hash: str) -> str:
+        stories = self.stories.setdefault(article.topic, StoryClusterer())
+        stories.add([article])
+        lead = stories.representative(article)
+        return self._story_of.setdefault(lead.url, url_hash if lead.url == article.url else article_hash(lead.url))
+
+    def _store(self, topic: str, articles: Iterable[RawArticle], now: datetime) -> int:
+        """
+        Insert the unseen articles and refresh last_seen_at of known ones.
+        Returns the number inserted.
+        """
+        articles = {article_hash(a.url): a for a in articles if a.url}
+
+        with get_session() as db:
+            known = crud.get_article_story_hashes(db, list(articles))
+            crud.touch_articles(db, list(known), now)
+
+            rows = []
+            for url_hash, article in articles.items():
+                if url_hash in known:
+                    continue
+                rows.append({
+                    "url_hash": url_hash,
+                    "story_hash": self._story_hash(article, url_hash),
+                    "url": article.url,
+                    "title": article.title,
+                    "source": article.source,
+                    "topic": topic,
+                    "description": article.description,
+                    "published_at": parse_published(article.published, now),
+                    "first_seen_at": now,
+                    "last_seen_at": now,
+                    "status": "new",
+                })
+            inserted = crud.insert_articles(db, rows)
+
+        ARTICLES_INGESTED.inc(inserted, topic=topic)
+        return inserted
+
+    def poll(self, fetch=None) -> int:
+        """
+        Fetch all feeds and store unseen entries. Returns the number stored.
+        """
+        if fetch is None:
+            from backend.news.fetcher import fetch_articles_for_topic as fetch
+
+        return sum(self._store(topic, fetch(topic, max_per_source=None), utc_now()) for topic in self.topics)
+
+    def poll_due(self, scheduler, fetch=None) -> int:
+        """
+        Fetch only the feeds the scheduler says are due, store unseen entries
+        and report each feed's entry times and new-item count back to it.
+        Returns the number stored.
+        """
+        if fetch is None:
+            from backend.news.fetcher import fetch_feed as fetch
+
+        stored = 0
+        for feed in scheduler.due():
+            articles = fetch(feed.source, feed.topic, feed.url, max_per_source=None)
+            now = utc_now()
+            if articles is None:
+                scheduler.record(feed, None, 0, now)
+                continue
+
+            inserted = self._store(feed.topic, articles, now)
+            published = [parse_published(a.published, None) for a in articles]
+            scheduler.record(feed, [t for t in published if t is not None], inserted, now)
+            stored += inserted
+        return stored
+
+    def process(self, limit: int = INGEST_BATCH_SIZE) -> IngestReport:
+        """
+        Summarize up to `limit` new articles; non-representatives are only
+        marked 'clustered'.
+        """
+        from backend.ai.summarizer import summarize_article
+        from backend.db.writers import LlmUsageWriter
+        from backend.news.cleaner import clean_text
+        from backend.news.extractor import extract_article_text
+
+        report = IngestReport()
+        with get_session() as db:
+            pending = crud.get_articles_by_status(db, "new", limit)
+
+        with LlmUsageWriter(f"ingest-{utc_now().date().isoformat()}") as usage:
+            for row in pending:
+                if row.story_hash != row.url_hash:
+                    status, summary = "clustered", None
+                else:
+                    text = extract_article_text(row.url)
+                    cleaned = clean_text(text, row.source) if text else ""
+                    if not cleaned:
+                        status, summary = "failed", None
+                    else:
+                        stories = self.stories.get(row.topic)
+                        summary = summarize_article(
+                            cleaned,
+                            on_usage=partial(usage.record, row.url_hash),
+                            other_reports=stories.other_reports(row.url) if stories else "",
+                            topic=row.topic,
+                        )
+                        status = "summarized"
+
+                with get_session() as db:
+                    crud.update_article(db, row.url_hash, status=status, summary=summary)
+                ARTICLES_PROCESSED.inc(status=status)
+                setattr(report, status, getattr(report, status) + 1)
+
+        return report
+
+
+#-------------------------------------------------------
+# Digest input
+#-------------------------------------------------------
+def load_stored_articles(
+    topic: str,
+    until: Optional[datetime] = None,
+    require_fresh: bool = True,
+    statuses: Iterable[str] = ("summarized",),
+) -> Optional[List[SummarizedArticle]]:
+    """
+    Summarized articles of the topic from the ARTICLE_STORE_WINDOW_HOURS
+    before `until` (default now), newest first, with other sources of each
+    story attached. With require_fresh, None when the ingester has not
+    polled the topic within ARTICLE_STORE_MAX_STALENESS_MINUTES.
+    """
+    now = utc_now()
+    with get_session() as db:
+        if require_fresh:
+            last_seen = crud.get_topic_last_seen(db, topic)
+            if last_seen is None:
+                return None
+            if last_seen.tzinfo is None:
+                last_seen = pytz.utc.localize(last_seen)  # SQLite drops tzinfo
+            if now - last_seen > timedelta(minutes=ARTICLE_STORE_MAX_STALENESS_MINUTES):
+                return None
+
+        until = until or now
+        rows = crud.get_recent_summarized_articles(
+            db, topic, until - timedelta(hours=ARTICLE_STORE_WINDOW_HOURS), until, tuple(statuses)
+        )
+        members = crud.get_story_members(db, [row.story_hash for row in rows])
+
+    related: Dict[str, List] = {}
+    for member in members:
+        if member.url_hash != member.story_hash:
+            related.setdefault(member.story_hash, []).append((member.source, member.url))
+
+    return [
+        replace(
+            SummarizedArticle.from_ai_result(_raw(row), row.summary or {}),
+            related=tuple(related.get(row.story_hash, ())),
+        )
+        for row in rows
+    ]
+
+
+def preview_digest(topics: List[str], until: Optional[datetime] = None) -> Dict:
+    """
+    Digest for the given topics from stored and archived summaries,
+    as the pipeline would build it (dedup, rank, per-topic sections).
+    """
+    from types import SimpleNamespace
+
+    from backend.digest.builder import build_digest_for_user
+    from backend.news.dedup import iter_unique_articles
+    from backend.news.ranker import rank_articles
+
+    articles = [
+        article
+        for topic in topics
+        for article in load_stored_articles(topic, until, require_fresh=False, statuses=("summarized", "archived")) or ()
+    ]
+    user = SimpleNamespace(topics=topics, email="preview")
+    return build_digest_for_user(user, rank_articles(iter_unique_articles(articles)))
@@ -0,0 +1,180 @@
+"""
+backend/utils/checkpoints.py
+----------------------------
+
+On-disk checkpoints for a pipeline run, so an interrupted run resumes
+where it stopped instead of repeating fetches, extractions and LLM calls.
+
+Layout (PIPELINE_RUNS_DIR/<run_id>/):
+- run.json: manifest (digest_date, shard, status, timestamps)
+- <stage>.jsonl: one {"key": ..., "value": ...} record per completed unit
+  of work, appended (and flushed) as soon as the unit finishes.
+
+A record is only written after its work is done, so a crash can at most
+lose the unit in flight. A torn last line is ignored when loading.
+Checkpoints are opt-in (PIPELINE_CHECKPOINTS=true); disabled checkpoints
+load nothing and save nothing.
+"""
+
+
+#-------------------------------------------------------
+# Imports
+#-------------------------------------------------------
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, IO, Iterator, List, Optional, Tuple
+
+from backend.config import PIPELINE_CHECKPOINTS, PIPELINE_RUNS_DIR
+from backend.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+MANIFEST_FILE = "run.json"
+
+
+#-------------------------------------------------------
+# Run checkpoint
+#-------------------------------------------------------
+class RunCheckpoint:
+    """
+    Append-only key/value records per stage for one run id.
+    """
+
+    def __init__(self, run_id: str, root: Optional[str] = None, enabled: bool = PIPELINE_CHECKPOINTS):
+        self.run_id = run_id
+        self.path = Path(root or PIPELINE_RUNS_DIR) / run_id
+        self.enabled = enabled
+        self._files: Dict[str, IO[str]] = {}
+        self._lock = threading.Lock()
+
+    def exists(self) -> bool:
+        return (self.path / MANIFEST_FILE).exists()
+
+    # ---------------- manifest ----------------
+    def manifest(self) -> Dict[str, Any]:
+        """
+        The run manifest ({} when the run has no checkpoint yet).
+        """
+        if not self.enabled or not self.exists():
+            return {}
+        return json.loads((self.path / MANIFEST_FILE).read_text(encoding="utf-8"))
+
+    def update_manifest(self, **fields: Any) -> None:
+        """
+        Merge fields into run.json (written atomically).
+        """
+        if not self.enabled:
+            return
+
+        data = {**self.manifest(), "run_id": self.run_id, **fields}
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp = self.path / f"{MANIFEST_FILE}.tmp"
+        tmp.write_text(json.dumps(data, indent=2, default=str), encoding="utf-8")
+        os.replace(tmp, self.path / MANIFEST_FILE)
+
+    # ---------------- records ----------------
+    def iter_records(self, stage: str) -> Iterator[Tuple[str, Any]]:
+        """
+        Yield (key, value) for every completed unit of a stage.
+        """
+        path = self.path / f"{stage}.jsonl"
+        if not self.enabled or not path.exists():
+            return
+
+        with path.open(encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Ignoring torn checkpoint record in {path}")
+                    continue
+                yield record["key"], record["value"]
+
+    def load(self, stage: str) -> Dict[str, Any]:
+        """
+        All records of a stage as a dict (later records win).
+        """
+        return dict(self.iter_records(stage))
+
+    def save(self, stage: str, key: str, value: Any) -> None:
+        """
+        Append one completed unit of work. Safe to call from several threads.
+        """
+        if not self.enabled:
+            return
+
+        line = json.dumps({"key": key, "value": value}, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            handle = self._files.get(stage)
+            if handle is None:
+                self.path.mkdir(parents=True, exist_ok=True)
+                handle = self._files[stage] = (self.path / f"{stage}.jsonl").open("a", encoding="utf-8")
+            handle.write(line)
+            handle.flush()
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Number of records per stage file (for inspection).
+        """
+        counts = {}
+        for path in sorted(self.path.glob("*.jsonl")):
+            with path.open(encoding="utf-8") as handle:
+                counts[path.stem] = sum(1 for _ in handle)
+        return counts
+
+    # ---------------- lifecycle ----------------
+    def close(self) -> None:
+        with self._lock:
+            for handle in self._files.values():
+                handle.flush()
+                os.fsync(handle.fileno())
+                handle.close()
+            self._files.clear()
+
+    def clear(self) -> None:
+        """
+        Delete every checkpoint of this run.
+        """
+        self.close()
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+#-------------------------------------------------------
+# Run listing
+#-------------------------------------------------------
+def list_runs(root: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Manifests of all checkpointed runs, newest first.
+    """
+    base = Path(root or PIPELINE_RUNS_DIR)
+    if not base.exists():
+        return []
+
+    runs = []
+    for path in base.iterdir():
+        manifest = RunCheckpoint(path.name, root=str(base), enabled=True).manifest()
+        if manifest:
+            runs.append(manifest)
+
+    runs.sort(key=lambda m: m.get("started_at", ""), reverse=True)
+    return runs
+
+
+def default_run_id(digest_date, shard: Optional[Tuple[int, int]] = None) -> str:
+    """
+    One run per digest date (and shard).
+    """
+    run_id = digest_date.isoformat()
+    if shard:
+        run_id += f"-shard{shard[0]}of{shard[1]}"
+    return run_id
+
+
+def now_iso() -> str:
+    return datetime.now().isoformat(timespec="seconds")
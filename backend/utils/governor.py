@@ -0,0 +1,115 @@
+"""
+backend/utils/governor.py
+-------------------------
+
+Run budget governor: trades digest fidelity for delivery latency.
+
+For each subscriber the pipeline asks for a mode, given the cohort's send
+deadline. The governor measures how long the run has been working past
+that deadline (max(deadline, run start) -> now) and steps down:
+
+- FULL: extraction with article.nlp(), LLM summaries
+- NO_NLP: extraction without article.nlp()
+- FEED_ONLY: feed descriptions instead of full-article extraction
+- EXTRACTIVE: cached summaries, otherwise extractive summaries (no new LLM calls)
+
+Thresholds: DEGRADE_NO_NLP_AFTER_SECONDS, DEGRADE_FEED_ONLY_AFTER_SECONDS,
+DEGRADE_EXTRACTIVE_AFTER_SECONDS. Opt-in with PIPELINE_DEGRADATION=true;
+otherwise every subscriber gets FULL.
+"""
+
+
+#-------------------------------------------------------
+# Imports
+#-------------------------------------------------------
+from __future__ import annotations
+
+from datetime import datetime
+from enum import IntEnum
+from typing import Optional, Sequence, Tuple
+
+from backend.config import (
+    DEGRADE_EXTRACTIVE_AFTER_SECONDS,
+    DEGRADE_FEED_ONLY_AFTER_SECONDS,
+    DEGRADE_NO_NLP_AFTER_SECONDS,
+    PIPELINE_DEGRADATION,
+)
+from backend.utils.logger import get_logger
+from backend.utils.metrics import counter, gauge
+from backend.utils.time_utils import utc_now
+
+logger = get_logger(__name__)
+
+MODE_GAUGE = gauge("pipeline_degradation_mode", "Current fidelity mode (0=full, 1=no_nlp, 2=feed_only, 3=extractive).")
+MODE_CHANGES = counter("pipeline_degradation_mode_changes_total", "Fidelity mode transitions.", ["mode"])
+
+
+#-------------------------------------------------------
+# Modes
+#-------------------------------------------------------
+class DegradationMode(IntEnum):
+    """
+    Fidelity levels, ordered from best to cheapest.
+    """
+    FULL = 0
+    NO_NLP = 1
+    FEED_ONLY = 2
+    EXTRACTIVE = 3
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+#-------------------------------------------------------
+# Governor
+#-------------------------------------------------------
+class RunGovernor:
+    """
+    Picks the fidelity mode for a subscriber from the run's lateness
+    against the cohort deadline.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = PIPELINE_DEGRADATION,
+        thresholds: Optional[Sequence[Tuple[DegradationMode, float]]] = None,
+        started_at: Optional[datetime] = None,
+    ):
+        self.enabled = enabled
+        self.thresholds = sorted(thresholds or (
+            (DegradationMode.NO_NLP, DEGRADE_NO_NLP_AFTER_SECONDS),
+            (DegradationMode.FEED_ONLY, DEGRADE_FEED_ONLY_AFTER_SECONDS),
+            (DegradationMode.EXTRACTIVE, DEGRADE_EXTRACTIVE_AFTER_SECONDS),
+        ), key=lambda item: item[1])
+        self.started_at = started_at or utc_now()
+        self.mode = DegradationMode.FULL
+        MODE_GAUGE.set(self.mode)
+
+    def lateness(self, deadline: datetime, now: Optional[datetime] = None) -> float:
+        """
+        Seconds this run has spent past the deadline (0 when not yet due).
+        """
+        now = now or utc_now()
+        return max(0.0, (now - max(deadline, self.started_at)).total_seconds())
+
+    def mode_for(self, deadline: datetime, now: Optional[datetime] = None) -> DegradationMode:
+        """
+        Fidelity mode for a subscriber whose cohort is due at `deadline` (UTC).
+        """
+        if not self.enabled:
+            return DegradationMode.FULL
+
+        late = self.lateness(deadline, now)
+        mode = DegradationMode.FULL
+        for candidate, after in self.thresholds:
+            if late >= after:
+                mode = max(mode, candidate)
+
+        if mode != self.mode:
+            logger.warning(f"Pipeline fidelity mode {self.mode.label} -> {mode.label} ({late:.0f}s past deadline)")
+            MODE_CHANGES.inc(mode=mode.label)
+            MODE_GAUGE.set(mode)
+            self.mode = mode
+
+        return mode
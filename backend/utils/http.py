@@ -0,0 +1,166 @@
+"""
+backend/utils/http.py
+---------------------
+
+Shared, pooled HTTP client for all outbound fetches (feeds and articles).
+
+- One httpx.Client per process: per-host keep-alive, so articles from the
+  same publisher reuse a TCP/TLS connection.
+- HTTP/2 when the optional `h2` package is installed; brotli decoding when
+  `brotli` is installed (gzip/deflate always).
+- Response bodies are capped at HTTP_MAX_BODY_BYTES (decoded size).
+- Counters: requests, bytes received on the wire, connections opened vs reused.
+
+Usage:
+    data = get_bytes(feed_url, timeout=5)
+    html = get_text(article_url, timeout=10)
+"""
+
+
+#-------------------------------------------------------
+# Imports
+#-------------------------------------------------------
+from __future__ import annotations
+
+import atexit
+import importlib.util
+import threading
+from typing import Optional, Tuple
+from urllib.parse import urlsplit
+
+from backend.config import (
+    HTTP_KEEPALIVE_SECONDS,
+    HTTP_MAX_BODY_BYTES,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_TIMEOUT_SECONDS,
+)
+from backend.utils.metrics import counter
+
+USER_AGENT = "Mozilla/5.0 (compatible; DailyNewsDigest/1.0)"
+
+HTTP_REQUESTS = counter("http_requests_total", "Outbound HTTP requests.", ["host", "status"])
+HTTP_BYTES = counter("http_bytes_received_total", "Response bytes received on the wire (before decompression).", ["host"])
+CONNECTIONS_OPENED = counter("http_connections_opened_total", "Requests that had to open a new connection.", ["host"])
+CONNECTIONS_REUSED = counter("http_connections_reused_total", "Requests served over a kept-alive connection.", ["host"])
+
+_client = None
+_client_lock = threading.Lock()
+
+
+class ResponseTooLarge(ValueError):
+    """
+    Raised when a response body exceeds HTTP_MAX_BODY_BYTES.
+    """
+
+
+#-------------------------------------------------------
+# Client
+#-------------------------------------------------------
+def _has_module(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
+def get_client():
+    """
+    The process-wide httpx.Client (built on first use).
+    """
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                import httpx
+
+                encodings = "gzip, deflate, br" if _has_module("brotli") or _has_module("brotlicffi") else "gzip, deflate"
+                _client = httpx.Client(
+                    http2=_has_module("h2"),
+                    follow_redirects=True,
+                    timeout=HTTP_TIMEOUT_SECONDS,
+                    limits=httpx.Limits(
+                        max_connections=HTTP_MAX_CONNECTIONS,
+                        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                        keepalive_expiry=HTTP_KEEPALIVE_SECONDS,
+                    ),
+                    headers={"User-Agent": USER_AGENT, "Accept-Encoding": encodings},
+                )
+                atexit.register(close_client)
+
+    return _client
+
+
+def close_client() -> None:
+    """
+    Close pooled connections (registered with atexit).
+    """
+    global _client
+
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+#-------------------------------------------------------
+# Requests
+#-------------------------------------------------------
+def _fetch(url: str, timeout: Optional[float], max_bytes: int) -> Tuple[bytes, Optional[str]]:
+    """
+    GET a URL through the shared client and return (body, charset).
+    Raises httpx errors, or ResponseTooLarge past `max_bytes`.
+    """
+    host = (urlsplit(url).hostname or "").lower()
+    opened = []
+
+    def _trace(event_name: str, _info) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            opened.append(True)
+
+    status = "error"
+    try:
+        with get_client().stream(
+            "GET",
+            url,
+            timeout=timeout if timeout is not None else HTTP_TIMEOUT_SECONDS,
+            extensions={"trace": _trace},
+        ) as response:
+            status = str(response.status_code)
+            response.raise_for_status()
+
+            declared = response.headers.get("content-length")
+            if declared and declared.isdigit() and int(declared) > max_bytes:
+                raise ResponseTooLarge(f"{url}: {declared} bytes > {max_bytes}")
+
+            chunks, size = [], 0
+            for chunk in response.iter_bytes():
+                size += len(chunk)
+                if size > max_bytes:
+                    raise ResponseTooLarge(f"{url}: body exceeds {max_bytes} bytes")
+                chunks.append(chunk)
+
+            HTTP_BYTES.inc(response.num_bytes_downloaded, host=host)
+            return b"".join(chunks), response.charset_encoding
+    finally:
+        HTTP_REQUESTS.inc(host=host, status=status)
+        if opened:
+            CONNECTIONS_OPENED.inc(host=host)
+        elif status != "error":
+            CONNECTIONS_REUSED.inc(host=host)
+
+
+def get_bytes(url: str, timeout: Optional[float] = None, max_bytes: int = HTTP_MAX_BODY_BYTES) -> bytes:
+    """
+    Response body as bytes (e.g. for feedparser, which sniffs the encoding).
+    """
+    return _fetch(url, timeout, max_bytes)[0]
+
+
+def get_text(url: str, timeout: Optional[float] = None, max_bytes: int = HTTP_MAX_BODY_BYTES) -> str:
+    """
+    Response body decoded with the declared charset (UTF-8 otherwise).
+    """
+    body, charset = _fetch(url, timeout, max_bytes)
+    try:
+        return body.decode(charset or "utf-8", errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
@@ -4,17 +4,138 @@ Docstring for backend.utils.logger
 Central logging comnfiguration for entire project.
 All modules should use this instead of print().
 
+All module loggers share a single QueueHandler. A QueueListener on a
+background thread owns the console and rotating file handlers, so a
+logging call on the pipeline thread costs little more than an enqueue.
+
+Set LOG_FORMAT=json for one JSON object per line with stable fields:
+    ts, level, logger, message, stage, subscriber, duration_ms
 """
 
 
 #---------------------------------------------------------
 # Imports
 #---------------------------------------------------------
+import atexit
+import copy
+import json
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, Optional
+
+from backend.config import LOG_LEVEL, LOG_FORMAT, ensure_log_dir
 
-from backend.config import LOG_LEVEL, LOG_DIR
+# Structured fields passed through `extra=` (see log_fields()).
+STRUCTURED_FIELDS = ("stage", "subscriber", "duration_ms")
+
+_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_queue_handler: Optional[QueueHandler] = None
+_listener: Optional[QueueListener] = None
+_lock = threading.Lock()
+
+
+#---------------------------------------------------------
+# Formatters
+#---------------------------------------------------------
+class TextFormatter(logging.Formatter):
+    """
+    Human readable format; structured fields are appended when present.
+    """
+
+    def __init__(self):
+        super().__init__("%(asctime)s | %(levelname)s | %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = [f"{k}={getattr(record, k)}" for k in STRUCTURED_FIELDS if getattr(record, k, None) is not None]
+        return f"{line} | {' '.join(fields)}" if fields else line
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line with stable keys.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key in STRUCTURED_FIELDS:
+            payload[key] = getattr(record, key, None)
+
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc"] = record.exc_text
+
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+#---------------------------------------------------------
+# Background listener
+#---------------------------------------------------------
+class _EnqueueHandler(QueueHandler):
+    """
+    QueueHandler that only resolves the message and traceback text on the
+    calling thread; all formatting happens on the listener thread.
+    """
+    _exc_formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = self._exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _get_queue_handler() -> QueueHandler:
+    """
+    Start the shared QueueListener once and return the shared QueueHandler.
+    """
+    global _queue_handler, _listener
+
+    with _lock:
+        if _queue_handler is not None:
+            return _queue_handler
+
+        formatter = JsonFormatter() if LOG_FORMAT == "json" else TextFormatter()
+
+        ch = logging.StreamHandler()
+        ch.setFormatter(formatter)
+
+        log_file = os.path.join(ensure_log_dir(), "app.log")
+        fh = RotatingFileHandler(log_file, maxBytes=2_000_000, backupCount=3)
+        fh.setFormatter(formatter)
+
+        _listener = QueueListener(_queue, ch, fh, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+        _queue_handler = _EnqueueHandler(_queue)
+        return _queue_handler
+
+
+def shutdown_logging() -> None:
+    """
+    Drain the queue and stop the background listener.
+    Called automatically at interpreter exit.
+    """
+    global _listener
+
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
 
 
 #---------------------------------------------------------
@@ -24,7 +145,7 @@ def get_logger(name: str) -> logging.Logger:
     """
     Create and return a configured logger.
 
-    Logs to:
+    Logs to (via the background listener):
     - console
     - Rotating files in LOG_DIR
     """
@@ -33,17 +154,34 @@ def get_logger(name: str) -> logging.Logger:
 
     if logger.handlers:
         return logger
-    
+
     logger.setLevel(LOG_LEVEL.upper())
-    formatter = logging.Formatter("%(asctime)s | %(levelname)s | %(message)s")
+    logger.addHandler(_get_queue_handler())
 
-    ch = logging.StreamHandler()
-    ch.setFormatter(formatter)
-    logger.addHandler(ch)
+    return logger
 
-    log_file = os.path.join(LOG_DIR, "app.log")
-    fh = RotatingFileHandler(log_file, maxBytes=2_000_000, backupCount=3)
-    fh.setFormatter(formatter)
-    logger.addHandler(fh)
 
-    return logger
+#---------------------------------------------------------
+# Structured fields
+#---------------------------------------------------------
+def log_fields(
+    stage: Optional[str] = None,
+    email: Optional[str] = None,
+    duration: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Build the `extra=` mapping for a structured log line.
+    The email is never logged, only its hash_email() digest. duration is the
+    time spent on the logged unit of work (one send, or one subscriber in
+    the pipeline).
+
+    Example:
+        logger.info("Email sent", extra=log_fields(stage="send", email=user.email, duration=0.42))
+    """
+    from backend.utils.security import hash_email
+
+    return {
+        "stage": stage,
+        "subscriber": hash_email(email) if email else None,
+        "duration_ms": round(duration * 1000, 1) if duration is not None else None,
+    }
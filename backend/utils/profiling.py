@@ -0,0 +1,291 @@
+"""
+backend/utils/profiling.py
+--------------------------
+
+Opt-in profiling for the daily pipeline.
+
+Modes (all off by default):
+- Timing spans: wall time and call count per pipeline stage.
+- CPU: cProfile per stage, merged into one .prof file for the run. Only
+  spans on the thread that called start() are profiled: on Python 3.12+
+  cProfile is process-wide and a second active profiler raises. The
+  pipeline runs without read-ahead threads while CPU profiling is on.
+- Memory: tracemalloc net growth per stage and the top allocations of the run.
+
+Enable with PIPELINE_PROFILE / PIPELINE_PROFILE_CPU / PIPELINE_PROFILE_MEMORY
+or the --profile flags of `python -m jobs.daily_pipeline`. Reports are written to LOG_DIR.
+"""
+
+
+#-------------------------------------------------------
+# Imports
+#-------------------------------------------------------
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from backend.config import (
+    LOG_DIR,
+    PIPELINE_PROFILE,
+    PIPELINE_PROFILE_CPU,
+    PIPELINE_PROFILE_MEMORY,
+)
+from backend.utils.metrics import histogram
+
+STAGE_SECONDS = histogram("pipeline_stage_seconds", "Wall time spent per pipeline stage span.", ["stage"])
+
+TOP_FUNCTIONS = 10
+TOP_ALLOCATIONS = 15
+
+
+#-------------------------------------------------------
+# Per-stage accumulators
+#-------------------------------------------------------
+class _StageStats:
+    __slots__ = ("calls", "seconds", "memory_delta", "profile")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.memory_delta = 0
+        self.profile: Optional[cProfile.Profile] = None
+
+
+class _Span:
+    __slots__ = ("stats", "child_seconds", "child_memory")
+
+    def __init__(self, stats: _StageStats):
+        self.stats = stats
+        self.child_seconds = 0.0
+        self.child_memory = 0
+
+
+#-------------------------------------------------------
+# Pipeline Profiler
+#-------------------------------------------------------
+class PipelineProfiler:
+    """
+    Collects timing spans (and optionally cProfile / tracemalloc data) for
+    the stages of one pipeline run. When disabled, stage() is a no-op.
+
+    Usage:
+        profiler = PipelineProfiler.from_env()
+        profiler.start()
+        with profiler.stage("fetch"):
+            ...
+        profiler.finish()
+    """
+
+    def __init__(self, enabled: bool = False, cpu: bool = False, memory: bool = False, output_dir: Optional[Path] = None):
+        self.cpu = cpu
+        self.memory = memory
+        self.enabled = enabled or cpu or memory
+        self.output_dir = Path(output_dir or LOG_DIR)
+
+        self._stages: Dict[str, _StageStats] = {}
+        self._local = threading.local()  # stack of open spans per thread
+        self._started_at: Optional[float] = None
+        self._start_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._owns_tracemalloc = False
+        self._cpu_thread: Optional[int] = None
+
+    @classmethod
+    def from_env(cls) -> "PipelineProfiler":
+        """
+        Build a profiler from the PIPELINE_PROFILE* settings.
+        """
+        return cls(enabled=PIPELINE_PROFILE, cpu=PIPELINE_PROFILE_CPU, memory=PIPELINE_PROFILE_MEMORY)
+
+    #---------------------------------------------------
+    # Run lifecycle
+    #---------------------------------------------------
+    def start(self) -> None:
+        if not self.enabled:
+            return
+
+        self._started_at = time.perf_counter()
+        self._cpu_thread = threading.get_ident()
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._owns_tracemalloc = True
+            self._start_snapshot = tracemalloc.take_snapshot()
+
+    def finish(self) -> Optional[Path]:
+        """
+        Stop collection and write the text report (plus .prof when CPU
+        profiling is on). Returns the report path, or None when disabled.
+        """
+        if not self.enabled or self._started_at is None:
+            return None
+
+        total = time.perf_counter() - self._started_at
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        lines = [f"Pipeline profile ({stamp}) — total {total:.2f}s", ""]
+        lines.extend(self._timing_lines(total))
+
+        if self.cpu:
+            prof_path = self.output_dir / f"pipeline_profile_{stamp}.prof"
+            merged = self._merged_stats()
+            if merged is not None:
+                merged.dump_stats(prof_path)
+                lines.append(f"cProfile stats: {prof_path}")
+                lines.append("")
+            lines.extend(self._hot_function_lines())
+
+        if self.memory:
+            lines.extend(self._allocation_lines())
+            if self._owns_tracemalloc:
+                tracemalloc.stop()
+
+        report_path = self.output_dir / f"pipeline_profile_{stamp}.txt"
+        report_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        self._started_at = None
+        return report_path
+
+    #---------------------------------------------------
+    # Spans
+    #---------------------------------------------------
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Time the wrapped block as one span of the given stage.
+
+        Spans may nest: a stage records only its exclusive time and memory
+        (nested spans are charged to their own stage), and CPU samples are
+        switched to the innermost stage. Nesting is tracked per thread, since
+        stages may run on buffered() producer threads; spans on other threads
+        than the one that called start() get timing only, no cProfile.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        stats = self._stages.get(name)
+        if stats is None:
+            stats = self._stages[name] = _StageStats()
+
+        stack: List[_Span] = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        parent = stack[-1] if stack else None
+
+        span = _Span(stats)
+        cpu = self.cpu and threading.get_ident() == self._cpu_thread
+        if cpu:
+            if parent is not None:
+                parent.stats.profile.disable()
+            span.stats.profile = span.stats.profile or cProfile.Profile()
+            span.stats.profile.enable()
+        stack.append(span)
+
+        mem_before = tracemalloc.get_traced_memory()[0] if self.memory else 0
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            mem_delta = tracemalloc.get_traced_memory()[0] - mem_before if self.memory else 0
+
+            stack.pop()
+            if cpu:
+                span.stats.profile.disable()
+                if parent is not None:
+                    parent.stats.profile.enable()
+            if parent is not None:
+                parent.child_seconds += elapsed
+                parent.child_memory += mem_delta
+
+            exclusive = elapsed - span.child_seconds
+            stats.calls += 1
+            stats.seconds += exclusive
+            stats.memory_delta += mem_delta - span.child_memory
+            STAGE_SECONDS.observe(exclusive, stage=name)
+
+    #---------------------------------------------------
+    # Report helpers
+    #---------------------------------------------------
+    def _timing_lines(self, total: float) -> List[str]:
+        header = f"{'stage':<14}{'calls':>8}{'total s':>10}{'mean ms':>10}{'share':>8}"
+        if self.memory:
+            header += f"{'net mem':>12}"
+        lines = [header, "-" * len(header)]
+
+        for name, stats in sorted(self._stages.items(), key=lambda kv: kv[1].seconds, reverse=True):
+            mean_ms = stats.seconds / stats.calls * 1000 if stats.calls else 0.0
+            share = stats.seconds / total * 100 if total else 0.0
+            line = f"{name:<14}{stats.calls:>8}{stats.seconds:>10.2f}{mean_ms:>10.1f}{share:>7.1f}%"
+            if self.memory:
+                line += f"{_format_bytes(stats.memory_delta):>12}"
+            lines.append(line)
+
+        lines.append("")
+        return lines
+
+    def _merged_stats(self) -> Optional[pstats.Stats]:
+        merged = None
+        for stats in self._stages.values():
+            if stats.profile is None:
+                continue
+            if merged is None:
+                merged = pstats.Stats(stats.profile)
+            else:
+                merged.add(stats.profile)
+        return merged
+
+    def _hot_function_lines(self) -> List[str]:
+        lines = []
+        for name, stats in sorted(self._stages.items(), key=lambda kv: kv[1].seconds, reverse=True):
+            if stats.profile is None:
+                continue
+            buffer = io.StringIO()
+            pstats.Stats(stats.profile, stream=buffer).sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+            lines.append(f"== Hottest functions: {name} ==")
+            # Drop pstats' preamble, keep the table.
+            table = buffer.getvalue().split("\n")
+            start = next((i for i, row in enumerate(table) if row.lstrip().startswith("ncalls")), 0)
+            lines.extend(row for row in table[start:] if row.strip())
+            lines.append("")
+        return lines
+
+    def _allocation_lines(self) -> List[str]:
+        current, peak = tracemalloc.get_traced_memory()
+        lines = [
+            f"== Memory: current {_format_bytes(current, signed=False)}, peak {_format_bytes(peak, signed=False)} ==",
+        ]
+        if self._start_snapshot is not None:
+            snapshot = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            ))
+            for diff in snapshot.compare_to(self._start_snapshot, "lineno")[:TOP_ALLOCATIONS]:
+                lines.append(f"{_format_bytes(diff.size_diff):>10}  {diff.count_diff:>+8} blocks  {diff.traceback}")
+        lines.append("")
+        return lines
+
+
+#-------------------------------------------------------
+# Format bytes
+#-------------------------------------------------------
+def _format_bytes(size: int, signed: bool = True) -> str:
+    """
+    Human readable byte count (e.g. '+1.2 MiB', or '1.2 MiB' when unsigned).
+    """
+    sign = "-" if size < 0 else ("+" if signed else "")
+    value = float(abs(size))
+    for unit in ("B", "KiB", "MiB"):
+        if value < 1024:
+            return f"{sign}{value:.0f} {unit}" if unit == "B" else f"{sign}{value:.1f} {unit}"
+        value /= 1024
+    return f"{sign}{value:.1f} GiB"
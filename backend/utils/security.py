@@ -24,6 +24,16 @@ def hash_email(email: str) -> str:
     return hashlib.sha256(email.encode()).hexdigest()
 
 
+#-------------------------------------------------------
+# Hash URL
+#-------------------------------------------------------
+def hash_url(url: str) -> str:
+    """
+    Stable SHA256 key for an article URL (usage accounting, storage keys).
+    """
+    return hashlib.sha256(url.encode()).hexdigest()
+
+
 #-------------------------------------------------------
 # Sign Data
 #-------------------------------------------------------
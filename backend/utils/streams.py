@@ -0,0 +1,85 @@
+"""
+backend/utils/streams.py
+------------------------
+
+Small helpers for composing pipeline stages as iterators.
+
+- buffered(): run an upstream iterator on a background thread and hand its
+  items over through a bounded queue, so the next stage can start while the
+  previous one is still working, without unbounded read-ahead.
+"""
+
+
+#-------------------------------------------------------
+# Imports
+#-------------------------------------------------------
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+_PUT_TIMEOUT_SECONDS = 0.1
+
+
+#-------------------------------------------------------
+# Buffered (bounded read-ahead)
+#-------------------------------------------------------
+def buffered(iterable: Iterable[T], maxsize: int = 8, name: str = "stage") -> Iterator[T]:
+    """
+    Iterate `iterable` on a daemon thread, keeping at most `maxsize` items
+    in flight. Exceptions raised upstream are re-raised in the consumer.
+    Closing the returned generator early stops the producer thread and waits
+    for it, so upstream stages never run on after the consumer moved on
+    (at most the item in progress is finished first).
+    """
+    if maxsize <= 0:
+        yield from iterable
+        return
+
+    items: "queue.Queue" = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def _put(item) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=_PUT_TIMEOUT_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        try:
+            for item in iterable:
+                if not _put(item):
+                    return
+        except BaseException as e:  # handed over to the consumer
+            _put(_Failure(e))
+            return
+        _put(_DONE)
+
+    thread = threading.Thread(target=_produce, name=f"buffered-{name}", daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            item = items.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+class _Failure:
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException):
+        self.error = error
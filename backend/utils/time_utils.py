@@ -9,9 +9,12 @@ Handles time related operations. (TimeZone, Sheduling logic)
 #-------------------------------------------------------
 # Imports
 #-------------------------------------------------------
-from datetime import datetime
+from datetime import date, datetime
+from typing import Optional
 import pytz
 
+from backend.config import DEFAULT_PREFFERED_TIME, DEFAULT_TIMEZONE
+
 
 #-------------------------------------------------------
 # Get Time in TimeZone
@@ -36,4 +39,41 @@ def is_send_time(preffered_time: str, timezone: str) -> bool:
     now = get_current_time_in_timezone(timezone)
     current_time = now.strftime('%H:%M')
 
-    return (current_time == preffered_time)
\ No newline at end of file
+    return (current_time == preffered_time)
+
+
+#-------------------------------------------------------
+# Target send instant (UTC)
+#-------------------------------------------------------
+def _zone(timezone: str):
+    try:
+        return pytz.timezone(timezone)
+    except pytz.UnknownTimeZoneError:
+        return pytz.timezone(DEFAULT_TIMEZONE)
+
+
+def local_date(timezone: str, at: Optional[datetime] = None) -> date:
+    """
+    Calendar date in `timezone` at the UTC instant `at` (default: now).
+    Invalid zones fall back to DEFAULT_TIMEZONE.
+    """
+    return (at or utc_now()).astimezone(_zone(timezone)).date()
+
+
+def send_deadline_utc(preffered_time: str, timezone: str, on: date) -> datetime:
+    """
+    UTC instant of `preffered_time` in `timezone` on the local date `on`.
+    Invalid values fall back to DEFAULT_PREFFERED_TIME / DEFAULT_TIMEZONE.
+    """
+    tz = _zone(timezone)
+
+    try:
+        local = datetime.strptime(preffered_time, "%H:%M").time()
+    except (TypeError, ValueError):
+        local = datetime.strptime(DEFAULT_PREFFERED_TIME, "%H:%M").time()
+
+    return tz.localize(datetime.combine(on, local)).astimezone(pytz.utc)
+
+
+def utc_now() -> datetime:
+    return datetime.now(pytz.utc)
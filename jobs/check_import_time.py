@@ -0,0 +1,119 @@
+"""
+jobs/check_import_time.py
+-------------------------
+
+Cold-start import-time regression check for the entrypoints.
+
+Runs each entrypoint in a fresh interpreter with `python -X importtime`,
+sums the cumulative time of its top-level imports and fails (exit code 1)
+when that exceeds the entrypoint's budget.
+
+Usage:
+    python jobs/check_import_time.py
+    python jobs/check_import_time.py --repeat 5 --budget jobs/scheduler.py=600
+
+Budgets can also be set with IMPORT_BUDGET_APP_MS / IMPORT_BUDGET_SCHEDULER_MS.
+The scheduler is loaded with a non-__main__ run name, so its loop never starts.
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+DEFAULT_BUDGETS_MS: Dict[str, float] = {
+    "app/main.py": float(os.getenv("IMPORT_BUDGET_APP_MS", "2500")),
+    "jobs/scheduler.py": float(os.getenv("IMPORT_BUDGET_SCHEDULER_MS", "800")),
+}
+
+# "import time:       123 |       4567 |   package.module"
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+TOP_IMPORTS = 10
+
+
+#-------------------------------------------------------
+# Measure one entrypoint
+#-------------------------------------------------------
+def measure_import_time(entrypoint: str) -> Tuple[float, List[Tuple[float, str]]]:
+    """
+    Import-time cost of one entrypoint in a fresh interpreter.
+
+    Returns:
+        (total_ms, [(cumulative_ms, module), ...] sorted slowest first)
+    """
+    code = (
+        "import runpy, sys; "
+        f"sys.path.insert(0, {str(ROOT_DIR)!r}); "
+        f"runpy.run_path({str(ROOT_DIR / entrypoint)!r}, run_name='__importcheck__')"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{entrypoint} failed to load:\n{proc.stderr[-2000:]}")
+
+    top_level = []
+    started = False
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        _, cumulative_us, indent, module = match.groups()
+        # Nested imports are indented by two spaces per level below the first.
+        if len(indent) > 1:
+            continue
+        # Interpreter startup (site, encodings, ...) is logged before runpy.
+        if not started:
+            started = module == "runpy"
+            continue
+        top_level.append((int(cumulative_us) / 1000, module))
+
+    top_level.sort(reverse=True)
+    return sum(ms for ms, _ in top_level), top_level
+
+
+#-------------------------------------------------------
+# Main
+#-------------------------------------------------------
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Fail when entrypoint import time exceeds its budget.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per entrypoint; the fastest one counts.")
+    parser.add_argument(
+        "--budget",
+        action="append",
+        default=[],
+        metavar="ENTRYPOINT=MS",
+        help="Override a budget, e.g. app/main.py=2000. Can be repeated.",
+    )
+    args = parser.parse_args()
+
+    budgets = dict(DEFAULT_BUDGETS_MS)
+    for item in args.budget:
+        entrypoint, _, ms = item.partition("=")
+        budgets[entrypoint] = float(ms)
+
+    failed = False
+    for entrypoint, budget_ms in budgets.items():
+        runs = [measure_import_time(entrypoint) for _ in range(max(1, args.repeat))]
+        total_ms, top = min(runs, key=lambda run: run[0])
+
+        status = "OK" if total_ms <= budget_ms else "OVER BUDGET"
+        failed |= total_ms > budget_ms
+        print(f"{entrypoint}: {total_ms:.0f} ms (budget {budget_ms:.0f} ms) {status}")
+        for ms, module in top[:TOP_IMPORTS]:
+            print(f"    {ms:8.1f} ms  {module}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
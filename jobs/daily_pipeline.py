@@ -5,10 +5,11 @@ jobs/daily_pipeline.py
 End-to-end daily news digest pipeline.
 
 This script:
-1. Fetches active + verified subscribers
-2. Fetches news based on user topic preferences
-3. Extracts and cleans article text
-4. Summarizes articles using Gemini (LangChain)
+1. Fetches active + verified subscribers (earliest send deadline first)
+2. Fetches news based on user topic preferences and groups articles about
+   the same event into story clusters
+3. Extracts and cleans article text (one article per story)
+4. Summarizes articles using Gemini (LangChain), one call per story
 5. Deduplicates and ranks articles
 6. Builds personalized digest
 7. Renders HTML email
@@ -17,161 +18,727 @@ This script:
 
 This file is the HEART of the product.
 If this works → the product works.
+
+Memory:
+    Subscribers are streamed from the database as keyset-paginated rows
+    (only the columns the pipeline needs) and articles flow
+    through the stages as iterators. Extraction runs ahead of summarization
+    through a bounded queue (PIPELINE_QUEUE_SIZE), and article bodies are
+    dropped as soon as they are summarized; only summaries are cached per run.
+
+Send order:
+    Subscribers are grouped into (time_zone, preffered_time) cohorts, and the
+    cohorts are processed from a heap ordered by their target UTC send
+    instant, so the users who are due first get mail first. Lateness
+    (send time minus target instant) is exported as a histogram.
+
+Story clusters:
+    With STORY_CLUSTERING, each topic's feed articles are clustered
+    incrementally by title + lead similarity (backend/news/clustering.py).
+    Only a story's representative is extracted and summarized, with the
+    other publishers' leads as context, and the summary links every source
+    (SummarizedArticle.related). LLM calls scale with distinct events.
+
+Article store:
+    With ARTICLE_STORE and the ingester (jobs/ingester.py) keeping the
+    article store fresh, a topic's articles are read from it (summarized
+    articles of the last ARTICLE_STORE_WINDOW_HOURS, one indexed query per
+    topic per run) instead of being fetched, extracted and summarized at
+    send time. Topics the ingester has not polled recently fall back to the
+    live stages below.
+    With ARCHIVE_SUMMARIES, summaries made at send time are also kept in
+    the store (status 'archived') for search and digest previews.
+
+Degradation:
+    With PIPELINE_DEGRADATION, a RunGovernor picks a fidelity mode per
+    subscriber from how far the run is past the cohort deadline:
+    full -> no_nlp -> feed_only -> extractive.
+    The mode is recorded on each digest (digest["mode"], checkpoints and the
+    pipeline_digests_total metric).
+
+Checkpoints:
+    With PIPELINE_CHECKPOINTS, fetched feeds, extracted texts, summaries,
+    built digests and sends are appended to PIPELINE_RUNS_DIR/<run_id>/ as
+    they complete. Re-running an unfinished run id skips all recorded work,
+    so recovery after a crash costs only the remaining work. The run id defaults to the UTC date
+    (a finished default run starts over); see jobs/runs.py to inspect or resume.
+
+Profiling:
+    python -m jobs.daily_pipeline --profile [--profile-cpu] [--profile-memory]
+    (or PIPELINE_PROFILE=true / PIPELINE_PROFILE_CPU / PIPELINE_PROFILE_MEMORY)
+Each numbered step above is timed as a stage span; reports go to LOG_DIR.
 """
 
-from datetime import date
+import argparse
+import heapq
+import math
+import time
+from dataclasses import replace
+from datetime import date, datetime
+from functools import partial
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from backend.db.connection import get_session
 from backend.db import crud
+from backend.db.writers import ArticleArchiveWriter, EmailLogWriter, LlmUsageWriter
 
-from backend.news.fetcher import fetch_articles_for_topics
+from backend.news.fetcher import fetch_articles_for_topic
+from backend.news.health import load_source_health, save_source_health
 from backend.news.extractor import extract_article_text
 from backend.news.cleaner import clean_text
-from backend.news.dedup import deduplicate_articles
+from backend.news.clustering import StoryClusterer
+from backend.news.dedup import iter_unique_articles
 from backend.news.ranker import rank_articles
+from backend.news.records import RawArticle, SummarizedArticle
+from backend.news.store import load_stored_articles
 
-from backend.ai.summarizer import summarize_article
+from backend.ai.budget import RunTokenBudget, estimate_input_tokens
+from backend.ai.extractive import extractive_summary
+from backend.ai.prompts import SUMMARY_PROMPT
+from backend.ai.summarizer import prepare_article, summarize_article
 
 from backend.digest.builder import build_digest_for_user
 from backend.digest.formatter import render_digest_html
 
 from backend.email.sender import send_email
-from backend.config import APP_NAME
-from backend.utils.logger import get_logger
+from backend.config import (
+    APP_NAME,
+    ARCHIVE_SUMMARIES,
+    ARTICLE_STORE,
+    LLM_CHARS_PER_TOKEN,
+    PIPELINE_CHECKPOINTS,
+    PIPELINE_QUEUE_SIZE,
+    STORY_CLUSTERING,
+    SUBSCRIBER_BATCH_SIZE,
+)
+from backend.utils.checkpoints import RunCheckpoint, default_run_id, now_iso
+from backend.utils.governor import DegradationMode, RunGovernor
+from backend.utils.logger import get_logger, log_fields
+from backend.utils.metrics import counter, gauge, histogram, write_metrics_file
+from backend.utils.profiling import PipelineProfiler
+from backend.utils.security import hash_url
+from backend.utils.streams import buffered
+from backend.utils.time_utils import local_date, send_deadline_utc, utc_now
 
 logger = get_logger(__name__)
 
+CACHE_HITS = counter("pipeline_cache_hits_total", "Per-run cache hits (topic feeds, article summaries).", ["cache"])
+CACHE_MISSES = counter("pipeline_cache_misses_total", "Per-run cache misses (topic feeds, article summaries).", ["cache"])
+USERS_PROCESSED = counter("pipeline_users_total", "Subscribers processed by the pipeline.", ["outcome"])
+DIGESTS_BUILT = counter("pipeline_digests_total", "Digests built, by fidelity mode.", ["mode"])
+LAST_RUN_SECONDS = gauge("pipeline_last_run_duration_seconds", "Wall time of the most recent pipeline run.")
+LAST_RUN_TIMESTAMP = gauge("pipeline_last_run_timestamp_seconds", "Unix time the most recent pipeline run finished.")
+SEND_LATENESS = histogram(
+    "pipeline_send_lateness_seconds",
+    "Digest send time minus the subscriber's preferred send instant (0 when early).",
+    buckets=(0, 60, 300, 900, 1800, 3600, 7200, 14400, 43200, 86400),
+)
+
+
+# ------------------------------------------------------------------
+# Per-run state
+# ------------------------------------------------------------------
+class _RunCache:
+    """
+    Caches shared by all users of one run, preloaded from the run checkpoint.
+    - feeds: topic -> raw article metadata
+    - extracted: url -> cleaned text, only for articles not summarized yet
+    - summaries: url -> summarized article (None when extraction failed)
+    - digests: subscriber id -> built digest (article urls per topic)
+    - sent: subscriber ids whose digest was sent in this run
+    - token_budget: LLM input tokens left for this run
+    - usage: buffered per-call LLM usage rows (llm_usage table)
+    - archive: buffered summaries for the searchable article archive
+    - stories: topic -> story clusters of that topic's feed articles
+    - stored: topic -> articles from the article store (None = fetch live)
+    """
+
+    def __init__(self, checkpoint: Optional[RunCheckpoint] = None):
+        self.checkpoint = checkpoint or RunCheckpoint("", enabled=False)
+        self.token_budget = RunTokenBudget()
+        self.usage = LlmUsageWriter(self.checkpoint.run_id)
+        self.archive = ArticleArchiveWriter()
+
+        self.feeds: Dict[str, List[RawArticle]] = {
+            topic: [RawArticle.from_dict(a) for a in articles]
+            for topic, articles in self.checkpoint.iter_records("fetched")
+        }
+        self.stories: Dict[str, StoryClusterer] = {}
+        self.stored: Dict[str, Optional[List[SummarizedArticle]]] = {}
+        for topic, articles in self.feeds.items():
+            self.add_stories(topic, articles)
+
+        self.summaries: Dict[str, Optional[SummarizedArticle]] = {
+            url: SummarizedArticle.from_dict(data) if data else None
+            for url, data in self.checkpoint.iter_records("summaries")
+        }
+        self.extracted: Dict[str, str] = {
+            url: text
+            for url, text in self.checkpoint.iter_records("extracted")
+            if url not in self.summaries
+        }
+        self.sent = set(self.checkpoint.load("sent"))
+        self.digests: Dict[str, Dict] = {
+            user_id: record
+            for user_id, record in self.checkpoint.iter_records("digests")
+            if user_id not in self.sent
+        }
+
+        if self.checkpoint.exists():
+            logger.info(
+                f"Run {self.checkpoint.run_id}: resuming with {len(self.feeds)} feeds, "
+                f"{len(self.extracted)} extracted, {len(self.summaries)} summaries, "
+                f"{len(self.digests)} digests, {len(self.sent)} sent"
+            )
+
+    def stored_articles(self, topic: str) -> Optional[List[SummarizedArticle]]:
+        """
+        The topic's articles from the article store, loaded once per run.
+        None when the store is disabled, stale or unavailable.
+        """
+        if not ARTICLE_STORE:
+            return None
+        if topic not in self.stored:
+            try:
+                self.stored[topic] = load_stored_articles(topic)
+            except Exception as e:
+                logger.error(f"Article store unavailable for {topic}: {e}")
+                self.stored[topic] = None
+            for article in self.stored[topic] or ():
+                # Checkpointed like live summaries so saved digests can be rebuilt.
+                if article.url not in self.summaries:
+                    self.summaries[article.url] = article
+                    self.checkpoint.save("summaries", article.url, article.to_dict())
+            if self.stored[topic] is not None:
+                logger.info(f"Using {len(self.stored[topic])} stored articles for {topic}")
+        return self.stored[topic]
+
+    def add_stories(self, topic: str, articles: List[RawArticle]) -> None:
+        """
+        Cluster a topic's articles into stories (no-op without STORY_CLUSTERING).
+        """
+        if STORY_CLUSTERING:
+            self.stories.setdefault(topic, StoryClusterer()).add(articles)
+
+    def with_related(self, summarized: SummarizedArticle) -> SummarizedArticle:
+        """
+        Attach the (source, url) of the story's other articles to a summary.
+        """
+        stories = self.stories.get(summarized.topic)
+        related = stories.related(summarized.url) if stories else ()
+        return replace(summarized, related=related) if related != summarized.related else summarized
+
+    def saved_digest(self, user_id: int) -> Optional[Dict]:
+        """
+        Rebuild a checkpointed digest from the cached summaries.
+        """
+        record = self.digests.get(str(user_id))
+        if record is None:
+            return None
+
+        sections = {
+            topic: [self.with_related(self.summaries[url]) for url in urls if self.summaries.get(url)]
+            for topic, urls in record["sections"].items()
+        }
+        return {**record, "sections": {t: a for t, a in sections.items() if a}}
+
+    def save_digest(self, user_id: int, digest: Dict) -> None:
+        record = {
+            **digest,
+            "sections": {topic: [a.url for a in articles] for topic, articles in digest["sections"].items()},
+        }
+        self.digests[str(user_id)] = record
+        self.checkpoint.save("digests", str(user_id), record)
+
+    def mark_sent(self, user_id: int) -> None:
+        self.sent.add(str(user_id))
+        self.digests.pop(str(user_id), None)
+        self.checkpoint.save("sent", str(user_id), "sent")
+
+
+# ------------------------------------------------------------------
+# Stage iterators
+# ------------------------------------------------------------------
+def _iter_users_by_deadline(run_at: datetime, shard: Optional[Tuple[int, int]] = None) -> Iterator[Tuple[object, datetime, date, bool]]:
+    """
+    Stage 1: yield (user, deadline, digest_date, already_sent), earliest send
+    deadline first. A cohort's digest date is its local calendar date at
+    run_at, so subscribers east or west of the server get the right day.
+    Cohorts are popped from a heap keyed by their UTC send instant; the
+    members of each cohort are streamed with keyset pagination.
+
+    Every query runs in its own short session (cohorts once, then one per
+    page, with that page's sent check), so no connection or transaction is
+    held open while digests are summarized and sent.
+    """
+    heap = []
+    with get_session() as db:
+        for cohort in crud.get_send_cohorts(db, shard=shard):
+            digest_date = local_date(cohort.time_zone, run_at)
+            deadline = send_deadline_utc(cohort.preffered_time, cohort.time_zone, digest_date)
+            heap.append((deadline, cohort.time_zone, cohort.preffered_time, digest_date))
+    heapq.heapify(heap)
+
+    while heap:
+        deadline, time_zone, preffered_time, digest_date = heapq.heappop(heap)
+        last_id = 0
+        while True:
+            with get_session() as db:
+                page = crud.get_subscriber_page(
+                    db,
+                    after_id=last_id,
+                    page_size=SUBSCRIBER_BATCH_SIZE,
+                    shard=shard,
+                    preffered_times=[preffered_time],
+                    time_zone=time_zone,
+                )
+                sent = crud.get_sent_subscriber_ids(db, [user.id for user in page], digest_date)
+
+            for user in page:
+                yield user, deadline, digest_date, user.id in sent
+
+            if len(page) < SUBSCRIBER_BATCH_SIZE:
+                break
+            last_id = page[-1].id
+
+
+def _iter_raw_articles(topics: Iterable[str], cache: _RunCache, profiler: PipelineProfiler) -> Iterator[RawArticle]:
+    """
+    Stage 2: yield raw article metadata for the given topics, one article
+    (the representative) per story cluster.
+    """
+    for topic in topics:
+        if topic in cache.feeds:
+            CACHE_HITS.inc(cache="topic_feed")
+        else:
+            CACHE_MISSES.inc(cache="topic_feed")
+            with profiler.stage("fetch"):
+                cache.feeds[topic] = fetch_articles_for_topic(topic)
+            cache.checkpoint.save("fetched", topic, [a.to_dict() for a in cache.feeds[topic]])
+            with profiler.stage("cluster"):
+                cache.add_stories(topic, cache.feeds[topic])
+
+        stories = cache.stories.get(topic)
+        if stories is None:
+            yield from cache.feeds[topic]
+            continue
+
+        seen = set()
+        for article in cache.feeds[topic]:
+            cluster = stories.cluster_for(article.url)
+            key = cluster.index if cluster else article.url
+            if key not in seen:
+                seen.add(key)
+                yield cluster.representative if cluster else article
+
+
+def _iter_extracted(
+    articles: Iterable[RawArticle],
+    cache: _RunCache,
+    profiler: PipelineProfiler,
+    mode: DegradationMode = DegradationMode.FULL,
+) -> Iterator[Tuple[RawArticle, Optional[str]]]:
+    """
+    Stage 3: yield (article, cleaned_text) pairs.
+    cleaned_text is None when the article is already summarized in this run.
+    From FEED_ONLY on, the feed description replaces full extraction.
+    """
+    for article in articles:
+        if article.url in cache.summaries:
+            yield article, None
+            continue
+
+        cleaned = _extract(article, cache, profiler, mode)
+        if not cleaned:
+            article, cleaned = _story_fallback(article, cache, profiler, mode)
+
+        yield article, cleaned
+
+
+def _extract(
+    article: RawArticle,
+    cache: _RunCache,
+    profiler: PipelineProfiler,
+    mode: DegradationMode = DegradationMode.FULL,
+) -> str:
+    """
+    Cleaned text of one article (checkpointed), or "" when extraction failed.
+    """
+    cleaned = cache.extracted.pop(article.url, None)
+    if cleaned is None and mode >= DegradationMode.FEED_ONLY:
+        cleaned = clean_text(article.description, article.source)
+    elif cleaned is None:
+        with profiler.stage("extract"):
+            text = extract_article_text(article.url, nlp=mode == DegradationMode.FULL)
+            cleaned = clean_text(text, article.source) if text else ""
+        cache.checkpoint.save("extracted", article.url, cleaned)
+    return cleaned
+
+
+def _story_fallback(
+    article: RawArticle,
+    cache: _RunCache,
+    profiler: PipelineProfiler,
+    mode: DegradationMode = DegradationMode.FULL,
+) -> Tuple[RawArticle, Optional[str]]:
+    """
+    A story representative without text: promote the next member of its
+    story that has text (or is already summarized), so the story is not
+    dropped. With none, fall back to the representative's feed description.
+    Unclustered articles without text are dropped as before.
+    """
+    stories = cache.stories.get(article.topic)
+    cluster = stories.cluster_for(article.url) if stories else None
+    if cluster is None:
+        return article, ""
+
+    for member in list(cluster.members[1:]):
+        if cache.summaries.get(member.url):
+            stories.promote(member)
+            return member, None
+        if member.url in cache.summaries:
+            continue
+        cleaned = _extract(member, cache, profiler, mode)
+        if cleaned:
+            stories.promote(member)
+            logger.info(f"Story lead {article.url} has no text; summarizing {member.url} instead")
+            return member, cleaned
+        cache.summaries[member.url] = None
+
+    return article, clean_text(article.description, article.source)
+
+
+def _iter_summarized(
+    extracted: Iterable[Tuple[RawArticle, Optional[str]]],
+    cache: _RunCache,
+    profiler: PipelineProfiler,
+    mode: DegradationMode = DegradationMode.FULL,
+) -> Iterator[SummarizedArticle]:
+    """
+    Stage 4: yield summarized articles. The article body goes out of scope
+    right after summarization; only the summary is kept in the run cache.
+    """
+    for article, cleaned in extracted:
+        url = article.url
+
+        if url in cache.summaries:
+            CACHE_HITS.inc(cache="summary")
+        else:
+            CACHE_MISSES.inc(cache="summary")
+            summarized = _summarize(article, cleaned, cache, profiler, mode) if cleaned else None
+            cache.summaries[url] = summarized
+            cache.checkpoint.save("summaries", url, summarized.to_dict() if summarized else None)
+            if summarized and ARCHIVE_SUMMARIES:
+                cache.archive.archive(article, summarized)
+
+        summarized = cache.summaries[url]
+        if summarized:
+            yield cache.with_related(summarized)
+
+
+def _summarize(
+    article: RawArticle,
+    cleaned: str,
+    cache: _RunCache,
+    profiler: PipelineProfiler,
+    mode: DegradationMode = DegradationMode.FULL,
+) -> SummarizedArticle:
+    """
+    Summarize one cleaned article body and attach its metadata.
+    No LLM call is made in EXTRACTIVE mode or once the run's token budget is spent.
+    """
+    stories = cache.stories.get(article.topic)
+    other_reports = stories.other_reports(article.url) if stories else ""
+
+    with profiler.stage("summarize"):
+        text = prepare_article(cleaned) if mode < DegradationMode.EXTRACTIVE else ""
+        if text and cache.token_budget.reserve(estimate_input_tokens(text, SUMMARY_PROMPT + other_reports)):
+            ai_result = summarize_article(
+                text,
+                on_usage=partial(_record_usage, cache, hash_url(article.url)),
+                other_reports=other_reports,
+                topic=article.topic,
+            )
+        else:
+            ai_result = extractive_summary(cleaned, category=article.topic)
+
+    return SummarizedArticle.from_ai_result(article, ai_result)
+
+
+def _record_usage(cache: _RunCache, article_hash: str, stage: str, input_tokens: int = 0, input_chars: int = 0, **usage) -> None:
+    """
+    Record one LLM call; calls beyond the reserved summarize call (JSON
+    re-asks) are charged to the run's token budget here.
+    """
+    cache.usage.record(article_hash, stage=stage, input_tokens=input_tokens, input_chars=input_chars, **usage)
+    if stage != "summarize":
+        cache.token_budget.charge(input_tokens or math.ceil(input_chars / LLM_CHARS_PER_TOKEN))
+
 
-def run_daily_pipeline() -> None:
+def _ranked_articles_for_user(
+    user,
+    cache: _RunCache,
+    profiler: PipelineProfiler,
+    mode: DegradationMode = DegradationMode.FULL,
+) -> List[SummarizedArticle]:
+    """
+    Stages 2-5 composed as iterators for one user; returns the top articles.
+    Topics served by the article store skip the fetch/extract/summarize stages.
+    """
+    with profiler.stage("store"):
+        stored = {topic: cache.stored_articles(topic) for topic in user.topics}
+    live_topics = [topic for topic in user.topics if stored[topic] is None]
+
+    raw = _iter_raw_articles(live_topics, cache, profiler)
+    # No read-ahead thread under CPU profiling (cProfile is per main thread here).
+    read_ahead = 0 if profiler.cpu else PIPELINE_QUEUE_SIZE
+    extracted = buffered(_iter_extracted(raw, cache, profiler, mode), maxsize=read_ahead, name="extract")
+    summarized = chain(
+        (article for articles in stored.values() if articles for article in articles),
+        _iter_summarized(extracted, cache, profiler, mode),
+    )
+
+    try:
+        with profiler.stage("dedup_rank"):
+            return rank_articles(iter_unique_articles(summarized))
+    finally:
+        extracted.close()
+
+
+# ------------------------------------------------------------------
+# Pipeline
+# ------------------------------------------------------------------
+def run_daily_pipeline(
+    profiler: Optional[PipelineProfiler] = None,
+    shard: Optional[Tuple[int, int]] = None,
+    run_id: Optional[str] = None,
+) -> None:
     """
     Run the daily news digest pipeline for all eligible users.
+
+    Feeds and summaries are cached for the duration of the run, so users
+    sharing topics do not trigger repeated fetches or LLM calls.
+
+    profiler: optional PipelineProfiler; defaults to the PIPELINE_PROFILE* settings.
+    shard: optional (index, count) to process only subscribers with id % count == index.
+    run_id: resume (or start) this checkpointed run; defaults to the UTC
+        date, and a finished default run is started over. An explicit run id
+        is checkpointed even without PIPELINE_CHECKPOINTS.
     """
 
     logger.info("Starting daily news pipeline")
 
-    today = date.today()
+    run_at = utc_now()
+    checkpoint = RunCheckpoint(
+        run_id or default_run_id(run_at.date(), shard),
+        enabled=PIPELINE_CHECKPOINTS or run_id is not None,
+    )
+    manifest = checkpoint.manifest()
+
+    if manifest.get("status") == "finished" and run_id is None:
+        checkpoint.clear()
+        manifest = {}
+    if manifest:
+        if manifest.get("run_at"):
+            run_at = datetime.fromisoformat(manifest["run_at"])
+        logger.info(f"Resuming pipeline run {checkpoint.run_id} (status: {manifest.get('status')})")
+
+    checkpoint.update_manifest(
+        digest_date=run_at.date().isoformat(),
+        run_at=run_at.isoformat(timespec="seconds"),
+        shard=list(shard) if shard else None,
+        status="running",
+        started_at=manifest.get("started_at", now_iso()),
+        attempts=manifest.get("attempts", 0) + 1,
+    )
+
+    started = time.perf_counter()
+    profiler = profiler or PipelineProfiler.from_env()
+    profiler.start()
+    try:
+        load_source_health()
+    except Exception as e:
+        # Health is an optimization; run with default timeouts and closed breakers.
+        logger.error(f"Failed to load source health: {e}")
+
+    try:
+        _run(run_at, profiler, shard, checkpoint)
+        checkpoint.update_manifest(status="finished", finished_at=now_iso())
+    except BaseException:
+        checkpoint.update_manifest(status="failed")
+        raise
+    finally:
+        checkpoint.close()
+        try:
+            save_source_health()
+        except Exception as e:
+            logger.error(f"Failed to save source health: {e}")
+
+        LAST_RUN_SECONDS.set(time.perf_counter() - started)
+        LAST_RUN_TIMESTAMP.set(time.time())
+        write_metrics_file()
+
+        report = profiler.finish()
+        if report:
+            logger.info(f"Pipeline profile written to {report}")
 
-    with get_session() as db:
-        users = crud.get_active_verified_subscribers(db)
+    logger.info("Daily news pipeline finished")
+
+
+def _run(
+    run_at: datetime,
+    profiler: PipelineProfiler,
+    shard: Optional[Tuple[int, int]] = None,
+    checkpoint: Optional[RunCheckpoint] = None,
+) -> None:
+    """
+    Process every eligible user; each cohort's digest date is its local
+    date at run_at (the run's first start, kept across resumes).
+    """
+    cache = _RunCache(checkpoint)
+    governor = RunGovernor()
+    processed = 0
 
-        if not users:
-            logger.info("No active verified subscribers found.")
-            return
+    with EmailLogWriter() as log_writer, cache.usage, cache.archive:
+        users = _iter_users_by_deadline(run_at, shard)
 
-        logger.info(f"Found {len(users)} active subscribers")
+        while True:
+            with profiler.stage("subscribers"):
+                user, deadline, digest_date, already_sent = next(users, (None, None, None, False))
+                if user is None:
+                    break
+                already_sent = already_sent or str(user.id) in cache.sent
 
-        for user in users:
-            logger.info(f"Processing user: {user.email}")
+            processed += 1
+            user_started = time.perf_counter()
+            user_log = log_fields(stage="subscribers", email=user.email)
+            logger.debug("Processing user", extra=user_log)
 
             # Prevent duplicate emails for same day
-            if crud.has_digest_been_sent(db, user.id, today):
-                logger.info(f"Digest already sent today for {user.email}")
+            if already_sent:
+                logger.info("Digest already sent today", extra=user_log)
+                USERS_PROCESSED.inc(outcome="already_sent")
                 continue
 
             try:
-                # --------------------------------------------------
-                # 1. Fetch raw articles based on user topics
-                # --------------------------------------------------
-                raw_articles = fetch_articles_for_topics(user.topics)
+                digest = cache.saved_digest(user.id)
 
-                if not raw_articles:
-                    logger.warning(f"No articles found for user {user.email}")
-                    continue
+                if digest is None:
+                    mode = governor.mode_for(deadline)
 
-                # --------------------------------------------------
-                # 2. Extract + clean + summarize articles
-                # --------------------------------------------------
-                summarized_articles = []
-
-                for article in raw_articles:
-                    text = extract_article_text(article["url"])
-                    if not text:
-                        continue
+                    # --------------------------------------------------
+                    # 1. Fetch, extract, summarize, dedup + rank (streamed)
+                    # --------------------------------------------------
+                    ranked_articles = _ranked_articles_for_user(user, cache, profiler, mode)
 
-                    cleaned = clean_text(text)
-                    if not cleaned:
+                    if not ranked_articles:
+                        logger.warning("No summarized articles for user", extra=log_fields(stage="summarize", email=user.email, duration=time.perf_counter() - user_started))
+                        USERS_PROCESSED.inc(outcome="no_articles")
                         continue
 
-                    ai_result = summarize_article(cleaned)
+                    # --------------------------------------------------
+                    # 2. Build digest for user
+                    # --------------------------------------------------
+                    with profiler.stage("build"):
+                        digest = build_digest_for_user(user, ranked_articles)
+                        digest["mode"] = mode.label
 
-                    summarized_articles.append({
-                        "title": article["title"],
-                        "url": article["url"],
-                        "source": article["source"],
-                        "topic": article["topic"],
-
-                        # AI output
-                        "bullets": ai_result.get("bullets", []),
-                        "summary": ai_result.get("summary", ""),
-                        "category": ai_result.get("category", article["topic"]),
-                        "importance_score": ai_result.get("importance_score", 3),
-                    })
-
-                if not summarized_articles:
-                    logger.warning(f"No summarized articles for {user.email}")
-                    continue
-
-                # --------------------------------------------------
-                # 3. Deduplicate & rank articles
-                # --------------------------------------------------
-                summarized_articles = deduplicate_articles(summarized_articles)
-                summarized_articles = rank_articles(summarized_articles)
-
-                # --------------------------------------------------
-                # 4. Build digest for user
-                # --------------------------------------------------
-                digest = build_digest_for_user(user, summarized_articles)
+                    if digest["sections"]:
+                        DIGESTS_BUILT.inc(mode=mode.label)
+                        cache.save_digest(user.id, digest)
 
                 if not digest["sections"]:
-                    logger.warning(f"Empty digest for {user.email}")
+                    logger.warning("Empty digest for user", extra=log_fields(stage="build", email=user.email, duration=time.perf_counter() - user_started))
+                    USERS_PROCESSED.inc(outcome="empty_digest")
                     continue
 
                 # --------------------------------------------------
-                # 5. Render HTML email
+                # 3. Render HTML email
                 # --------------------------------------------------
-                html_body = render_digest_html(digest)
+                with profiler.stage("render"):
+                    html_body = render_digest_html(digest)
 
                 subject = f"🗞️ {APP_NAME} — Daily News Digest"
 
                 # --------------------------------------------------
-                # 6. Send email
+                # 4. Send email
                 # --------------------------------------------------
-                success = send_email(
-                    to_email=user.email,
-                    subject=subject,
-                    html_body=html_body,
-                )
+                with profiler.stage("send"):
+                    success = send_email(
+                        to_email=user.email,
+                        subject=subject,
+                        html_body=html_body,
+                    )
 
                 # --------------------------------------------------
-                # 7. Log email status
+                # 5. Log email status (buffered, committed per batch)
                 # --------------------------------------------------
-                if success:
-                    crud.log_email_status(
-                        db=db,
-                        subscriber_id=user.id,
-                        digest_date=today,
-                        subject=subject,
-                        status="sent",
-                        provider="smtp",
-                    )
-                    logger.info(f"Email sent successfully to {user.email}")
-                else:
-                    crud.log_email_status(
-                        db=db,
-                        subscriber_id=user.id,
-                        digest_date=today,
-                        subject=subject,
-                        status="failed",
-                        provider="smtp",
-                        error_message="SMTP send failed",
-                    )
-                    logger.error(f"Email send failed for {user.email}")
+                with profiler.stage("log"):
+                    if success:
+                        SEND_LATENESS.observe(max(0.0, (utc_now() - deadline).total_seconds()))
+                        cache.mark_sent(user.id)
+                        log_writer.log(
+                            subscriber_id=user.id,
+                            digest_date=digest_date,
+                            subject=subject,
+                            status="sent",
+                            provider="smtp",
+                        )
+                        USERS_PROCESSED.inc(outcome="sent")
+                        logger.info(
+                            f"Digest delivered ({digest.get('mode', 'full')})",
+                            extra=log_fields(stage="log", email=user.email, duration=time.perf_counter() - user_started),
+                        )
+                    else:
+                        log_writer.log(
+                            subscriber_id=user.id,
+                            digest_date=digest_date,
+                            subject=subject,
+                            status="failed",
+                            provider="smtp",
+                            error_message="SMTP send failed",
+                        )
+                        USERS_PROCESSED.inc(outcome="failed")
+                        logger.error(
+                            "Digest delivery failed",
+                            extra=log_fields(stage="log", email=user.email, duration=time.perf_counter() - user_started),
+                        )
 
             except Exception as e:
-                logger.exception(f"Pipeline error for user {user.email}: {e}")
+                USERS_PROCESSED.inc(outcome="error")
+                logger.exception(
+                    "Pipeline error for user: %s", e,
+                    extra=log_fields(stage="subscribers", email=user.email, duration=time.perf_counter() - user_started),
+                )
 
-    logger.info("Daily news pipeline finished")
+    if not processed:
+        logger.info("No active verified subscribers found.")
+    else:
+        logger.info(f"Processed {processed} active subscribers")
 
 
 if __name__ == "__main__":
-    run_daily_pipeline()
+    parser = argparse.ArgumentParser(description="Run the daily news digest pipeline.")
+    parser.add_argument("--profile", action="store_true", help="Record per-stage timing spans.")
+    parser.add_argument("--profile-cpu", action="store_true", help="Capture cProfile stats per stage.")
+    parser.add_argument("--profile-memory", action="store_true", help="Capture tracemalloc growth and top allocations.")
+    parser.add_argument("--shard", metavar="INDEX/COUNT", help="Only process subscribers with id %% COUNT == INDEX, e.g. 0/4.")
+    parser.add_argument("--run-id", help="Resume (or start) this checkpointed run; defaults to today's UTC date.")
+    args = parser.parse_args()
+
+    shard = None
+    if args.shard:
+        index, _, count = args.shard.partition("/")
+        shard = (int(index), int(count))
+
+    default = PipelineProfiler.from_env()
+    run_daily_pipeline(
+        PipelineProfiler(
+            enabled=args.profile or default.enabled,
+            cpu=args.profile_cpu or default.cpu,
+            memory=args.profile_memory or default.memory,
+        ),
+        shard=shard,
+        run_id=args.run_id,
+    )
@@ -0,0 +1,219 @@
+"""
+jobs/import_subscribers.py
+--------------------------
+
+Bulk import of subscribers from CSV or JSONL.
+
+Input columns / keys:
+- email (required)
+- topics (optional): JSON list, or "Technology;Business" in CSV
+- preffered_time (optional, HH:MM), time_zone (optional, e.g. Asia/Kolkata)
+
+Rows are validated in batches, de-duplicated, and upserted with one
+INSERT ... ON CONFLICT per batch (committed per batch). Existing
+subscribers are left untouched unless --update is given, in which case the
+preference columns present in the file are overwritten.
+
+Usage:
+    python jobs/import_subscribers.py subscribers.csv --verified
+    python jobs/import_subscribers.py subscribers.jsonl --update --rejects rejected.txt
+"""
+
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT_DIR))
+
+import argparse
+import csv
+import json
+import re
+import time
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+from backend.config import DEFAULT_PREFFERED_TIME, DEFAULT_TIMEZONE, TOPICS
+from backend.db.connection import get_session
+from backend.db import crud
+from backend.email.validators import partition_valid_emails
+from backend.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+TIME_REGEX = re.compile(r"^([01]\d|2[0-3]):[0-5]\d$")
+TOPIC_SEPARATORS = re.compile(r"[;,|]")
+
+# Preference columns that --update may overwrite (when present in the file).
+PREFERENCE_FIELDS = ("topics", "preffered_time", "time_zone")
+
+
+#-------------------------------------------------------
+# Import report
+#-------------------------------------------------------
+@dataclass
+class ImportReport:
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    rejected: int = 0
+    seconds: float = 0.0
+
+    def __str__(self) -> str:
+        total = self.inserted + self.updated + self.unchanged + self.rejected
+        rate = total / self.seconds if self.seconds else 0.0
+        return (
+            f"inserted={self.inserted} updated={self.updated} unchanged={self.unchanged} "
+            f"rejected={self.rejected} ({total} rows in {self.seconds:.1f}s, {rate:.0f} rows/s)"
+        )
+
+
+#-------------------------------------------------------
+# Readers
+#-------------------------------------------------------
+def _read_rows(handle: TextIO, fmt: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream raw records from a CSV or JSONL file.
+    """
+    if fmt == "csv":
+        yield from csv.DictReader(handle)
+        return
+
+    for line in handle:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            record = {"email": line}  # surfaces as a rejected row
+        yield record if isinstance(record, dict) else {"email": str(record)}
+
+
+def _parse_topics(value: Any) -> List[str]:
+    if isinstance(value, list):
+        items = value
+    else:
+        items = TOPIC_SEPARATORS.split(value or "")
+    return sorted({t.strip() for t in items if isinstance(t, str) and t.strip() in TOPICS})
+
+
+#-------------------------------------------------------
+# Batch normalization
+#-------------------------------------------------------
+def _normalize_batch(
+    records: List[Dict[str, Any]],
+    verified: bool,
+    valid_time_zones: frozenset,
+) -> tuple:
+    """
+    Validate one batch. Returns (rows, rejected_values).
+    Emails are validated in one pass; later duplicates in the batch win.
+    """
+    valid_emails, rejected = partition_valid_emails(r.get("email") or "" for r in records)
+    valid_set = set(valid_emails)
+
+    rows: Dict[str, Dict[str, Any]] = {}
+    for record in records:
+        email = (record.get("email") or "").strip().lower()
+        if email not in valid_set:
+            continue
+
+        preffered_time = (record.get("preffered_time") or DEFAULT_PREFFERED_TIME).strip()
+        time_zone = (record.get("time_zone") or DEFAULT_TIMEZONE).strip()
+        if not TIME_REGEX.match(preffered_time) or time_zone not in valid_time_zones:
+            rejected.append(email)
+            continue
+
+        rows[email] = {
+            "email": email,
+            "topics": _parse_topics(record.get("topics")),
+            "preffered_time": preffered_time,
+            "time_zone": time_zone,
+            "is_active": True,
+            "is_verified": verified,
+        }
+
+    return list(rows.values()), rejected
+
+
+#-------------------------------------------------------
+# Import
+#-------------------------------------------------------
+def import_subscribers(
+    path: Path,
+    fmt: Optional[str] = None,
+    batch_size: int = 1000,
+    update: bool = False,
+    verified: bool = False,
+    rejects_path: Optional[Path] = None,
+) -> ImportReport:
+    """
+    Import subscribers from `path` and return the counts.
+    """
+    import pytz
+
+    fmt = fmt or ("csv" if path.suffix.lower() == ".csv" else "jsonl")
+    valid_time_zones = frozenset(pytz.all_timezones)
+    report = ImportReport()
+    started = time.perf_counter()
+
+    update_fields: List[str] = []
+    rejects = rejects_path.open("w", encoding="utf-8") if rejects_path else None
+
+    try:
+        with path.open(newline="", encoding="utf-8") as handle:
+            records = _read_rows(handle, fmt)
+
+            while True:
+                batch = list(islice(records, batch_size))
+                if not batch:
+                    break
+
+                if update and not update_fields:
+                    update_fields = [f for f in PREFERENCE_FIELDS if f in batch[0]]
+                    if verified:
+                        update_fields.append("is_verified")
+
+                rows, rejected = _normalize_batch(batch, verified, valid_time_zones)
+                report.rejected += len(rejected)
+                if rejects:
+                    rejects.writelines(f"{value}\n" for value in rejected)
+
+                with get_session() as db:
+                    inserted, updated = crud.bulk_upsert_subscribers(db, rows, update_fields)
+
+                report.inserted += inserted
+                report.updated += updated
+                report.unchanged += len(rows) - inserted - updated
+    finally:
+        if rejects:
+            rejects.close()
+
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+#-------------------------------------------------------
+# Main
+#-------------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk import subscribers from CSV or JSONL.")
+    parser.add_argument("path", type=Path, help="CSV or JSONL file.")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="Defaults to the file extension.")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per INSERT/commit.")
+    parser.add_argument("--update", action="store_true", help="Overwrite preferences of existing subscribers.")
+    parser.add_argument("--verified", action="store_true", help="Mark imported subscribers as verified.")
+    parser.add_argument("--rejects", type=Path, help="Write rejected values to this file.")
+    args = parser.parse_args()
+
+    result = import_subscribers(
+        args.path,
+        fmt=args.format,
+        batch_size=args.batch_size,
+        update=args.update,
+        verified=args.verified,
+        rejects_path=args.rejects,
+    )
+    logger.info(f"Subscriber import finished: {result}")
@@ -0,0 +1,149 @@
+"""
+jobs/ingester.py
+----------------
+
+Background feed ingester for the article store (backend/news/store.py).
+
+It polls NEWS_SOURCES feeds, stores entries not seen before, and extracts +
+summarizes new story representatives (INGEST_BATCH_SIZE per poll). Digests
+then read the last ARTICLE_STORE_WINDOW_HOURS from the store instead of
+starting from nothing.
+
+With FEED_ADAPTIVE_POLLING each feed is polled on its own interval, learned
+from its publish cadence (backend/news/scheduler.py); the ingester wakes
+when the next feed is due. Otherwise every feed is polled each
+INGEST_INTERVAL_SECONDS.
+
+Usage:
+    python -m jobs.ingester                 # run forever
+    python -m jobs.ingester --once          # one poll + processing pass
+    python -m jobs.ingester --topics Technology Business
+    python -m jobs.ingester --stats         # per-feed schedule and poll statistics
+"""
+
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT_DIR))
+
+import argparse
+import time
+
+from backend.config import FEED_ADAPTIVE_POLLING, INGEST_BATCH_SIZE, INGEST_INTERVAL_SECONDS
+from backend.db import crud
+from backend.db.connection import get_session, init_db
+from backend.news.health import load_source_health, save_source_health
+from backend.news.scheduler import FEED_SCHEDULE, iter_feeds, load_feed_schedule, save_feed_schedule
+from backend.news.store import ArticleIngester
+from backend.utils.logger import get_logger
+from backend.utils.metrics import counter, gauge, histogram, start_metrics_server, write_metrics_file
+
+logger = get_logger(__name__)
+
+INGEST_POLLS = counter("ingest_polls_total", "Ingester poll iterations.")
+INGEST_ERRORS = counter("ingest_errors_total", "Ingester iterations that raised an error.")
+INGEST_POLL_SECONDS = histogram(
+    "ingest_poll_seconds",
+    "Wall time of one ingest poll and processing pass.",
+    buckets=(5, 15, 30, 60, 120, 300, 600),
+)
+HEARTBEAT = gauge("ingest_heartbeat_timestamp_seconds", "Unix time of the last ingester iteration.")
+
+
+def run_once(ingester: ArticleIngester, batch_size: int = INGEST_BATCH_SIZE, adaptive: bool = FEED_ADAPTIVE_POLLING) -> None:
+    """
+    One poll (of the due feeds when adaptive, else of every feed), then
+    summarize new articles until the batch is used.
+    """
+    INGEST_POLLS.inc()
+    HEARTBEAT.set(time.time())
+
+    with INGEST_POLL_SECONDS.time():
+        load_source_health()
+        try:
+            stored = ingester.poll_due(FEED_SCHEDULE) if adaptive else ingester.poll()
+            report = ingester.process(batch_size)
+        finally:
+            save_source_health()
+            if adaptive:
+                save_feed_schedule()
+
+    logger.info(
+        f"Ingest poll: {stored} new articles, {report.summarized} summarized, "
+        f"{report.clustered} clustered, {report.failed} failed"
+    )
+
+
+def run_ingester(topics=None, once: bool = False, interval: int = INGEST_INTERVAL_SECONDS) -> None:
+    """
+    Poll feeds forever (or once), keeping the article store current.
+    """
+    logger.info("Ingester started")
+    init_db()
+
+    ingester = ArticleIngester(topics)
+    logger.info(f"Seeded story clusters with {ingester.seed()} stored articles")
+
+    adaptive = FEED_ADAPTIVE_POLLING and not once
+    if adaptive:
+        load_feed_schedule()
+        FEED_SCHEDULE.sync(iter_feeds(ingester.topics))
+
+    if not once and start_metrics_server():
+        logger.info("Serving metrics on localhost")
+
+    while True:
+        try:
+            run_once(ingester, adaptive=adaptive)
+        except Exception as e:
+            INGEST_ERRORS.inc()
+            logger.exception(f"Ingester error: {e}")
+
+        write_metrics_file()
+
+        if once:
+            return
+        # Adaptive: wake when the next feed is due (at most `interval` apart,
+        # so a summarization backlog keeps draining).
+        time.sleep(max(1.0, min(interval, FEED_SCHEDULE.seconds_until_next())) if adaptive else interval)
+
+
+def print_stats() -> int:
+    """
+    Per-feed poll interval, learned publish gap and poll / new-item counts.
+    """
+    with get_session() as db:
+        rows = crud.get_feed_schedules(db)
+        if not rows:
+            print("No feed schedule recorded (adaptive polling has not run yet).")
+            return 0
+
+        print(f"{'source':<20} {'topic':<12} {'gap':>7} {'interval':>9} {'polls':>6} {'empty':>6} {'failed':>7} {'new':>6} {'new/poll':>9}  next poll")
+        for row in sorted(rows, key=lambda r: (r.source, r.topic)):
+            gap = f"{row.publish_gap_seconds / 60:.0f}m" if row.publish_gap_seconds else "-"
+            per_poll = row.new_items / row.polls if row.polls else 0.0
+            print(
+                f"{row.source[:20]:<20} {row.topic:<12} {gap:>7} {row.interval_seconds / 60:>8.0f}m "
+                f"{row.polls:>6} {row.empty_polls:>6} {row.failed_polls:>7} {row.new_items:>6} {per_poll:>9.2f}  {row.next_poll_at}"
+            )
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Poll news feeds into the article store.")
+    parser.add_argument("--once", action="store_true", help="Run a single poll and exit.")
+    parser.add_argument("--topics", nargs="+", help="Topics to poll (default: every topic in NEWS_SOURCES).")
+    parser.add_argument("--interval", type=int, default=INGEST_INTERVAL_SECONDS, help="Seconds between polls (longest sleep when adaptive).")
+    parser.add_argument("--stats", action="store_true", help="Print per-feed poll statistics and exit.")
+    args = parser.parse_args()
+
+    if args.stats:
+        return print_stats()
+
+    run_ingester(args.topics, once=args.once, interval=args.interval)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
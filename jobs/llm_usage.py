@@ -0,0 +1,166 @@
+"""
+jobs/llm_usage.py
+-----------------
+
+LLM usage and cost report from the llm_usage table.
+
+Shows totals, per-stage / per-model breakdowns, percentiles of tokens,
+latency and cost per call, and the most expensive articles. Use it to tune
+LLM_INPUT_TOKENS_PER_ARTICLE, MAX_ARTICLES_TEXT_CHARS and LLM_MAX_OUTPUT_TOKENS
+(calls that hit the output cap are counted as truncated).
+
+Usage:
+    python -m jobs.llm_usage runs
+    python -m jobs.llm_usage report                 # latest run
+    python -m jobs.llm_usage report --run-id 2026-01-31
+    python -m jobs.llm_usage report --days 7 --top 20
+"""
+
+import argparse
+import math
+import sys
+from collections import defaultdict
+from datetime import timedelta
+from typing import Dict, List, Sequence
+
+from backend.config import LLM_MAX_OUTPUT_TOKENS
+from backend.db import crud
+from backend.db.connection import get_session
+from backend.utils.time_utils import utc_now
+
+PERCENTILES = (50, 90, 95, 99)
+METRICS = ("input_tokens", "output_tokens", "input_chars", "latency_seconds", "cost_usd")
+
+
+#-------------------------------------------------------
+# Helpers
+#-------------------------------------------------------
+def _percentile(ordered: Sequence[float], p: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted sequence.
+    """
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+def _fmt(value: float) -> str:
+    if isinstance(value, float) and value < 1:
+        return f"{value:.5f}"
+    return f"{value:,.1f}" if isinstance(value, float) else f"{value:,}"
+
+
+def _totals(rows: List) -> Dict[str, float]:
+    return {
+        "calls": len(rows),
+        "input_tokens": sum(r.input_tokens for r in rows),
+        "output_tokens": sum(r.output_tokens for r in rows),
+        "cached_tokens": sum(r.cached_tokens for r in rows),
+        "cost_usd": sum(r.cost_usd for r in rows),
+    }
+
+
+#-------------------------------------------------------
+# Commands
+#-------------------------------------------------------
+def _runs(args) -> int:
+    with get_session() as db:
+        runs = crud.get_llm_usage_runs(db, limit=args.limit)
+
+    if not runs:
+        print("No LLM usage recorded.")
+        return 0
+
+    for run in runs:
+        print(
+            f"{run.run_id:<24} calls={run.calls:<6} input={run.input_tokens:<10,} "
+            f"output={run.output_tokens:<9,} cost=${run.cost_usd:.4f} started_at={run.started_at}"
+        )
+    return 0
+
+
+def _report(args) -> int:
+    with get_session() as db:
+        if args.days:
+            scope = f"last {args.days} days"
+            rows = crud.get_llm_usage(db, since=utc_now() - timedelta(days=args.days))
+        else:
+            run_id = args.run_id
+            if run_id is None:
+                latest = crud.get_llm_usage_runs(db, limit=1)
+                run_id = latest[0].run_id if latest else None
+            scope = f"run {run_id}"
+            rows = crud.get_llm_usage(db, run_id=run_id) if run_id else []
+
+    if not rows:
+        print(f"No LLM usage recorded for {scope}.")
+        return 0
+
+    totals = _totals(rows)
+    articles = {(r.run_id, r.article_hash) for r in rows}
+    cache_hits = sum(1 for r in rows if r.cached_tokens > 0)
+    truncated = sum(1 for r in rows if r.output_tokens >= LLM_MAX_OUTPUT_TOKENS)
+
+    print(f"LLM usage for {scope}")
+    print(f"    calls          {totals['calls']:,} ({len(articles):,} articles)")
+    print(f"    input tokens   {totals['input_tokens']:,} ({totals['cached_tokens']:,} cached)")
+    print(f"    output tokens  {totals['output_tokens']:,}")
+    print(f"    cost           ${totals['cost_usd']:.4f} (${totals['cost_usd'] / len(articles):.5f} per article)")
+    print(f"    cache hits     {cache_hits:,} of {len(rows):,} calls")
+    print(f"    truncated      {truncated:,} calls at LLM_MAX_OUTPUT_TOKENS={LLM_MAX_OUTPUT_TOKENS}")
+
+    print("\nBy stage / model")
+    groups: Dict[tuple, List] = defaultdict(list)
+    for r in rows:
+        groups[(r.stage, r.model)].append(r)
+    for (stage, model), group in sorted(groups.items()):
+        t = _totals(group)
+        print(
+            f"    {stage:<10} {model:<24} calls={t['calls']:<6} input={t['input_tokens']:<10,} "
+            f"output={t['output_tokens']:<9,} cost=${t['cost_usd']:.4f}"
+        )
+
+    print("\nPer call " + " ".join(f"{'p' + str(p):>10}" for p in PERCENTILES) + f"{'max':>11}")
+    for metric in METRICS:
+        ordered = sorted(getattr(r, metric) for r in rows)
+        values = [_percentile(ordered, p) for p in PERCENTILES] + [ordered[-1]]
+        print(f"    {metric:<16}" + "".join(f"{_fmt(v):>11}" for v in values))
+
+    print(f"\nTop {args.top} articles by cost")
+    per_article: Dict[tuple, List] = defaultdict(list)
+    for r in rows:
+        per_article[(r.run_id, r.article_hash)].append(r)
+    ranked = sorted(per_article.items(), key=lambda item: sum(r.cost_usd for r in item[1]), reverse=True)
+    for (run_id, article_hash), calls in ranked[: args.top]:
+        t = _totals(calls)
+        print(
+            f"    {article_hash[:16]}  run={run_id:<20} calls={t['calls']} "
+            f"input={t['input_tokens']:,} output={t['output_tokens']:,} cost=${t['cost_usd']:.5f}"
+        )
+    return 0
+
+
+#-------------------------------------------------------
+# Main
+#-------------------------------------------------------
+def main() -> int:
+    parser = argparse.ArgumentParser(description="LLM usage and cost accounting.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    runs = commands.add_parser("runs", help="Per-run totals, newest first.")
+    runs.add_argument("--limit", type=int, default=20)
+    runs.set_defaults(func=_runs)
+
+    report = commands.add_parser("report", help="Totals, percentiles and top cost contributors.")
+    scope = report.add_mutually_exclusive_group()
+    scope.add_argument("--run-id", help="Report one run (default: the latest run).")
+    scope.add_argument("--days", type=int, help="Report every call in the last N days.")
+    report.add_argument("--top", type=int, default=10, help="Most expensive articles to list.")
+    report.set_defaults(func=_report)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""
+jobs/retention.py
+-----------------
+
+Retention for email_logs: keeps the hot table bounded.
+
+Detail rows with a digest_date older than the horizon are, batch by batch:
+1. counted into email_log_daily (digest_date, status, provider -> count),
+2. deleted from email_logs,
+3. appended to a gzipped JSONL archive under EMAIL_LOG_ARCHIVE_DIR.
+
+Steps 1 and 2 share one transaction, so a rollup is never counted twice.
+Rows are archived only after that transaction commits, so a batch that
+rolls back (and is retried by the next run) is never archived twice.
+
+Usage (e.g. daily from cron):
+    python jobs/retention.py
+    python jobs/retention.py --days 30 --batch-size 10000 --no-archive
+"""
+
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT_DIR))
+
+import argparse
+import gzip
+import json
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from backend.config import EMAIL_LOG_ARCHIVE_DIR, EMAIL_LOG_RETENTION_DAYS, RETENTION_BATCH_SIZE
+from backend.db.connection import get_session
+from backend.db import crud
+from backend.utils.logger import get_logger
+from backend.utils.metrics import counter
+
+logger = get_logger(__name__)
+
+ROWS_ARCHIVED = counter("retention_email_logs_archived_total", "email_logs rows written to the archive.")
+ROWS_DELETED = counter("retention_email_logs_deleted_total", "email_logs rows rolled up and deleted.")
+
+
+#-------------------------------------------------------
+# Retention report
+#-------------------------------------------------------
+@dataclass
+class RetentionReport:
+    cutoff: date
+    deleted: int = 0
+    rollup_rows: int = 0
+    archive: Optional[Path] = None
+    seconds: float = 0.0
+
+    def __str__(self) -> str:
+        archive = f", archive={self.archive}" if self.archive else ""
+        return (
+            f"cutoff={self.cutoff} deleted={self.deleted} "
+            f"rollup_rows={self.rollup_rows} in {self.seconds:.1f}s{archive}"
+        )
+
+
+def _json_default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+#-------------------------------------------------------
+# Retention
+#-------------------------------------------------------
+def run_retention(
+    days: int = EMAIL_LOG_RETENTION_DAYS,
+    batch_size: int = RETENTION_BATCH_SIZE,
+    archive_dir: Optional[str] = EMAIL_LOG_ARCHIVE_DIR,
+    today: Optional[date] = None,
+) -> RetentionReport:
+    """
+    Roll up, archive and delete email_logs rows older than `days` days.
+    `days` is at least 1: today's rows back has_digest_been_sent().
+    """
+    cutoff = (today or date.today()) - timedelta(days=max(1, days))
+    report = RetentionReport(cutoff=cutoff)
+    started = time.perf_counter()
+
+    archive = None
+    if archive_dir:
+        path = Path(archive_dir)
+        path.mkdir(parents=True, exist_ok=True)
+        report.archive = path / f"email_logs_before_{cutoff.isoformat()}_{datetime.now():%Y%m%d_%H%M%S}.jsonl.gz"
+        archive = gzip.open(report.archive, "at", encoding="utf-8")
+
+    try:
+        while True:
+            with get_session() as db:
+                rows = crud.get_expired_email_logs(db, before=cutoff, limit=batch_size)
+                if not rows:
+                    break
+
+                counts = Counter((row.digest_date, row.status, row.provider or "") for row in rows)
+                report.rollup_rows += crud.add_email_log_rollups(db, counts)
+                deleted = crud.delete_email_logs(db, [row.id for row in rows])
+
+            if archive:
+                archive.writelines(
+                    json.dumps(row._asdict(), default=_json_default) + "\n" for row in rows
+                )
+                archive.flush()
+                ROWS_ARCHIVED.inc(len(rows))
+
+            report.deleted += deleted
+            ROWS_DELETED.inc(deleted)
+            logger.info(f"Retention batch: {deleted} email_logs rows rolled up")
+    finally:
+        if archive:
+            archive.close()
+
+    if archive and not report.deleted:
+        report.archive.unlink(missing_ok=True)
+        report.archive = None
+
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+#-------------------------------------------------------
+# Main
+#-------------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Roll up and archive old email_logs rows.")
+    parser.add_argument("--days", type=int, default=EMAIL_LOG_RETENTION_DAYS, help="Detail rows to keep, in days.")
+    parser.add_argument("--batch-size", type=int, default=RETENTION_BATCH_SIZE, help="Rows per transaction.")
+    parser.add_argument("--no-archive", action="store_true", help="Delete without writing the JSONL archive.")
+    args = parser.parse_args()
+
+    result = run_retention(
+        days=args.days,
+        batch_size=args.batch_size,
+        archive_dir=None if args.no_archive else EMAIL_LOG_ARCHIVE_DIR,
+    )
+    logger.info(f"Email log retention finished: {result}")
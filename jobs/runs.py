@@ -0,0 +1,102 @@
+"""
+jobs/runs.py
+------------
+
+Inspect, resume and prune checkpointed pipeline runs (PIPELINE_RUNS_DIR).
+
+Usage:
+    python -m jobs.runs list
+    python -m jobs.runs show 2026-01-31
+    python -m jobs.runs resume 2026-01-31 [--profile]
+    python -m jobs.runs prune --keep 7
+"""
+
+import argparse
+import json
+import sys
+
+from backend.utils.checkpoints import RunCheckpoint, list_runs
+from backend.utils.profiling import PipelineProfiler
+
+
+#-------------------------------------------------------
+# Commands
+#-------------------------------------------------------
+def _list(_args) -> int:
+    runs = list_runs()
+    if not runs:
+        print("No checkpointed runs.")
+        return 0
+
+    for manifest in runs:
+        print(
+            f"{manifest['run_id']:<24} {manifest.get('status', '?'):<9} "
+            f"digest_date={manifest.get('digest_date')} attempts={manifest.get('attempts', 0)} "
+            f"started_at={manifest.get('started_at')}"
+        )
+    return 0
+
+
+def _show(args) -> int:
+    checkpoint = RunCheckpoint(args.run_id, enabled=True)
+    if not checkpoint.exists():
+        print(f"Run {args.run_id} not found in {checkpoint.path.parent}")
+        return 1
+
+    print(json.dumps(checkpoint.manifest(), indent=2))
+    for stage, count in checkpoint.counts().items():
+        print(f"    {stage:<12} {count}")
+    return 0
+
+
+def _resume(args) -> int:
+    from jobs.daily_pipeline import run_daily_pipeline
+
+    checkpoint = RunCheckpoint(args.run_id, enabled=True)
+    manifest = checkpoint.manifest()
+    if not manifest:
+        print(f"Run {args.run_id} not found in {checkpoint.path.parent}")
+        return 1
+
+    shard = tuple(manifest["shard"]) if manifest.get("shard") else None
+    profiler = PipelineProfiler(enabled=args.profile) if args.profile else None
+    run_daily_pipeline(profiler, shard=shard, run_id=args.run_id)
+    return 0
+
+
+def _prune(args) -> int:
+    runs = [m for m in list_runs() if m.get("status") != "running"]
+    for manifest in runs[args.keep:]:
+        RunCheckpoint(manifest["run_id"], enabled=True).clear()
+        print(f"Removed run {manifest['run_id']}")
+    return 0
+
+
+#-------------------------------------------------------
+# Main
+#-------------------------------------------------------
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Inspect and resume checkpointed pipeline runs.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="List runs, newest first.").set_defaults(func=_list)
+
+    show = commands.add_parser("show", help="Manifest and completed units per stage.")
+    show.add_argument("run_id")
+    show.set_defaults(func=_show)
+
+    resume = commands.add_parser("resume", help="Continue a run from its checkpoints.")
+    resume.add_argument("run_id")
+    resume.add_argument("--profile", action="store_true", help="Record per-stage timing spans.")
+    resume.set_defaults(func=_resume)
+
+    prune = commands.add_parser("prune", help="Delete all but the newest finished/failed runs.")
+    prune.add_argument("--keep", type=int, default=7)
+    prune.set_defaults(func=_prune)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
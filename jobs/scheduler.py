@@ -12,17 +12,27 @@ ROOT_DIR = Path(__file__).resolve().parents[1]
 sys.path.append(str(ROOT_DIR))
 
 import time
-from datetime import date
 
 from backend.db.connection import get_session
 from backend.db import crud
-from backend.utils.time_utils import is_send_time
+from backend.utils.time_utils import is_send_time, local_date
 from backend.utils.logger import get_logger
+from backend.utils.metrics import counter, gauge, histogram, start_metrics_server, write_metrics_file
 
 from jobs.daily_pipeline import run_daily_pipeline
 
 logger = get_logger(__name__)
 
+SCHEDULER_TICKS = counter("scheduler_ticks_total", "Scheduler polling iterations.")
+SCHEDULER_ERRORS = counter("scheduler_errors_total", "Scheduler iterations that raised an error.")
+PIPELINE_RUNS = counter("scheduler_pipeline_runs_total", "Pipeline runs triggered by the scheduler.")
+PIPELINE_RUN_SECONDS = histogram(
+    "scheduler_pipeline_run_seconds",
+    "Wall time of pipeline runs triggered by the scheduler.",
+    buckets=(30, 60, 120, 300, 600, 1200, 1800, 3600),
+)
+HEARTBEAT = gauge("scheduler_heartbeat_timestamp_seconds", "Unix time of the last scheduler iteration.")
+
 CHECK_INTERVAL_SECONDS = 60  # check every minute
 
 
@@ -33,16 +43,21 @@ def run_scheduler() -> None:
     """
     logger.info("Scheduler started")
 
+    if start_metrics_server():
+        logger.info("Serving metrics on localhost")
+
     while True:
+        SCHEDULER_TICKS.inc()
+        HEARTBEAT.set(time.time())
+
         try:
-            today = date.today()
             trigger_pipeline = False
 
             with get_session() as db:
-                users = crud.get_active_verified_subscribers(db)
+                users = crud.iter_subscriber_rows(db)
 
                 for user in users:
-                    if crud.has_digest_been_sent(db, user.id, today):
+                    if crud.has_digest_been_sent(db, user.id, local_date(user.time_zone)):
                         continue
 
                     if is_send_time(user.preffered_time, user.time_zone):
@@ -54,11 +69,16 @@ def run_scheduler() -> None:
                         break  # only decide trigger, not process users
 
             if trigger_pipeline:
-                run_daily_pipeline()
+                PIPELINE_RUNS.inc()
+                with PIPELINE_RUN_SECONDS.time():
+                    run_daily_pipeline()
 
         except Exception as e:
+            SCHEDULER_ERRORS.inc()
             logger.exception(f"Scheduler error: {e}")
 
+        write_metrics_file()
+
         time.sleep(CHECK_INTERVAL_SECONDS)
 
 
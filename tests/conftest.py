@@ -0,0 +1,45 @@
+"""
+tests/conftest.py
+-----------------
+
+Shared test setup: the repository root on sys.path, and a throwaway SQLite
+database, log directory and run directory, set before backend.config is
+imported (a .env file never overrides them).
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT_DIR))
+
+TMP_DIR = Path(tempfile.mkdtemp(prefix="daily-news-digest-tests-"))
+
+os.environ["DATABASE_URL"] = f"sqlite:///{(TMP_DIR / 'test.db').as_posix()}"
+os.environ["LOG_DIR"] = str(TMP_DIR / "logs")
+os.environ["METRICS_FILE"] = ""
+os.environ["PIPELINE_RUNS_DIR"] = str(TMP_DIR / "runs")
+
+
+#-------------------------------------------------------
+# Database
+#-------------------------------------------------------
+@pytest.fixture
+def db():
+    """
+    A session on freshly created tables, dropped again afterwards.
+    """
+    from backend.db import models
+    from backend.db.connection import SessionLocal, engine
+
+    models.Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        models.Base.metadata.drop_all(bind=engine)
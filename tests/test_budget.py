@@ -0,0 +1,75 @@
+"""
+tests/test_budget.py
+--------------------
+
+Token-aware LLM input sizing (backend/ai/budget.py).
+"""
+
+from backend.ai.budget import RunTokenBudget, estimate_tokens, fit_to_budget
+from backend.config import LLM_CHARS_PER_TOKEN
+
+LEAD = "The central bank held the repo rate at 6.5 percent on Friday. Governor Das cited sticky food inflation."
+SECOND = "Markets had priced in a pause. Bond yields barely moved after the announcement."
+FILLER = [
+    f"Analysts at firm number {i} repeated that the decision was widely expected by everyone."
+    for i in range(30)
+]
+KEY_FACT = "Inflation in Kerala reached 7.2 percent while Mumbai rents climbed 11 percent."
+
+
+def _article():
+    return "\n".join([LEAD, SECOND, *FILLER[:15], KEY_FACT, *FILLER[15:]])
+
+
+def test_text_within_budget_is_unchanged():
+    text = _article()
+
+    assert fit_to_budget(text, max_tokens=estimate_tokens(text)) is text
+
+
+def test_fitted_text_respects_the_budget():
+    fitted = fit_to_budget(_article(), max_tokens=120)
+
+    assert len(fitted) <= 120 * LLM_CHARS_PER_TOKEN
+    assert estimate_tokens(fitted) <= 120
+
+
+def test_lead_paragraphs_are_kept_first_and_whole():
+    fitted = fit_to_budget(_article(), max_tokens=120)
+
+    assert fitted.split("\n")[:2] == [LEAD, SECOND]
+
+
+def test_informative_sentences_beat_repetitive_ones_and_keep_their_order():
+    fitted = fit_to_budget(_article(), max_tokens=120)
+    paragraphs = fitted.split("\n")
+
+    assert KEY_FACT in paragraphs
+    kept_filler = [p for p in paragraphs if p in FILLER]
+    assert kept_filler == sorted(kept_filler, key=FILLER.index)
+
+
+def test_tiny_budget_keeps_a_prefix_of_the_lead():
+    fitted = fit_to_budget(_article(), max_tokens=20)
+
+    assert fitted
+    assert LEAD.startswith(fitted)
+
+
+def test_run_budget_refuses_calls_it_cannot_cover():
+    budget = RunTokenBudget(limit=100)
+
+    assert budget.reserve(60)
+    assert not budget.reserve(50)
+    assert budget.remaining == 40
+
+    budget.charge(70)
+    assert budget.remaining == 0
+    assert not budget.reserve(1)
+
+
+def test_non_positive_run_budget_is_unlimited():
+    budget = RunTokenBudget(limit=0)
+
+    assert budget.reserve(10 ** 9)
+    assert budget.remaining is None
@@ -0,0 +1,67 @@
+"""
+tests/test_bulk_upsert.py
+-------------------------
+
+Batched subscriber upserts (crud.bulk_upsert_subscribers).
+"""
+
+from sqlalchemy import select
+
+from backend.db import crud
+from backend.db.models import Subscriber
+
+
+def _row(email, **fields):
+    row = {
+        "email": email,
+        "topics": ["World"],
+        "preffered_time": "08:00",
+        "time_zone": "Asia/Kolkata",
+        "is_active": True,
+        "is_verified": False,
+    }
+    row.update(fields)
+    return row
+
+
+def _subscriber(db, email):
+    db.expire_all()
+    return db.scalar(select(Subscriber).where(Subscriber.email == email))
+
+
+def test_new_emails_are_counted_as_inserted(db):
+    assert crud.bulk_upsert_subscribers(db, [_row("a@x.com"), _row("b@x.com")]) == (2, 0)
+    assert crud.bulk_upsert_subscribers(db, []) == (0, 0)
+
+
+def test_existing_emails_are_left_alone_without_update_fields(db):
+    crud.bulk_upsert_subscribers(db, [_row("a@x.com")])
+
+    counts = crud.bulk_upsert_subscribers(db, [_row("a@x.com", topics=["Sports"]), _row("b@x.com")])
+
+    assert counts == (1, 0)
+    assert _subscriber(db, "a@x.com").topics == ["World"]
+
+
+def test_existing_emails_are_updated_with_update_fields(db):
+    crud.bulk_upsert_subscribers(db, [_row("a@x.com"), _row("b@x.com")])
+
+    counts = crud.bulk_upsert_subscribers(
+        db,
+        [_row("a@x.com", topics=["Sports"], is_verified=True), _row("c@x.com")],
+        update_fields=("topics",),
+    )
+
+    assert counts == (1, 1)
+    a = _subscriber(db, "a@x.com")
+    assert a.topics == ["Sports"]
+    assert a.is_verified is False
+
+
+def test_fields_outside_the_updatable_set_are_ignored(db):
+    crud.bulk_upsert_subscribers(db, [_row("a@x.com")])
+
+    counts = crud.bulk_upsert_subscribers(db, [_row("a@x.com")], update_fields=("email", "id"))
+
+    assert counts == (0, 0)
+    assert len(db.scalars(select(Subscriber)).all()) == 1
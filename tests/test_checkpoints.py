@@ -0,0 +1,105 @@
+"""
+tests/test_checkpoints.py
+-------------------------
+
+Run checkpoints (backend/utils/checkpoints.py) and resuming a pipeline run
+from them (jobs/daily_pipeline.py _RunCache).
+"""
+
+from datetime import date
+
+from backend.news.records import RawArticle, SummarizedArticle
+from backend.utils.checkpoints import RunCheckpoint, default_run_id
+from jobs.daily_pipeline import _RunCache
+
+
+def _summary(url, topic="World"):
+    return SummarizedArticle(
+        title=f"Title of {url}",
+        url=url,
+        source="The Hindu",
+        topic=topic,
+        bullets=("one", "two"),
+        summary=f"Summary of {url}",
+        category=topic,
+        importance_score=3,
+    )
+
+
+def test_records_survive_reopening_and_later_records_win(tmp_path):
+    checkpoint = RunCheckpoint("run", root=str(tmp_path), enabled=True)
+    checkpoint.save("extracted", "a", "first")
+    checkpoint.save("extracted", "b", "text")
+    checkpoint.save("extracted", "a", "second")
+    checkpoint.close()
+
+    reopened = RunCheckpoint("run", root=str(tmp_path), enabled=True)
+
+    assert reopened.load("extracted") == {"a": "second", "b": "text"}
+    assert reopened.counts() == {"extracted": 3}
+
+
+def test_torn_last_line_is_ignored(tmp_path):
+    checkpoint = RunCheckpoint("run", root=str(tmp_path), enabled=True)
+    checkpoint.save("sent", "1", "sent")
+    checkpoint.close()
+    with (tmp_path / "run" / "sent.jsonl").open("a", encoding="utf-8") as handle:
+        handle.write('{"key": "2", "val')
+
+    assert RunCheckpoint("run", root=str(tmp_path), enabled=True).load("sent") == {"1": "sent"}
+
+
+def test_manifest_updates_are_merged(tmp_path):
+    checkpoint = RunCheckpoint("run", root=str(tmp_path), enabled=True)
+    checkpoint.update_manifest(digest_date="2026-01-31", status="running", attempts=1)
+    checkpoint.update_manifest(status="finished")
+
+    assert checkpoint.manifest() == {
+        "run_id": "run",
+        "digest_date": "2026-01-31",
+        "status": "finished",
+        "attempts": 1,
+    }
+
+
+def test_disabled_checkpoint_loads_and_saves_nothing(tmp_path):
+    checkpoint = RunCheckpoint("run", root=str(tmp_path), enabled=False)
+    checkpoint.update_manifest(status="running")
+    checkpoint.save("sent", "1", "sent")
+    checkpoint.close()
+
+    assert not (tmp_path / "run").exists()
+    assert checkpoint.manifest() == {}
+
+
+def test_default_run_id_includes_the_shard():
+    assert default_run_id(date(2026, 1, 31)) == "2026-01-31"
+    assert default_run_id(date(2026, 1, 31), (1, 4)) == "2026-01-31-shard1of4"
+
+
+def test_run_cache_resumes_recorded_work(tmp_path):
+    checkpoint = RunCheckpoint("run", root=str(tmp_path), enabled=True)
+    cache = _RunCache(checkpoint)
+    feed = [RawArticle("Title", "https://a.com/1", "2026-01-31", "The Hindu", "World")]
+    checkpoint.save("fetched", "World", [a.to_dict() for a in feed])
+    checkpoint.save("extracted", "https://a.com/1", "body 1")
+    checkpoint.save("extracted", "https://a.com/2", "body 2")
+    checkpoint.save("summaries", "https://a.com/1", _summary("https://a.com/1").to_dict())
+    checkpoint.save("summaries", "https://a.com/3", None)
+    cache.save_digest(7, {"sections": {"World": [_summary("https://a.com/1")]}, "mode": "full"})
+    cache.save_digest(8, {"sections": {"World": [_summary("https://a.com/1")]}, "mode": "full"})
+    cache.mark_sent(8)
+    checkpoint.close()
+
+    resumed = _RunCache(RunCheckpoint("run", root=str(tmp_path), enabled=True))
+
+    assert resumed.feeds == {"World": feed}
+    assert resumed.extracted == {"https://a.com/2": "body 2"}
+    assert resumed.summaries["https://a.com/1"] == _summary("https://a.com/1")
+    assert resumed.summaries["https://a.com/3"] is None
+    assert resumed.sent == {"8"}
+    assert resumed.saved_digest(8) is None
+
+    digest = resumed.saved_digest(7)
+    assert digest["mode"] == "full"
+    assert digest["sections"] == {"World": [_summary("https://a.com/1")]}
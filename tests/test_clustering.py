@@ -0,0 +1,97 @@
+"""
+tests/test_clustering.py
+------------------------
+
+Incremental story clustering (backend/news/clustering.py).
+"""
+
+from backend.news.clustering import StoryClusterer
+from backend.news.records import RawArticle
+
+
+def _article(url, title, description="", source="The Hindu"):
+    return RawArticle(title, url, "2026-01-31", source, "Business", description)
+
+
+RBI_HINDU = _article(
+    "https://thehindu.com/rbi", "RBI holds repo rate at 6.5 percent",
+    "The Reserve Bank of India kept the repo rate unchanged at 6.5 percent on Friday.",
+)
+RBI_TOI = _article(
+    "https://toi.com/rbi", "RBI keeps repo rate unchanged at 6.5 percent",
+    "Reserve Bank of India leaves repo rate at 6.5 percent, citing inflation.",
+    source="Times of India",
+)
+RBI_IE = _article(
+    "https://ie.com/rbi", "Repo rate unchanged: RBI holds at 6.5 percent",
+    "The Reserve Bank held the repo rate steady at 6.5 percent.",
+    source="Indian Express",
+)
+CRICKET = _article(
+    "https://thehindu.com/cricket", "India beat Australia in the first Test at Perth",
+    "Bumrah took eight wickets as India won by 295 runs.",
+)
+
+
+def test_same_event_joins_one_story_and_different_events_do_not():
+    clusterer = StoryClusterer()
+    clusterer.add([RBI_HINDU, CRICKET, RBI_TOI])
+
+    assert len(clusterer) == 2
+    assert clusterer.cluster_for(RBI_TOI.url) is clusterer.cluster_for(RBI_HINDU.url)
+    assert clusterer.cluster_for(CRICKET.url) is not clusterer.cluster_for(RBI_HINDU.url)
+
+
+def test_first_article_is_the_representative():
+    clusterer = StoryClusterer()
+    clusterer.add([RBI_HINDU, RBI_TOI])
+
+    assert clusterer.representative(RBI_TOI) == RBI_HINDU
+    assert clusterer.representative(CRICKET) == CRICKET
+
+
+def test_add_is_incremental_and_ignores_articles_already_seen():
+    clusterer = StoryClusterer()
+    clusterer.add([RBI_HINDU, CRICKET])
+    story = clusterer.cluster_for(RBI_HINDU.url)
+
+    clusterer.add([RBI_HINDU, RBI_IE, RBI_IE])
+
+    assert len(clusterer) == 2
+    assert clusterer.cluster_for(RBI_IE.url) is story
+    assert [a.url for a in story.members] == [RBI_HINDU.url, RBI_IE.url]
+
+
+def test_articles_without_terms_start_their_own_story():
+    clusterer = StoryClusterer()
+    clusterer.add([RBI_HINDU, _article("https://x.com/1", "the of and"), _article("https://x.com/2", "the of and")])
+
+    assert len(clusterer) == 3
+
+
+def test_threshold_controls_joining():
+    strict = StoryClusterer(threshold=0.99)
+    strict.add([RBI_HINDU, RBI_TOI])
+
+    assert len(strict) == 2
+
+
+def test_related_and_other_reports_list_the_other_sources():
+    clusterer = StoryClusterer()
+    clusterer.add([RBI_HINDU, RBI_TOI, RBI_IE])
+
+    assert clusterer.related(RBI_HINDU.url) == (("Times of India", RBI_TOI.url), ("Indian Express", RBI_IE.url))
+    assert clusterer.related("https://unknown") == ()
+
+    reports = clusterer.other_reports(RBI_HINDU.url, limit=1).splitlines()
+    assert reports == [f"- Times of India: {RBI_TOI.title}. {RBI_TOI.description}"]
+
+
+def test_promote_makes_another_member_the_representative():
+    clusterer = StoryClusterer()
+    clusterer.add([RBI_HINDU, RBI_TOI, RBI_IE])
+
+    clusterer.promote(RBI_IE)
+
+    assert clusterer.representative(RBI_HINDU) == RBI_IE
+    assert [a.url for a in clusterer.cluster_for(RBI_HINDU.url).members] == [RBI_IE.url, RBI_HINDU.url, RBI_TOI.url]
@@ -0,0 +1,137 @@
+"""
+tests/test_health.py
+--------------------
+
+Per-host adaptive timeouts and circuit breaker (backend/news/health.py).
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+import pytz
+
+from backend.config import (
+    HTTP_TIMEOUT_MAX_SECONDS,
+    HTTP_TIMEOUT_MIN_SECONDS,
+    HTTP_TIMEOUT_SECONDS,
+    SOURCE_BREAKER_COOLDOWN_SECONDS,
+    SOURCE_BREAKER_FAILURES,
+    SOURCE_HEALTH_MIN_SAMPLES,
+    SOURCE_TIMEOUT_P95_MULTIPLIER,
+)
+from backend.news import health
+from backend.news.health import SourceHealthTracker, host_of
+
+HOST = "thehindu.com"
+COOLDOWN = timedelta(seconds=SOURCE_BREAKER_COOLDOWN_SECONDS)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    A settable utc_now() for the health module.
+    """
+    class Clock:
+        now = datetime(2026, 1, 31, 8, 0, tzinfo=pytz.utc)
+
+        def advance(self, delta):
+            self.now += delta
+
+    clock = Clock()
+    monkeypatch.setattr(health, "utc_now", lambda: clock.now)
+    return clock
+
+
+def _trip(tracker):
+    for _ in range(SOURCE_BREAKER_FAILURES):
+        tracker.record_failure(HOST)
+
+
+def test_host_of_strips_www_and_case():
+    assert host_of("https://WWW.TheHindu.com/news/1") == HOST
+    assert host_of("not a url") == ""
+
+
+def test_timeout_defaults_until_enough_samples_then_follows_p95():
+    tracker = SourceHealthTracker()
+    for _ in range(SOURCE_HEALTH_MIN_SAMPLES - 1):
+        tracker.record_success(HOST, 1.5)
+    assert tracker.timeout_for(HOST) == HTTP_TIMEOUT_SECONDS
+
+    tracker.record_success(HOST, 1.5)
+    assert tracker.timeout_for(HOST) == pytest.approx(
+        min(HTTP_TIMEOUT_MAX_SECONDS, max(HTTP_TIMEOUT_MIN_SECONDS, 1.5 * SOURCE_TIMEOUT_P95_MULTIPLIER))
+    )
+
+
+def test_consecutive_failures_open_the_circuit(clock):
+    tracker = SourceHealthTracker()
+    for _ in range(SOURCE_BREAKER_FAILURES - 1):
+        tracker.record_failure(HOST)
+    assert tracker.allow(HOST)
+
+    tracker.record_failure(HOST)
+    assert not tracker.allow(HOST)
+    assert tracker.allow("other.com")
+
+
+def test_half_open_admits_a_single_probe(clock):
+    tracker = SourceHealthTracker()
+    _trip(tracker)
+    clock.advance(COOLDOWN)
+
+    assert tracker.allow(HOST)
+    assert not tracker.allow(HOST)
+
+
+def test_successful_probe_closes_the_circuit(clock):
+    tracker = SourceHealthTracker()
+    _trip(tracker)
+    clock.advance(COOLDOWN)
+    tracker.allow(HOST)
+
+    tracker.record_success(HOST, 0.5)
+
+    assert tracker.allow(HOST)
+    assert tracker.allow(HOST)
+
+
+def test_failed_probe_reopens_for_a_full_cooldown(clock):
+    tracker = SourceHealthTracker()
+    _trip(tracker)
+    clock.advance(COOLDOWN)
+    tracker.allow(HOST)
+
+    tracker.record_failure(HOST)
+
+    clock.advance(COOLDOWN - timedelta(seconds=1))
+    assert not tracker.allow(HOST)
+    clock.advance(timedelta(seconds=1))
+    assert tracker.allow(HOST)
+
+
+def test_probe_that_never_reports_expires(clock):
+    tracker = SourceHealthTracker()
+    _trip(tracker)
+    clock.advance(COOLDOWN)
+    assert tracker.allow(HOST)
+
+    clock.advance(COOLDOWN)
+    assert tracker.allow(HOST)
+
+
+def test_dirty_rows_round_trip_through_load(clock):
+    tracker = SourceHealthTracker()
+    tracker.record_success(HOST, 0.25)
+    _trip(tracker)
+
+    rows = tracker.dirty_rows()
+    assert tracker.dirty_rows() == []
+
+    restored = SourceHealthTracker()
+    restored.load([SimpleNamespace(**row) for row in rows])
+
+    assert not restored.allow(HOST)
+    clock.advance(COOLDOWN)
+    assert restored.allow(HOST)
@@ -0,0 +1,115 @@
+"""
+tests/test_json_repair.py
+-------------------------
+
+Tolerant parsing of LLM summary JSON (backend/ai/json_repair.py).
+"""
+
+import json
+
+import pytest
+
+from backend.ai.json_repair import (
+    DEFAULT_IMPORTANCE,
+    LlmOutputError,
+    parse_llm_json,
+    repair_json,
+    validate_summary,
+)
+
+
+def _repaired(text):
+    return json.loads(repair_json(text))
+
+
+#-------------------------------------------------------
+# repair_json
+#-------------------------------------------------------
+@pytest.mark.parametrize("text, expected", [
+    ('{"a": 1 "b": 2}', {"a": 1, "b": 2}),
+    ('{"a": [1, 2,], "b": 3,}', {"a": [1, 2], "b": 3}),
+    ("{'a': 'it is'}", {"a": "it is"}),
+    ("{“a”: “curly”}", {"a": "curly"}),
+    ("{a: 1, summary: plain words}", {"a": 1, "summary": "plain words"}),
+    ('{"a": True, "b": None, "c": false}', {"a": True, "b": None, "c": False}),
+    ('{"a": 1, // note\n "b": /* gone */ 2}', {"a": 1, "b": 2}),
+    ('{"a": "line one\nline two"}', {"a": "line one\nline two"}),
+    ('{"a": "He said "no" twice"}', {"a": 'He said "no" twice'}),
+    ('{"a": "bad \\q escape"}', {"a": "bad \\q escape"}),
+    ('{"a": ["x", "y"', {"a": ["x", "y"]}),
+    ('{"a": "unclosed', {"a": "unclosed"}),
+    ('{"a":}', {"a": None}),
+])
+def test_repairs(text, expected):
+    assert _repaired(text) == expected
+
+
+def test_array_strings_separated_only_by_whitespace_stay_apart():
+    assert _repaired('{"bullets": ["a" "b"]}') == {"bullets": ["a", "b"]}
+    assert _repaired('{"bullets": ["a"\n"b"]}') == {"bullets": ["a", "b"]}
+
+
+def test_reading_stops_after_the_top_level_value():
+    assert _repaired('{"a": 1} and {"b": 2}') == {"a": 1}
+
+
+#-------------------------------------------------------
+# parse_llm_json
+#-------------------------------------------------------
+def test_valid_json_inside_prose_and_fences_is_not_repaired():
+    text = 'Here you go:\n```json\n{"summary": "ok"}\n```\nAnything else?'
+
+    assert parse_llm_json(text) == ({"summary": "ok"}, False)
+
+
+def test_broken_json_is_repaired():
+    assert parse_llm_json('```json\n{"summary": "ok",}\n```') == ({"summary": "ok"}, True)
+
+
+@pytest.mark.parametrize("text", ["", "no json here", None])
+def test_missing_object_raises(text):
+    with pytest.raises(LlmOutputError):
+        parse_llm_json(text)
+
+
+#-------------------------------------------------------
+# validate_summary
+#-------------------------------------------------------
+def test_valid_summary_is_kept():
+    data = {"bullets": ["one", "two"], "summary": "Summary.", "category": "Business", "importance_score": 7}
+
+    assert validate_summary(data) == data
+
+
+def test_bullets_are_cleaned_and_capped():
+    result = validate_summary({"bullets": "- one\n• two\n\n* three\nfour", "summary": "s"}, bullet_count=3)
+
+    assert result["bullets"] == ["one", "two", "three"]
+
+
+def test_summary_falls_back_to_the_first_bullet():
+    assert validate_summary({"bullets": ["only bullet"], "summary": "  "})["summary"] == "only bullet"
+
+
+def test_missing_category_falls_back_to_the_topic():
+    assert validate_summary({"summary": "s"}, category="Sports")["category"] == "Sports"
+    assert validate_summary({"summary": "s", "category": " "}, category="Sports")["category"] == "Sports"
+
+
+@pytest.mark.parametrize("value, expected", [
+    (8, 8),
+    (7.6, 8),
+    ("9/10", 9),
+    (42, 10),
+    (-3, 1),
+    (True, DEFAULT_IMPORTANCE),
+    ("high", DEFAULT_IMPORTANCE),
+    (None, DEFAULT_IMPORTANCE),
+])
+def test_importance_is_coerced_to_1_10(value, expected):
+    assert validate_summary({"summary": "s", "importance_score": value})["importance_score"] == expected
+
+
+def test_summary_without_content_raises():
+    with pytest.raises(LlmOutputError):
+        validate_summary({"category": "World", "bullets": [None, " "]})
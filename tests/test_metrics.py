@@ -0,0 +1,75 @@
+"""
+tests/test_metrics.py
+---------------------
+
+Prometheus text rendering of backend/utils/metrics.py.
+"""
+
+import pytest
+
+from backend.utils.metrics import MetricsRegistry
+
+
+def test_counter_renders_help_type_and_sorted_labelled_samples():
+    registry = MetricsRegistry()
+    fetched = registry.counter("feeds_fetched_total", "RSS feeds fetched.", ["source"])
+    fetched.inc(source="The Hindu")
+    fetched.inc(2, source="BBC")
+
+    assert registry.render() == (
+        "# HELP feeds_fetched_total RSS feeds fetched.\n"
+        "# TYPE feeds_fetched_total counter\n"
+        'feeds_fetched_total{source="BBC"} 2\n'
+        'feeds_fetched_total{source="The Hindu"} 1\n'
+    )
+
+
+def test_label_values_are_escaped():
+    registry = MetricsRegistry()
+    registry.gauge("queue_depth", "Depth.", ["name"]).set(1.5, name='a "b"\\c\nd')
+
+    assert 'queue_depth{name="a \\"b\\"\\\\c\\nd"} 1.5' in registry.render()
+
+
+def test_histogram_renders_cumulative_buckets_sum_and_count():
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency.", buckets=(1, 5))
+    for value in (0.5, 2, 2, 10):
+        latency.observe(value)
+
+    lines = registry.render().splitlines()
+    assert lines[2:] == [
+        'latency_seconds_bucket{le="1"} 1',
+        'latency_seconds_bucket{le="5"} 3',
+        'latency_seconds_bucket{le="+Inf"} 4',
+        "latency_seconds_sum 14.5",
+        "latency_seconds_count 4",
+    ]
+
+
+def test_metrics_render_sorted_by_name():
+    registry = MetricsRegistry()
+    registry.gauge("b_value", "B.").set(1)
+    registry.counter("a_total", "A.").inc()
+
+    types = [line for line in registry.render().splitlines() if line.startswith("# TYPE")]
+    assert types == ["# TYPE a_total counter", "# TYPE b_value gauge"]
+
+
+def test_registering_a_name_again_returns_the_same_metric():
+    registry = MetricsRegistry()
+    first = registry.counter("runs_total", "Runs.")
+
+    assert registry.counter("runs_total", "Runs.") is first
+    with pytest.raises(ValueError):
+        registry.gauge("runs_total", "Runs.")
+
+
+def test_counter_rejects_wrong_labels_and_negative_increments():
+    registry = MetricsRegistry()
+    fetched = registry.counter("fetched_total", "Fetched.", ["source"])
+
+    with pytest.raises(ValueError):
+        fetched.inc(topic="World")
+    with pytest.raises(ValueError):
+        fetched.inc(-1, source="BBC")
@@ -0,0 +1,97 @@
+"""
+tests/test_store.py
+-------------------
+
+Article store keys and writes (backend/news/store.py, crud article CRUD).
+"""
+
+from datetime import datetime
+
+import pytest
+import pytz
+from sqlalchemy import select
+
+from backend.db import crud
+from backend.db.models import StoredArticle
+from backend.news.store import article_hash, canonical_url, parse_published
+
+
+#-------------------------------------------------------
+# canonical_url
+#-------------------------------------------------------
+@pytest.mark.parametrize("url, expected", [
+    ("https://www.TheHindu.com/news/rbi/", "https://thehindu.com/news/rbi"),
+    ("http://thehindu.com/news/rbi#comments", "https://thehindu.com/news/rbi"),
+    (
+        "https://thehindu.com/news?id=7&utm_source=rss&UTM_Medium=feed&fbclid=x&ref=home",
+        "https://thehindu.com/news?id=7",
+    ),
+    ("https://thehindu.com/news?page=2&referrer=a&reference=b", "https://thehindu.com/news?page=2&referrer=a&reference=b"),
+    ("  https://thehindu.com/news  ", "https://thehindu.com/news"),
+])
+def test_canonical_url(url, expected):
+    assert canonical_url(url) == expected
+
+
+def test_tracking_variants_share_one_article_hash():
+    assert article_hash("https://www.thehindu.com/a/?utm_campaign=x") == article_hash("http://thehindu.com/a")
+    assert article_hash("https://thehindu.com/a") != article_hash("https://thehindu.com/b")
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("Sat, 31 Jan 2026 08:30:00 +0530", datetime(2026, 1, 31, 3, 0, tzinfo=pytz.utc)),
+    ("2026-01-31T08:30:00", datetime(2026, 1, 31, 8, 30, tzinfo=pytz.utc)),
+])
+def test_parse_published_returns_aware_utc(value, expected):
+    assert parse_published(value, None) == expected
+
+
+def test_parse_published_falls_back_to_the_default():
+    default = datetime(2026, 1, 31, tzinfo=pytz.utc)
+
+    assert parse_published("yesterday", default) is default
+    assert parse_published("", default) is default
+
+
+#-------------------------------------------------------
+# archive_articles
+#-------------------------------------------------------
+def _row(url, status, summary=None):
+    now = datetime(2026, 1, 31, 8, 0, tzinfo=pytz.utc)
+    key = article_hash(url)
+    return {
+        "url_hash": key,
+        "story_hash": key,
+        "url": url,
+        "title": url,
+        "source": "The Hindu",
+        "topic": "World",
+        "description": "",
+        "published_at": now,
+        "first_seen_at": now,
+        "last_seen_at": now,
+        "status": status,
+        "summary": summary,
+    }
+
+
+def test_archived_summaries_only_fill_new_rows(db):
+    crud.insert_articles(db, [
+        _row("https://a.com/new", "new"),
+        _row("https://a.com/clustered", "clustered"),
+        _row("https://a.com/failed", "failed"),
+    ])
+
+    crud.archive_articles(db, [
+        _row(url, "archived", {"summary": "s"})
+        for url in ("https://a.com/new", "https://a.com/clustered", "https://a.com/failed", "https://a.com/unseen")
+    ])
+    db.expire_all()
+
+    rows = {row.url: (row.status, row.summary is not None) for row in db.scalars(select(StoredArticle))}
+    assert rows == {
+        "https://a.com/new": ("summarized", True),
+        "https://a.com/clustered": ("clustered", False),
+        "https://a.com/failed": ("failed", False),
+        "https://a.com/unseen": ("archived", True),
+    }
@@ -0,0 +1,73 @@
+"""
+tests/test_subscriber_rows.py
+-----------------------------
+
+Keyset-paginated subscriber rows (crud.iter_subscriber_rows / get_subscriber_page).
+"""
+
+from datetime import date
+
+from backend.db import crud
+from backend.db.models import Subscriber
+
+
+def _add_subscribers(db, count, **fields):
+    for i in range(count):
+        values = {
+            "email": f"user{i}@example.com",
+            "topics": ["World"],
+            "preffered_time": "08:00",
+            "time_zone": "Asia/Kolkata",
+            "is_active": True,
+            "is_verified": True,
+        }
+        values.update({k: v(i) if callable(v) else v for k, v in fields.items()})
+        db.add(Subscriber(**values))
+    db.flush()
+
+
+def test_pages_cover_every_eligible_subscriber_once_in_id_order(db):
+    _add_subscribers(db, 7, is_active=lambda i: i != 2, is_verified=lambda i: i != 5)
+
+    rows = list(crud.iter_subscriber_rows(db, page_size=2))
+
+    assert [row.id for row in rows] == [1, 2, 4, 5, 7]
+    assert rows[0]._fields == ("id", "email", "topics", "preffered_time", "time_zone")
+
+
+def test_page_size_multiple_ends_without_a_short_page(db):
+    _add_subscribers(db, 4)
+
+    assert [row.id for row in crud.iter_subscriber_rows(db, page_size=2)] == [1, 2, 3, 4]
+
+
+def test_get_subscriber_page_starts_after_the_given_id(db):
+    _add_subscribers(db, 5)
+
+    page = crud.get_subscriber_page(db, after_id=2, page_size=2)
+
+    assert [row.id for row in page] == [3, 4]
+
+
+def test_shard_and_cohort_filters(db):
+    _add_subscribers(db, 6, preffered_time=lambda i: "07:00" if i % 2 else "08:00")
+
+    shard = [row.id for row in crud.iter_subscriber_rows(db, page_size=2, shard=(1, 3))]
+    cohort = [
+        row.id
+        for row in crud.iter_subscriber_rows(db, page_size=2, preffered_times=["07:00"], time_zone="Asia/Kolkata")
+    ]
+
+    assert shard == [1, 4]
+    assert cohort == [2, 4, 6]
+    assert len(crud.get_send_cohorts(db)) == 2
+
+
+def test_sent_subscriber_ids_for_a_page(db):
+    _add_subscribers(db, 3)
+    crud.log_email_status(db, 1, date(2026, 1, 31), "Digest", "sent")
+    crud.log_email_status(db, 2, date(2026, 1, 31), "Digest", "failed")
+    crud.log_email_status(db, 3, date(2026, 1, 30), "Digest", "sent")
+
+    assert crud.get_sent_subscriber_ids(db, [1, 2, 3], date(2026, 1, 31)) == {1}
+    assert crud.get_sent_subscriber_ids(db, [], date(2026, 1, 31)) == set()